@@ -0,0 +1,186 @@
+"""
+Content-addressed store of the Result-sets (baselines) hashed in a canonical form, so that only the baselines which
+actually changed since the previous run or against the workspace copy are reported and synced
+"""
+
+import gzip
+import hashlib
+import json
+import lzma
+import os
+import re
+import sqlite3
+import stat
+import time
+from shutil import copyfile
+
+from GenUtility import m_CompressionExtensions
+
+# Global Variables
+m_BaselineStore = 'BaselineStore'
+m_BaselineIndex = 'BaselineStore.db'
+m_BaselineChanges = 'BaselineChanges.json'
+# Fields differing between two runs of the same query, ignored while hashing i.e. `GeneratedOn="..."`,
+# `<ExecutionTime>...</ExecutionTime>`
+m_VolatileFields = ['Timestamp', 'Time', 'Date', 'Duration', 'Elapsed', 'Generated']
+m_VolatileAttributeRegex = re.compile(
+    rb'\s[\w:]*(?:' + b'|'.join(field.encode() for field in m_VolatileFields) + rb')[\w:]*="[^"]*"')
+m_VolatileElementRegex = re.compile(
+    rb'<([\w:]*(?:' + b'|'.join(field.encode() for field in m_VolatileFields) + rb')[\w:]*)>[^<]*</\1>')
+# Statuses of a baseline
+m_New = 'New'
+m_Changed = 'Changed'
+m_Unchanged = 'Unchanged'
+
+
+def _openResultSet(inFilePath: str):
+    """Opens the Result-set for reading in binary mode, Decompresses while being read as per its extension"""
+    if inFilePath.endswith(m_CompressionExtensions['gzip']):
+        return gzip.open(inFilePath, 'rb')
+    elif inFilePath.endswith(m_CompressionExtensions['lzma']):
+        return lzma.open(inFilePath, 'rb')
+    return open(inFilePath, 'rb')
+
+
+def hashCanonical(inFilePath: str):
+    """
+    Hashes the Result-set in its canonical form i.e. decompressed, line by line without the indentation, the line
+    endings and the volatile fields, so that the same result compares equal whatever the run or compression \n
+    :param inFilePath: Path of the Result-set
+    :return: Returns the SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    with _openResultSet(inFilePath) as file:
+        for line in file:
+            line = line.strip()
+            if b'="' in line or b'</' in line:
+                line = m_VolatileElementRegex.sub(b'', m_VolatileAttributeRegex.sub(b'', line))
+            if len(line) > 0:
+                digest.update(line)
+                digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def _compressionExtension(inFileName: str):
+    """Returns the compression extension of the file name i.e. `.gz`, Empty if not compressed"""
+    for extension in m_CompressionExtensions.values():
+        if inFileName.endswith(extension):
+            return extension
+    return ''
+
+
+def _placeFile(inSrcFilePath: str, inDestFilePath: str, inLink: bool = False):
+    """Hard-links or copies the file over the destination, even if the destination is read-only i.e. not opened"""
+    if os.path.exists(inDestFilePath):
+        os.chmod(inDestFilePath, stat.S_IWRITE | stat.S_IREAD)
+        os.remove(inDestFilePath)
+    if inLink:
+        try:
+            os.link(inSrcFilePath, inDestFilePath)
+            return
+        except OSError:
+            # Different Volumes or File System without Hard-link support, Falls back to Copy
+            pass
+    copyfile(inSrcFilePath, inDestFilePath)
+
+
+class BaselineStore:
+    """
+    Represents the content-addressed store of the baselines within the Output folder, along with the canonical hash of
+    the baseline of every test in the previous run.
+    """
+
+    def __init__(self, inOutputFolder: str):
+        self.storePath = os.path.join(inOutputFolder, m_BaselineStore)
+        self.indexPath = os.path.join(inOutputFolder, m_BaselineIndex)
+        self.changesPath = os.path.join(inOutputFolder, m_BaselineChanges)
+
+    def _connect(self):
+        connection = sqlite3.connect(self.indexPath, timeout=30)
+        connection.execute('CREATE TABLE IF NOT EXISTS Hashes (Path TEXT PRIMARY KEY, Size INTEGER NOT NULL, '
+                           'MTime REAL NOT NULL, Hash TEXT NOT NULL)')
+        connection.execute('CREATE TABLE IF NOT EXISTS Baselines (TestSuite TEXT NOT NULL, TestSet TEXT NOT NULL, '
+                           'TestID INTEGER NOT NULL, Hash TEXT NOT NULL, Object TEXT NOT NULL, '
+                           'RecordedAt REAL NOT NULL, PRIMARY KEY (TestSuite, TestSet, TestID))')
+        return connection
+
+    def getHash(self, inConnection, inFilePath: str):
+        """Returns the canonical hash of the file, Read again only if its size or modification time changed"""
+        filePath = os.path.abspath(inFilePath)
+        fileStat = os.stat(filePath)
+        cached = inConnection.execute('SELECT Size, MTime, Hash FROM Hashes WHERE Path = ?', (filePath,)).fetchone()
+        if cached is not None and cached[0] == fileStat.st_size and cached[1] == fileStat.st_mtime:
+            return cached[2]
+        fileHash = hashCanonical(filePath)
+        inConnection.execute('INSERT OR REPLACE INTO Hashes VALUES (?, ?, ?, ?)',
+                             (filePath, fileStat.st_size, fileStat.st_mtime, fileHash))
+        return fileHash
+
+    def store(self, inFilePath: str, inHash: str):
+        """
+        Keeps the Result-set in the store under its canonical hash, Copied only if no such object exists yet. Not
+        Hard-linked, as Touchstone might overwrite the Result-set in place on the next run \n
+        :return: Returns the path of the object within the store
+        """
+        objectPath = os.path.join(self.storePath, inHash[:2], inHash + _compressionExtension(inFilePath))
+        if not os.path.exists(objectPath):
+            os.makedirs(os.path.dirname(objectPath), exist_ok=True)
+            _placeFile(inFilePath, objectPath)
+        return objectPath
+
+    def sync(self, inTestSuite: str, inResultSets: list, inWorkspaceResultSetsPath: str = None):
+        """
+        Compares the Result-sets of a run with the baselines of the previous run & of the workspace, stores them and
+        copies only the changed ones to the workspace \n
+        :param inTestSuite: Name of the Testsuite
+        :param inResultSets: List of (Test-set, Test ID, Path of the Result-set) of the run
+        :param inWorkspaceResultSetsPath: `ResultSets` folder of the Testsuite within the workspace, None to compare
+        with the previous run only
+        :return: Returns the status and list of Result-set file names Mapping i.e. `m_Changed` against the previous
+        run and `Synced` to the workspace
+        """
+        changes = {m_New: list(), m_Changed: list(), m_Unchanged: list(), 'Synced': list()}
+        if inWorkspaceResultSetsPath is not None:
+            os.makedirs(inWorkspaceResultSetsPath, exist_ok=True)
+        with self._connect() as connection:
+            previousHashes = {(testSet, testID): fileHash for testSet, testID, fileHash in connection.execute(
+                'SELECT TestSet, TestID, Hash FROM Baselines WHERE TestSuite = ?', (inTestSuite,))}
+            recordedAt = time.time()
+            for testSet, testID, filePath in inResultSets:
+                fileName = os.path.basename(filePath)
+                fileHash = self.getHash(connection, filePath)
+                previousHash = previousHashes.get((testSet, testID))
+                status = m_New if previousHash is None else m_Unchanged if previousHash == fileHash else m_Changed
+                changes[status].append(fileName)
+                objectPath = self.store(filePath, fileHash)
+                connection.execute('INSERT OR REPLACE INTO Baselines VALUES (?, ?, ?, ?, ?, ?)',
+                                   (inTestSuite, testSet, testID, fileHash, objectPath, recordedAt))
+                if inWorkspaceResultSetsPath is not None:
+                    # Workspace copy in any compression, The same result is left as it is whatever the compression
+                    baseName = fileName[:len(fileName) - len(_compressionExtension(fileName))]
+                    workspacePaths = [os.path.join(inWorkspaceResultSetsPath, baseName + extension) for extension in
+                                      [''] + list(m_CompressionExtensions.values())]
+                    workspacePaths = [path for path in workspacePaths if os.path.exists(path)]
+                    if len(workspacePaths) == 1 and self.getHash(connection, workspacePaths[0]) == fileHash:
+                        continue
+                    for workspacePath in workspacePaths:
+                        os.chmod(workspacePath, stat.S_IWRITE | stat.S_IREAD)
+                        os.remove(workspacePath)
+                    # Copied rather than linked, the workspace files must not share the objects of the store
+                    _placeFile(objectPath, os.path.join(inWorkspaceResultSetsPath, fileName))
+                    changes['Synced'].append(fileName)
+        return changes
+
+    def report(self, inChanges: dict):
+        """
+        Prints and writes the changes of the baselines of a run \n
+        :param inChanges: Testsuite and the changes as per `sync` Mapping
+        """
+        for testSuite, changes in inChanges.items():
+            print(f"Baselines of {testSuite}: {len(changes[m_Changed])} changed, {len(changes[m_New])} new, "
+                  f"{len(changes[m_Unchanged])} unchanged since the previous run" +
+                  (f", {len(changes['Synced'])} copied to the workspace" if len(changes['Synced']) > 0 else ''))
+        with open(self.changesPath, 'w') as file:
+            json.dump({testSuite: {m_Changed: changes[m_Changed], m_New: changes[m_New],
+                                   m_Unchanged: len(changes[m_Unchanged]), 'Synced': changes['Synced']}
+                       for testSuite, changes in inChanges.items()}, file, indent=2)
@@ -0,0 +1,144 @@
+import json
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import Generator
+from Generator import TestSetGenerator, ResultSetGenerator
+
+# Global Variables
+m_InputFileExtension = '.json'
+m_DefaultInputFileName = 'input.json'
+m_BatchSummary = 'BatchSummary.json'
+
+
+def _runDriver(inInputFile: str, inDriverName: str, inGenerateResultSets: bool):
+    """
+    Runs the Generator for a single Driver within its own `Output/<Driver>` tree. \n
+    Runs within a worker process of the Batch, hence Perforce Revisions and parsed MDEFs already loaded by the process
+    for an earlier Driver are reused. \n
+    :param inInputFile: Location of the Input File of the Driver
+    :param inDriverName: Name of the Driver
+    :param inGenerateResultSets: A Flag to generate Result-sets as well
+    :return: Returns the Summary of the Driver run
+    """
+    # Restored whatever the run does, as the worker process runs the next Driver right after
+    outputFolder = Generator.m_OutputFolder
+    startTime = time.perf_counter()
+    succeeded, error = False, None
+    try:
+        Generator.m_OutputFolder = os.path.join(outputFolder, inDriverName)
+        if inGenerateResultSets:
+            succeeded = ResultSetGenerator(inInputFile).run()
+        else:
+            succeeded = TestSetGenerator(inInputFile).run()
+    except Exception as e:
+        succeeded = False
+        error = f"{type(e).__name__}: {e}"
+        traceback.print_exc()
+    finally:
+        Generator.m_OutputFolder = outputFolder
+    return {
+        'Driver': inDriverName,
+        'InputFile': inInputFile,
+        'Succeeded': bool(succeeded),
+        'Seconds': round(time.perf_counter() - startTime, 3),
+        'Error': error
+    }
+
+
+class BatchRunner:
+    """
+    Represents the Batch Runner which generates Test-sets or Result-sets of many Drivers in one process.
+    """
+
+    def __init__(self, inInputLocations: list, inWorkers: int = None):
+        self.inputFiles = BatchRunner.findInputFiles(inInputLocations)
+        self.workers = inWorkers if inWorkers is not None and inWorkers > 0 else min(len(self.inputFiles),
+                                                                                      os.cpu_count() or 1)
+
+    @staticmethod
+    def findInputFiles(inInputLocations: list):
+        """
+        Finds Input Files of the Drivers from the given list of Input Files and Directories \n
+        :param inInputLocations: List of Input Files or Directories containing the Input Files
+        :return: Returns Driver Name and Input File Location Mapping
+        """
+        inputFiles = list()
+        for inputLocation in inInputLocations:
+            if os.path.isdir(inputLocation):
+                for fileName in sorted(os.listdir(inputLocation)):
+                    filePath = os.path.join(inputLocation, fileName)
+                    if os.path.isfile(filePath) and fileName.lower().endswith(m_InputFileExtension):
+                        inputFiles.append(os.path.abspath(filePath))
+                    elif os.path.isfile(os.path.join(filePath, m_DefaultInputFileName)):
+                        inputFiles.append(os.path.abspath(os.path.join(filePath, m_DefaultInputFileName)))
+            elif os.path.isfile(inputLocation):
+                inputFiles.append(os.path.abspath(inputLocation))
+            else:
+                raise FileNotFoundError(f"{inputLocation} is an invalid location")
+
+        drivers = dict()
+        for inputFile in dict.fromkeys(inputFiles):
+            # `<Driver>/input.json` is named after its Directory whereas `<Driver>.json` after the File itself
+            if os.path.basename(inputFile).lower() == m_DefaultInputFileName:
+                driverName = os.path.basename(os.path.dirname(inputFile))
+            else:
+                driverName = os.path.splitext(os.path.basename(inputFile))[0]
+            uniqueDriverName, index = driverName, 1
+            while uniqueDriverName in drivers:
+                index += 1
+                uniqueDriverName = f"{driverName}_{index}"
+            drivers[uniqueDriverName] = inputFile
+        return drivers
+
+    def run(self, inGenerateResultSets: bool = False):
+        """
+        Schedules every Driver over a shared pool of worker processes and prints the aggregated Summary \n
+        :param inGenerateResultSets: A Flag to generate Result-sets as well
+        :return: Returns True if all the Drivers succeeded else False
+        """
+        if len(self.inputFiles) == 0:
+            print('Error: No Input Files found for the Batch')
+            return False
+
+        startTime = time.perf_counter()
+        summaries = list()
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = [pool.submit(_runDriver, inputFile, driverName, inGenerateResultSets)
+                       for driverName, inputFile in self.inputFiles.items()]
+            for future in as_completed(futures):
+                summary = future.result()
+                print(f"{summary['Driver']}: {'Succeeded' if summary['Succeeded'] else 'Failed'} "
+                      f"in {summary['Seconds']}s")
+                summaries.append(summary)
+
+        summaries.sort(key=lambda inSummary: inSummary['Driver'])
+        return self.writeSummary(summaries, round(time.perf_counter() - startTime, 3))
+
+    def writeSummary(self, inSummaries: list, inTotalSeconds: float):
+        """
+        Prints the aggregated Summary of the Batch and writes the same in `Output` \n
+        :param inSummaries: List of per Driver Summaries
+        :param inTotalSeconds: Wall time of the whole Batch
+        :return: Returns True if all the Drivers succeeded else False
+        """
+        nameWidth = max([len('Driver')] + [len(summary['Driver']) for summary in inSummaries])
+        print(f"\n{'Driver'.ljust(nameWidth)}  Status     Seconds")
+        for summary in inSummaries:
+            print(f"{summary['Driver'].ljust(nameWidth)}  "
+                  f"{('Succeeded' if summary['Succeeded'] else 'Failed').ljust(9)}  {summary['Seconds']:>7}")
+        failedDrivers = [summary['Driver'] for summary in inSummaries if not summary['Succeeded']]
+        print(f"Total: {len(inSummaries)} Drivers, {len(failedDrivers)} Failed, {inTotalSeconds}s with "
+              f"{self.workers} Workers")
+
+        os.makedirs(Generator.m_OutputFolder, exist_ok=True)
+        with open(os.path.join(Generator.m_OutputFolder, m_BatchSummary), 'w') as file:
+            json.dump({
+                'Workers': self.workers,
+                'Seconds': inTotalSeconds,
+                'Failed': failedDrivers,
+                'Drivers': inSummaries
+            }, file, indent=4)
+        return len(failedDrivers) == 0
@@ -0,0 +1,134 @@
+"""
+Streaming Sampler of the Result-set rows keeping a uniform Reservoir of rows and a Sketch per column at a fixed memory
+cost whatever the size of the Table
+"""
+
+import hashlib
+import heapq
+import random
+
+# Global Variables
+m_SampleSize = 30
+m_DistinctSketchSize = 256
+m_HashRange = 2 ** 64
+m_HashCacheSize = 4096
+
+
+class ColumnSketch:
+    """
+    Represents the Sketch of a column i.e. the count of values & nulls, the minimum & maximum value and the estimated
+    count of distinct values (K Minimum Values).
+    """
+
+    def __init__(self, inSketchSize: int = m_DistinctSketchSize):
+        self.count = 0
+        self.nullCount = 0
+        self.minValue = None
+        self.maxValue = None
+        self.sketchSize = inSketchSize
+        # Max-heap of the smallest hashes seen, kept negated
+        self.smallestHashes = list()
+        self.smallestHashSet = set()
+        # Hashes of the recent values, Columns mostly repeat a few values
+        self.hashCache = dict()
+
+    def __getstate__(self):
+        # Cached hashes are only a speed-up while adding the values, not worth persisting
+        state = dict(self.__dict__)
+        state['hashCache'] = dict()
+        return state
+
+    def addNull(self):
+        self.count += 1
+        self.nullCount += 1
+
+    def add(self, inValue):
+        self.count += 1
+        try:
+            if self.minValue is None or inValue < self.minValue:
+                self.minValue = inValue
+            if self.maxValue is None or inValue > self.maxValue:
+                self.maxValue = inValue
+        except TypeError:
+            # Values of a column not comparable with each other i.e. mixed types
+            pass
+        valueHash = self.hashCache.get(inValue)
+        if valueHash is None:
+            if len(self.hashCache) >= m_HashCacheSize:
+                self.hashCache.clear()
+            valueHash = int.from_bytes(hashlib.blake2b(repr(inValue).encode('utf-8'), digest_size=8).digest(), 'big')
+            self.hashCache[inValue] = valueHash
+        if valueHash in self.smallestHashSet:
+            return
+        if len(self.smallestHashes) < self.sketchSize:
+            heapq.heappush(self.smallestHashes, -valueHash)
+            self.smallestHashSet.add(valueHash)
+        elif valueHash < -self.smallestHashes[0]:
+            self.smallestHashSet.discard(-heapq.heapreplace(self.smallestHashes, -valueHash))
+            self.smallestHashSet.add(valueHash)
+
+    def getDistinctCount(self):
+        """Returns the count of distinct values, Exact up to the size of the Sketch and estimated beyond it"""
+        if len(self.smallestHashes) < self.sketchSize:
+            return len(self.smallestHashes)
+        return int((self.sketchSize - 1) * m_HashRange / (-self.smallestHashes[0] + 1))
+
+    def toDict(self):
+        return {'Count': self.count, 'NullCount': self.nullCount, 'DistinctCount': self.getDistinctCount(),
+                'Min': self.minValue, 'Max': self.maxValue}
+
+
+class ResultSetSampler:
+    """
+    Represents the Sampler which reads every row of a Result-set once and keeps a uniform Reservoir of the rows along
+    with the Sketch of each column.
+    """
+
+    def __init__(self, inColumns: list, inConvert, inSampleSize: int = m_SampleSize, inSeed=None):
+        """
+        :param inColumns: List of (Name, Type) of the columns
+        :param inConvert: Callable converting a value as string to the given column Type
+        :param inSampleSize: Count of rows to keep in the Reservoir
+        :param inSeed: Seed of the Reservoir, None for a random one
+        """
+        self.columns = inColumns
+        self.convert = inConvert
+        self.sampleSize = inSampleSize
+        self.random = random.Random(inSeed)
+        self.rowCount = 0
+        self.reservoir = list()
+        self.sketches = [ColumnSketch() for _ in inColumns]
+
+    def addRow(self, inRow: list):
+        """
+        Adds a row to the Sketches and to the Reservoir with the probability of Sample size / rows seen \n
+        :param inRow: List of (IsNull, Value) of each column
+        """
+        values = list()
+        for (isNull, columnValue), (columnName, columnType), sketch in zip(inRow, self.columns, self.sketches):
+            columnValue = columnValue.strip() if not isNull and columnValue is not None else ''
+            if columnValue != 'none' and len(columnValue) > 0:
+                value = self.convert(columnValue, columnType)
+                sketch.add(value)
+                values.append(value)
+            else:
+                sketch.addNull()
+                values.append(None)
+        self.rowCount += 1
+        if len(self.reservoir) < self.sampleSize:
+            self.reservoir.append(values)
+        else:
+            index = self.random.randrange(self.rowCount)
+            if index < self.sampleSize:
+                self.reservoir[index] = values
+
+    def getColumnValues(self):
+        """Returns Column Name and list of distinct non-null values within the Reservoir Mapping"""
+        columnValues = dict()
+        for index, (columnName, columnType) in enumerate(self.columns):
+            columnValues[columnName] = list({row[index] for row in self.reservoir if row[index] is not None})
+        return columnValues
+
+    def getColumnSketches(self):
+        """Returns Column Name and its Sketch Mapping"""
+        return {columnName: sketch for (columnName, columnType), sketch in zip(self.columns, self.sketches)}
@@ -0,0 +1,182 @@
+"""
+Cost Model estimating the run time of the generated queries, choosing the columns whose filters the driver can pass
+down and planning the queries within a time budget
+"""
+
+import re
+
+# Global Variables
+m_DefaultQuerySeconds = 0.5
+m_DefaultRowSeconds = 0.001
+m_DefaultRowCount = 1000
+m_PassdownSelectivity = 0.01
+m_NarrowProjectionFactor = 0.5
+m_FromRegex = re.compile(r'\bFROM\s+([\w.\[\]"]+)', re.IGNORECASE)
+m_WhereRegex = re.compile(r'\bWHERE\s+(.*?)(?:\bGROUP\s+BY\b|\bORDER\s+BY\b|$)', re.IGNORECASE | re.DOTALL)
+m_PredicateColumnRegex = re.compile(r'(\w+)\s*(?:=|\bIN\b|\bLIKE\b|\bBETWEEN\b|<|>)', re.IGNORECASE)
+m_ProjectionRegex = re.compile(r'^\s*SELECT\s+(?:TOP\s+\d+\s+)?(.*?)\s+FROM\b', re.IGNORECASE | re.DOTALL)
+m_OrRegex = re.compile(r'\bOR\b', re.IGNORECASE)
+# Expected execution classes of the queries
+m_PushedDown = 'PushedDown'
+m_ClientSide = 'ClientSide'
+m_FullScan = 'FullScan'
+
+
+class CostModel:
+    """
+    Represents the Cost Model of the queries built from the Table row counts seen in `RowDescriptions RowCount` and
+    the recorded query timings.
+    """
+
+    def __init__(self, inTableRowCounts: dict, inPassdownableColumns: dict, inObservations: list = None,
+                 inTimeBudget: float = None, inColumnSketches: dict = None):
+        """
+        :param inTableRowCounts: Table Name and Row Count Mapping
+        :param inPassdownableColumns: Table Name and list of Passdownable Columns Mapping i.e. `MDEF.TableNames`
+        :param inObservations: List of (Row Count, Seconds) of the recorded full scans
+        :param inTimeBudget: Estimated run time in seconds to stop planning the queries after, None for no budget
+        :param inColumnSketches: Table Name and Column Name & `ColumnSketch` Mapping i.e. the distinct counts
+        """
+        self.tableRowCounts = inTableRowCounts if inTableRowCounts is not None else dict()
+        self.passdownableColumns = inPassdownableColumns if inPassdownableColumns is not None else dict()
+        self.timeBudget = inTimeBudget
+        self.columnSketches = inColumnSketches if inColumnSketches is not None else dict()
+        self.plannedSeconds = 0.0
+        self.plannedTestSets = dict()
+        self.executionClasses = dict()
+        self.querySeconds, self.rowSeconds = CostModel.fit(inObservations)
+
+    @staticmethod
+    def fit(inObservations: list):
+        """
+        Fits the per query overhead and the per row time from the recorded full scans \n
+        :param inObservations: List of (Row Count, Seconds)
+        :return: Returns the per query and the per row seconds
+        """
+        observations = [(rowCount, seconds) for rowCount, seconds in inObservations or [] if rowCount is not None]
+        if len(observations) == 0:
+            return m_DefaultQuerySeconds, m_DefaultRowSeconds
+        querySeconds = min(seconds for rowCount, seconds in observations)
+        totalRows = sum(rowCount for rowCount, seconds in observations)
+        if totalRows == 0:
+            return querySeconds, m_DefaultRowSeconds
+        rowSeconds = sum(max(seconds - querySeconds, 0.0) for rowCount, seconds in observations) / totalRows
+        return querySeconds, rowSeconds if rowSeconds > 0 else m_DefaultRowSeconds
+
+    def hasBudget(self):
+        return self.timeBudget is not None
+
+    def isPassdownable(self, inTableName: str, inColumnName: str):
+        passdownableColumns = self.passdownableColumns.get(inTableName)
+        return passdownableColumns is not None and inColumnName in passdownableColumns
+
+    def getSelectivity(self, inTableName: str, inColumnName: str):
+        """Returns the fraction of the Table a filter on the given column fetches, 1 / distinct count if sketched"""
+        sketch = self.columnSketches.get(inTableName, dict()).get(inColumnName)
+        if sketch is None or sketch.getDistinctCount() == 0:
+            return m_PassdownSelectivity
+        return 1.0 / sketch.getDistinctCount()
+
+    def getColumnCost(self, inTableName: str, inColumnName: str):
+        """
+        Scores a candidate column of a filter by the rows the driver fetches for it i.e. a fraction of the Table if the
+        column is Passdownable, else the entire Table it pages to filter on the client side \n
+        :param inTableName: Name of the Table
+        :param inColumnName: Name of the column
+        :return: Returns the estimated count of the rows fetched
+        """
+        rowCount = self.tableRowCounts.get(inTableName, m_DefaultRowCount)
+        if self.isPassdownable(inTableName, inColumnName):
+            return max(rowCount * self.getSelectivity(inTableName, inColumnName), 1)
+        return rowCount
+
+    def rankColumns(self, inTableName: str, inColumnNames):
+        """Returns the given columns ordered by their cost as a filter, the ones passed down first"""
+        return sorted(inColumnNames, key=lambda inColumnName: self.getColumnCost(inTableName, inColumnName))
+
+    def _getPushedDownColumns(self, inTableName: str, inWhereClause: str):
+        """
+        Finds the predicates of the filter the driver passes down i.e. every Passdownable predicate of an `AND` and
+        either all or none of an `OR` \n
+        :return: Returns the list of the columns of the predicates passed down, None if the filter is client side
+        """
+        predicateColumns = m_PredicateColumnRegex.findall(inWhereClause)
+        pushedDownColumns = [column for column in predicateColumns if self.isPassdownable(inTableName, column)]
+        if len(pushedDownColumns) == 0:
+            return None
+        if m_OrRegex.search(inWhereClause) is not None and len(pushedDownColumns) < len(predicateColumns):
+            # `OR` of any non Passdownable predicate still requires the full scan
+            return None
+        return pushedDownColumns
+
+    def getExecutionClass(self, inQuery: str):
+        """
+        Finds the expected execution class of the given query \n
+        :param inQuery: SQL Query
+        :return: Returns `PushedDown` if its filter is passed down, `ClientSide` if it is evaluated on the client side
+        after paging the entire Table, `FullScan` if the query has no filter and None for Stored Procedures
+        """
+        tableMatch = m_FromRegex.search(inQuery)
+        if tableMatch is None:
+            return None
+        whereMatch = m_WhereRegex.search(inQuery)
+        if whereMatch is None:
+            return m_FullScan
+        return m_PushedDown if self._getPushedDownColumns(tableMatch.group(1), whereMatch.group(1)) is not None \
+            else m_ClientSide
+
+    def estimate(self, inQuery: str):
+        """
+        Estimates the run time of the given query. \n
+        A filter on Passdownable columns fetches a fraction of the Table whereas anything else makes the driver page the
+        entire remote Table \n
+        :param inQuery: SQL Query
+        :return: Returns the estimated run time in seconds
+        """
+        tableMatch = m_FromRegex.search(inQuery)
+        if tableMatch is None:
+            # Stored Procedures & other calls
+            return self.querySeconds
+        tableName = tableMatch.group(1)
+        rowCount = self.tableRowCounts.get(tableName, m_DefaultRowCount)
+
+        whereMatch = m_WhereRegex.search(inQuery)
+        if whereMatch is not None:
+            pushedDownColumns = self._getPushedDownColumns(tableName, whereMatch.group(1))
+            if pushedDownColumns is not None:
+                selectivity = min(self.getSelectivity(tableName, column) for column in pushedDownColumns)
+                rowCount = max(rowCount * selectivity, 1)
+
+        projectionMatch = m_ProjectionRegex.search(inQuery)
+        widthFactor = 1.0 if projectionMatch is None or projectionMatch.group(1).strip() == '*' \
+            else m_NarrowProjectionFactor
+        return self.querySeconds + rowCount * self.rowSeconds * widthFactor
+
+    def plan(self, inTestSet: str, inQueries: list):
+        """
+        Plans the queries of a Test-set within the remaining budget, the cheapest ones first \n
+        :param inTestSet: Name of the Test-set
+        :param inQueries: List of queries
+        :return: Returns the planned queries in their original order
+        """
+        estimates = [self.estimate(query) for query in inQueries]
+        plannedIndexes = set()
+        plannedSeconds = 0.0
+        for index in sorted(range(len(inQueries)), key=lambda inIndex: estimates[inIndex]):
+            if self.timeBudget is not None and self.plannedSeconds + estimates[index] > self.timeBudget:
+                break
+            self.plannedSeconds += estimates[index]
+            plannedSeconds += estimates[index]
+            plannedIndexes.add(index)
+        self.plannedTestSets[inTestSet] = plannedSeconds
+        executionClasses = dict()
+        for index in plannedIndexes:
+            executionClass = self.getExecutionClass(inQueries[index])
+            if executionClass is not None:
+                executionClasses[executionClass] = executionClasses.get(executionClass, 0) + 1
+        self.executionClasses[inTestSet] = executionClasses
+        skipped = len(inQueries) - len(plannedIndexes)
+        print(f"Planned {inTestSet}: {len(plannedIndexes)} tests, {plannedSeconds:.1f}s estimated"
+              + ''.join(f", {count} {executionClass}" for executionClass, count in sorted(executionClasses.items()))
+              + (f", {skipped} tests skipped as the time budget reached" if skipped > 0 else ''))
+        return [query for index, query in enumerate(inQueries) if index in plannedIndexes]
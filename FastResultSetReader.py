@@ -0,0 +1,263 @@
+"""
+Memory-mapped byte-level reader of the Touchstone Result-sets, the fast path of reading the Column descriptors and the
+sampled rows without building objects for every element of the file
+"""
+
+import mmap
+import os
+import re
+import sys
+import time
+from GenUtility import assure
+
+# Global Variables
+m_UnsupportedTokens = [b'<!--', b'<![CDATA[', b'<!DOCTYPE', b'<!ENTITY', b'xmlns', b'\r']
+m_DeclarationRegex = re.compile(rb'^\s*<\?xml\s[^>]*?\?>')
+m_EncodingRegex = re.compile(rb'encoding\s*=\s*["\']([\w.-]+)["\']')
+m_RowRegex = re.compile(rb'\s*<([A-Za-z_][\w.-]*)>(.*?)</\1>', re.DOTALL)
+m_ElementRegex = re.compile(rb'<([A-Za-z_][\w.-]*)((?:\s+[^<>]*?)?)\s*(/?)>')
+m_ColumnRegex = re.compile(rb'<Column(?:\s[^<>]*)?>')
+m_RowDescriptionsRegex = re.compile(rb'<RowDescriptions((?:\s+[^<>]*?)?)\s*(/?)>')
+m_AttributeRegex = re.compile(rb'([A-Za-z_][\w.:-]*)\s*=\s*(?:"([^"<]*)"|\'([^\'<]*)\')')
+m_CellRegex = re.compile(rb'<([A-Za-z_][\w.-]*)(\s+IsNull="([^"<&\t\n]*)")?\s*(?:/>|>([^<]*)</\1>)')
+m_CellsRegex = re.compile(rb'(?:\s*<([A-Za-z_][\w.-]*)(?:\s+IsNull="[^"<&\t\n]*")?\s*(?:/>|>[^<]*</\1>))*\s*')
+m_EntityRegex = re.compile(r'&(#x[0-9A-Fa-f]+|#[0-9]+|[A-Za-z]+);')
+m_OtherEntityRegex = re.compile(r'&(?!(?:lt|gt|amp|quot|apos);)')
+m_Entities = {'lt': '<', 'gt': '>', 'amp': '&', 'quot': '"', 'apos': "'"}
+
+
+class FallbackToParser(Exception):
+    """Raised whenever the Result-set contains anything the fast path does not handle exactly like the XML Parser"""
+
+
+def _decode(inData: bytes):
+    """Decodes the UTF-8 text and resolves the predefined & character entities like the XML Parser does"""
+    try:
+        text = inData.decode('utf-8')
+    except UnicodeDecodeError:
+        raise FallbackToParser()
+    if '&' not in text:
+        return text
+    if m_OtherEntityRegex.search(text) is None:
+        # Only the predefined entities, `&amp;` is resolved last not to resolve what it escapes
+        return text.replace('&lt;', '<').replace('&gt;', '>').replace('&quot;', '"').replace('&apos;', "'") \
+            .replace('&amp;', '&')
+    if text.count('&') != len(m_EntityRegex.findall(text)):
+        # A bare `&` is not well-formed XML
+        raise FallbackToParser()
+
+    def resolveEntity(inMatch):
+        entity = inMatch.group(1)
+        if entity.startswith('#x'):
+            return chr(int(entity[2:], 16))
+        elif entity.startswith('#'):
+            return chr(int(entity[1:]))
+        elif entity in m_Entities:
+            return m_Entities[entity]
+        raise FallbackToParser()
+
+    return m_EntityRegex.sub(resolveEntity, text)
+
+
+def _parseAttributes(inData: bytes):
+    """Parses the attributes of a start tag, Falls back on anything the XML Parser would normalize"""
+    attributes = dict()
+    position = 0
+    for match in m_AttributeRegex.finditer(inData):
+        if inData[position:match.start()].strip():
+            raise FallbackToParser()
+        value = match.group(2) if match.group(2) is not None else match.group(3)
+        if b'\t' in value or b'\n' in value:
+            raise FallbackToParser()
+        attributes[_decode(match.group(1))] = _decode(value)
+        position = match.end()
+    if inData[position:].strip():
+        raise FallbackToParser()
+    return attributes
+
+
+def _parseChildren(inData, inStart: int, inEnd: int):
+    """
+    Parses the leaf child elements within the given range \n
+    :return: Returns list of (Tag, Attributes, Text) of the children, Text is None for an empty element
+    """
+    children = list()
+    position = inStart
+    while True:
+        match = m_ElementRegex.search(inData, position, inEnd)
+        if match is None:
+            if inData[position:inEnd].strip():
+                raise FallbackToParser()
+            return children
+        if inData[position:match.start()].strip():
+            # Mixed content
+            raise FallbackToParser()
+        tag = match.group(1)
+        attributes = _parseAttributes(match.group(2))
+        if match.group(3) == b'/':
+            children.append((tag, attributes, None))
+            position = match.end()
+            continue
+        closeTag = b'</' + tag + b'>'
+        closeIndex = inData.find(closeTag, match.end(), inEnd)
+        if closeIndex < 0:
+            raise FallbackToParser()
+        text = inData[match.end():closeIndex]
+        if b'<' in text:
+            # Nested elements
+            raise FallbackToParser()
+        children.append((tag, attributes, _decode(text) if len(text) > 0 else None))
+        position = closeIndex + len(closeTag)
+
+
+def _parseCells(inData, inStart: int, inEnd: int):
+    """
+    Parses the cells of a row for the common shape i.e. `<Value IsNull="...">Text</Value>` within the regex engine,
+    Falls back to the general parsing of the children for any other shape \n
+    :return: Returns list of (IsNull, Value) of the cells
+    """
+    if m_CellsRegex.fullmatch(inData, inStart, inEnd) is None:
+        return [(assure(attributes, 'IsNull', ignoreError=True), text) for tag, attributes, text in
+                _parseChildren(inData, inStart, inEnd)]
+    return [(isNull.decode('utf-8') if isNullAttribute else False,
+             (_decode(text) if b'&' in text else text.decode('utf-8')) if text else None)
+            for tag, isNullAttribute, isNull, text in m_CellRegex.findall(inData, inStart, inEnd)]
+
+
+def _findElementEnd(inData, inTag: bytes, inStart: int, inEnd: int):
+    """Finds the end of the element whose start tag ends at `inStart`, Falls back on nested same-name elements"""
+    closeTag = b'</' + inTag + b'>'
+    closeIndex = inData.find(closeTag, inStart, inEnd)
+    if closeIndex < 0 or inData.find(b'<' + inTag, inStart, closeIndex) >= 0:
+        raise FallbackToParser()
+    return closeIndex, closeIndex + len(closeTag)
+
+
+def readResultSet(inFilePath: str, inMaxRows: int, inOnRow=None, inOnColumns=None):
+    """
+    Reads the Column Descriptors & the first rows of the given uncompressed Result-set by scanning its bytes \n
+    :param inFilePath: Path of the Result-set
+    :param inMaxRows: Maximum number of rows to read
+    :param inOnRow: If provided, Called with every row of the Result-set
+    :param inOnColumns: If provided, Called with the List of (Name, Type) of Columns before the first row
+    :return: Returns RowDescriptions Count, RowCount, List of (Name, Type) of Columns, List of Rows having
+    (IsNull, Value) of each Column and the number of bytes read, None if the XML Parser must be used instead
+    """
+    if os.path.getsize(inFilePath) == 0:
+        return None
+    with open(inFilePath, 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            try:
+                return _readMappedResultSet(data, inMaxRows, inOnRow, inOnColumns)
+            except (FallbackToParser, ValueError, IndexError, UnicodeDecodeError):
+                return None
+
+
+def _readMappedResultSet(inData, inMaxRows: int, inOnRow=None, inOnColumns=None):
+    if inData[:2] in [b'\xff\xfe', b'\xfe\xff']:
+        raise FallbackToParser()
+    for token in m_UnsupportedTokens:
+        if inData.find(token) >= 0:
+            raise FallbackToParser()
+    declaration = m_DeclarationRegex.match(inData[:256].lstrip(b'\xef\xbb\xbf'))
+    if declaration is not None:
+        encoding = m_EncodingRegex.search(declaration.group(0))
+        if encoding is not None and encoding.group(1).lower() not in [b'utf-8', b'utf8']:
+            raise FallbackToParser()
+
+    rowDescriptions = m_RowDescriptionsRegex.search(inData)
+    if rowDescriptions is None:
+        raise FallbackToParser()
+    if m_RowDescriptionsRegex.search(inData, rowDescriptions.end()) is not None:
+        # The XML Parser reports the count of RowDescriptions
+        raise FallbackToParser()
+    readRows = inMaxRows > 0 or inOnRow is not None
+    if readRows and m_ColumnRegex.search(inData, rowDescriptions.end()) is not None:
+        raise FallbackToParser()
+    rowCount = int(_parseAttributes(rowDescriptions.group(1)).get('RowCount'))
+
+    columns = list()
+    position = 0
+    while True:
+        column = m_ColumnRegex.search(inData, position, rowDescriptions.start())
+        if column is None:
+            break
+        closeIndex, position = _findElementEnd(inData, b'Column', column.end(), rowDescriptions.start())
+        children = _parseChildren(inData, column.end(), closeIndex)
+        if len(children) < 2 or children[0][2] is None or children[1][1].get('Type') is None:
+            raise FallbackToParser()
+        columns.append((children[0][2].strip(), children[1][1]['Type'].strip()))
+    if inOnColumns is not None:
+        inOnColumns(columns)
+
+    rows = list()
+    bytesRead = rowDescriptions.end()
+    if readRows and rowDescriptions.group(2) != b'/':
+        rowsEnd, bytesRead = _findElementEnd(inData, b'RowDescriptions', rowDescriptions.end(), len(inData))
+        position = rowDescriptions.end()
+        while len(rows) < inMaxRows or inOnRow is not None:
+            row = m_RowRegex.match(inData, position, rowsEnd)
+            if row is not None and inData.find(b'<' + row.group(1), row.start(2), row.end(2)) < 0:
+                # Common shape of a row i.e. `<Row>cells</Row>`
+                cells = _parseCells(inData, row.start(2), row.end(2))
+                position = row.end()
+                if len(rows) < inMaxRows:
+                    rows.append(cells)
+                if inOnRow is not None:
+                    inOnRow(cells)
+                continue
+            row = m_ElementRegex.search(inData, position, rowsEnd)
+            if row is None:
+                break
+            if inData[position:row.start()].strip():
+                raise FallbackToParser()
+            _parseAttributes(row.group(2))
+            if row.group(3) == b'/':
+                cells = list()
+                position = row.end()
+            else:
+                cellsEnd, position = _findElementEnd(inData, row.group(1), row.end(), rowsEnd)
+                cells = _parseCells(inData, row.end(), cellsEnd)
+            if len(rows) < inMaxRows:
+                rows.append(cells)
+            if inOnRow is not None:
+                inOnRow(cells)
+    return 1, rowCount, columns, rows, bytesRead
+
+
+if __name__ == '__main__':
+    # Verifies the fast path against the XML Parser on a corpus of Result-sets and benchmarks both
+    # i.e python FastResultSetReader.py <Result-sets directory or files>...
+    from Generator import ResultSetGenerator
+
+    resultSetFiles = list()
+    for location in sys.argv[1:]:
+        if os.path.isdir(location):
+            resultSetFiles.extend(os.path.join(location, fileName) for fileName in sorted(os.listdir(location))
+                                  if fileName.endswith('.xml'))
+        else:
+            resultSetFiles.append(location)
+
+    mismatches, fallbacks, parserSeconds, fastSeconds = 0, 0, 0.0, 0.0
+    for resultSetFile in resultSetFiles:
+        for maxRows in [30, 0]:
+            startTime = time.perf_counter()
+            expected = ResultSetGenerator._readResultSet(resultSetFile, maxRows, inFastPath=False)
+            parserSeconds += time.perf_counter() - startTime
+            startTime = time.perf_counter()
+            actual = readResultSet(resultSetFile, maxRows)
+            fastSeconds += time.perf_counter() - startTime
+            if actual is None:
+                fallbacks += 1
+            elif actual[:4] != expected[:4]:
+                mismatches += 1
+                print(f"Mismatch: {resultSetFile} with {maxRows} rows")
+        # Every row as streamed to the Sampler
+        expectedRows, actualRows = list(), list()
+        ResultSetGenerator._readResultSet(resultSetFile, 0, inFastPath=False, inOnRow=expectedRows.append)
+        if readResultSet(resultSetFile, 0, actualRows.append) is not None and actualRows != expectedRows:
+            mismatches += 1
+            print(f"Mismatch: {resultSetFile} streaming every row")
+    print(f"{len(resultSetFiles)} Result-sets: {mismatches} Mismatches, {fallbacks} Fallbacks, "
+          f"XML Parser {parserSeconds:.3f}s, Fast path {fastSeconds:.3f}s")
+    sys.exit(1 if mismatches > 0 else 0)
@@ -2,12 +2,18 @@
 General Utility Functions
 """
 
+import gzip
+import lzma
 import os
 import subprocess
-from shutil import copy
+import time
+from shutil import copy, copyfileobj
 
 
 m_DeleteFolder = '.ignore'
+m_CompressionExtensions = {'gzip': '.gz', 'lzma': '.xz'}
+# Seconds a resolved latest revision is reused before Perforce is asked again
+m_LatestRevisionTTL = 300
 
 
 def assure(inParam: dict, inArg: str, ignoreError: bool = False):
@@ -41,18 +47,31 @@ def checkFilesInDir(inDirPath: str, inFiles: list):
     return False
 
 
-def copyFilesInDir(inSrcDirPath: str, inDestDirPath: str, inFiles: list):
+def copyFilesInDir(inSrcDirPath: str, inDestDirPath: str, inFiles: list, inLink: bool = False):
     """
     Copies given files in the specified Directory \n
     :param inSrcDirPath: The specified Source Directory path
     :param inDestDirPath: The specified Destination Directory path
     :param inFiles: List of files to copy
+    :param inLink: If set to True, Hard-links the files instead of copying them wherever the file system allows
     :return: Return True if succeeded else False
     """
     if os.path.exists(inSrcDirPath) and os.path.isdir(inSrcDirPath) and os.path.exists(
             inDestDirPath) and os.path.isdir(inDestDirPath):
         try:
-            [copy(os.path.join(inSrcDirPath, fileName), inDestDirPath) for fileName in inFiles]
+            for fileName in inFiles:
+                srcFilePath = os.path.join(inSrcDirPath, fileName)
+                destFilePath = os.path.join(inDestDirPath, fileName)
+                if inLink:
+                    try:
+                        if os.path.exists(destFilePath):
+                            os.remove(destFilePath)
+                        os.link(srcFilePath, destFilePath)
+                        continue
+                    except OSError:
+                        # Different Volumes or File System without Hard-link support, Falls back to Copy
+                        pass
+                copy(srcFilePath, inDestDirPath)
             return True
         except FileNotFoundError as e:
             print('Error:', e)
@@ -61,43 +80,127 @@ def copyFilesInDir(inSrcDirPath: str, inDestDirPath: str, inFiles: list):
         return False
 
 
+def findFile(inFilePath: str):
+    """
+    Finds the given file or its compressed variant i.e. `<file>.gz` or `<file>.xz` \n
+    :param inFilePath: Path of the uncompressed file
+    :return: Returns the path of the file present on the disk else None
+    """
+    if os.path.exists(inFilePath):
+        return inFilePath
+    for extension in m_CompressionExtensions.values():
+        if os.path.exists(inFilePath + extension):
+            return inFilePath + extension
+    return None
+
+
+def openFile(inFilePath: str):
+    """
+    Opens the given file or its compressed variant for reading in binary mode, Decompresses while being read \n
+    :param inFilePath: Path of the uncompressed file
+    :return: Returns the File Object
+    """
+    filePath = findFile(inFilePath)
+    if filePath is None:
+        raise FileNotFoundError(f"{inFilePath} not found")
+    if filePath.endswith(m_CompressionExtensions['gzip']):
+        return gzip.open(filePath, 'rb')
+    elif filePath.endswith(m_CompressionExtensions['lzma']):
+        return lzma.open(filePath, 'rb')
+    else:
+        return open(filePath, 'rb')
+
+
+def compressFile(inFilePath: str, inCompression: str):
+    """
+    Compresses the given file in a streaming way and removes the uncompressed one \n
+    :param inFilePath: Path of the file to compress
+    :param inCompression: Compression to use i.e. `gzip` or `lzma`
+    :return: Returns the size of the file before and after the compression
+    """
+    if inCompression not in m_CompressionExtensions:
+        raise ValueError(f"{inCompression} is an invalid Compression, Must be one of {list(m_CompressionExtensions)}")
+    compressedFilePath = inFilePath + m_CompressionExtensions[inCompression]
+    with open(inFilePath, 'rb') as srcFile:
+        with (gzip.open if inCompression == 'gzip' else lzma.open)(compressedFilePath, 'wb') as destFile:
+            copyfileobj(srcFile, destFile)
+    originalSize = os.path.getsize(inFilePath)
+    os.remove(inFilePath)
+    # Stale variants of any other Compression must not shadow the latest file
+    for extension in m_CompressionExtensions.values():
+        if extension != m_CompressionExtensions[inCompression] and os.path.exists(inFilePath + extension):
+            os.remove(inFilePath + extension)
+    return originalSize, os.path.getsize(compressedFilePath)
+
+
+def toIDRanges(inIDs: list):
+    """
+    Groups the given IDs into ranges of consecutive IDs i.e. `[1, 2, 3, 5]` as `[(1, 3), (5, 5)]` \n
+    :param inIDs: List of IDs in any order
+    :return: Returns the list of (StartID, EndID) in ascending order
+    """
+    ranges = list()
+    for inID in sorted(set(inIDs)):
+        if len(ranges) > 0 and ranges[-1][1] + 1 == inID:
+            ranges[-1] = (ranges[-1][0], inID)
+        else:
+            ranges.append((inID, inID))
+    return ranges
+
+
 class PerforceUtility:
+    # Latest Revision Numbers already resolved by this process only i.e. by the Drivers of a Batch run executed in the
+    # same worker process, The downloaded revisions in `.ignore` are what every worker process shares
+    # Absolute Path and (Revision Number, Time resolved at) Mapping
+    m_LatestRevisions = dict()
 
     @staticmethod
     def getRevision(inFilePath: str, inFileRevision: int = None):
         """
         Gets a file from Perforce with the latest revision if revision not specified \n
+        Numbered revisions are immutable, hence are downloaded only once in `.ignore` and reused afterwards \n
         :param inFilePath: Path of the file to get revision
         :param inFileRevision: Revision Number of a file to get
         :return: Returns the Absolute Path of the File if downloaded successfully
         """
         if os.path.exists(inFilePath):
+            if inFileRevision is None:
+                inFileRevision = PerforceUtility.getLatestRevisionNumber(inFilePath)
             inFileName = os.path.splitext(os.path.basename(os.path.abspath(inFilePath)))[0]
             inFileExtension = os.path.splitext(os.path.basename(os.path.abspath(inFilePath)))[1]
-            outFileName = None
-            if inFileRevision is not None:
-                outFileName = f"{inFileName}_{inFileRevision}{inFileExtension}"
-                subprocess.call(f"p4.exe print -o {os.path.join(m_DeleteFolder, outFileName)} "
-                                f"{os.path.abspath(inFilePath)}#{inFileRevision}")
-            else:
-                outFileName = f"{inFileName}_Head{inFileExtension}"
-                subprocess.call(f"p4.exe print -o {os.path.join(m_DeleteFolder, outFileName)} "
-                                f"{os.path.abspath(inFilePath)}")
-            return os.path.abspath(os.path.join(m_DeleteFolder, outFileName))
+            outFileName = f"{inFileName}_{inFileRevision}{inFileExtension}"
+            outFilePath = os.path.abspath(os.path.join(m_DeleteFolder, outFileName))
+            if not os.path.exists(outFilePath):
+                os.makedirs(m_DeleteFolder, exist_ok=True)
+                # Downloads to a temporary file first so that concurrent Drivers never read a partial revision
+                tempFilePath = f"{outFilePath}.{os.getpid()}.tmp"
+                subprocess.call(f"p4.exe print -o {tempFilePath} {os.path.abspath(inFilePath)}#{inFileRevision}")
+                if os.path.exists(tempFilePath):
+                    os.replace(tempFilePath, outFilePath)
+            return outFilePath
         else:
             raise FileNotFoundError(f"{inFilePath} is an invalid location")
 
     @staticmethod
-    def getLatestRevisionNumber(inFilePath: str):
+    def getLatestRevisionNumber(inFilePath: str, inMaxAge: float = None):
         """
         Finds the latest revision number of the file \n
         :param inFilePath: Path of the file to get latest revision number
+        :param inMaxAge: Seconds a revision resolved earlier is reused for, `m_LatestRevisionTTL` if None, 0 to always
+            ask Perforce
         :return: Returns latest revision number of the specified file
         """
         if os.path.exists(inFilePath):
-            output = subprocess.check_output(f"p4.exe files {os.path.abspath(inFilePath)}").decode().split(' - ')[0]
-            fileName = os.path.basename(os.path.abspath(inFilePath))
+            maxAge = m_LatestRevisionTTL if inMaxAge is None else inMaxAge
+            filePath = os.path.abspath(inFilePath)
+            if filePath in PerforceUtility.m_LatestRevisions:
+                revision, resolvedAt = PerforceUtility.m_LatestRevisions[filePath]
+                if time.time() - resolvedAt < maxAge:
+                    return revision
+            output = subprocess.check_output(f"p4.exe files {filePath}").decode().split(' - ')[0]
+            fileName = os.path.basename(filePath)
             index = output.find(fileName + '#') + len(fileName) + 1
-            return int(output[index:])
+            PerforceUtility.m_LatestRevisions[filePath] = (int(output[index:]), time.time())
+            return PerforceUtility.m_LatestRevisions[filePath][0]
         else:
             raise FileNotFoundError(f"{inFilePath} is an invalid location")
@@ -1,35 +1,31 @@
+import hashlib
 import json
 import os
+import pickle
 import random
 import re
+import sqlite3
 import subprocess
+import time
 import xml.etree.ElementTree as Etree
-from shutil import rmtree
-from enum import Enum
+from shutil import rmtree, copyfile
 
 from InputReader import InputReader, m_ModifiedMDEFLocation, m_CompareTwoRevisions
-from GenUtility import assure, getEnvVariableValue, checkFilesInDir, copyFilesInDir, PerforceUtility
-
-
-class TestSuites(Enum):
-    Integration = 'Integration'
-    SP = 'SP'
-    DML = 'DML'
-    SQL = 'SQL'
-
-
-class TestSets(Enum):
-    SQL_SELECT_ALL = ['SQL_SELECT_ALL']
-    SQL_PASSDOWN = ['SQL_PASSDOWN']
-    SQL_SP = ['SQL_SP']
-    SQL_AND_OR = ['SQL_AND_OR']
-    SQL_FUNCTION_1TABLE = ['SQL_FUNCTION_1TABLE']
-    SQL_GROUP_BY = ['SQL_GROUP_BY']
-    SQL_IN_BETWEEN = ['SQL_IN_BETWEEN']
-    SQL_LIKE = ['SQL_LIKE']
-    SQL_ORDER_BY = ['SQL_ORDER_BY', 'SQL_ORDER']
-    SQL_SELECT_TOP = ['SQL_SELECT_TOP']
-    SQL_COLUMNS_1TABLE = ['COLUMNS_1TABLE']
+from TestTypes import TestSuites, TestSets
+from Scheduler import RunHistory, TestScheduler, getRetryTimeout, deriveTimeoutLimits, m_DefaultTimeout, \
+    m_StartupSeconds, m_MaxConsecutiveTimeouts, m_MaxAccumulatedTimeouts
+from CostModel import CostModel
+from QueryDeduplicator import QueryDeduplicator, canonicalizeQuery
+from ColumnSampler import ResultSetSampler
+from RunSelection import RunSelection
+from SampleCache import SampleCache, m_DefaultTTL
+from PerformanceHistory import PerformanceHistory
+from ProgressEvents import ResultSetTailer, m_Stream, m_Parsed, m_TailInterval
+from BaselineStore import BaselineStore
+from MDEFRecords import Table, VirtualTable, StoredProcedure, intern
+import FastResultSetReader
+from GenUtility import assure, getEnvVariableValue, checkFilesInDir, copyFilesInDir, PerforceUtility, m_DeleteFolder, \
+    openFile, compressFile, toIDRanges
 
 
 # Global Variables
@@ -43,6 +39,21 @@ m_TestSuite = 'TestSuite.xml'
 m_TestFilesExtension = '.xml'
 m_TestSets = 'TestSets'
 m_ResultSets = 'ResultSets'
+m_MDEFCacheFolder = 'MDEFCache'
+m_ResultSetCatalog = 'ResultSetCatalog.db'
+m_TestSetIndex = 'TestSetIndex.json'
+m_TestRegex = re.compile(r'<Test [^>]*ID="(\d+)">\s*<SQL><!\[CDATA\[(.*?)\]\]></SQL>', re.DOTALL)
+# Whole `Test` element along with the comment of its execution class as written by `TestWriter._formatTest`
+m_TestElementRegex = re.compile(r'(?:[ \t]*<!-- ExecutionClass: [^>]*-->\s*)?[ \t]*<Test [^>]*ID="(\d+)">\s*'
+                                r'<SQL><!\[CDATA\[(.*?)\]\]></SQL>.*?</Test>\s*', re.DOTALL)
+m_TestSetEndTag = b'</TestSet>'
+m_DeduplicatedTestSuite = 'TestSuite_Deduplicated.xml'
+m_CoalescedFolder = 'Coalesced'
+# Test-sets measuring the throughput of the driver rather than its results, timed per query on every run
+m_PerformanceTestSets = TestSets.PERF_FULL_SCAN.value + TestSets.PERF_SELECT_TOP_SWEEP.value + \
+                        TestSets.PERF_FILTER_PAIRS.value + TestSets.PERF_PROJECTION.value
+m_PerformanceTopSizes = [10, 100, 1000, 10000]
+m_ResultSetFileRegex = re.compile(r'^(?P<TestSet>.+)-SQL_QUERY-(?P<TestID>[0-9]+)\.xml(\.gz|\.xz)?$')
 TOUCHSTONE_DIR = getEnvVariableValue('TOUCHSTONE_DIR')
 
 
@@ -64,6 +75,11 @@ class MDEF:
     m_ParentColumn = 'ParentColumn'
     m_Passdownable = 'Passdownable'
 
+    # Parsed MDEFs of this process keyed by the signature of the MDEF file
+    m_ParsedMDEFs = dict()
+    # Version of the parsed structure within the cache, Changes whenever the parsed records change
+    m_CacheVersion = 3
+
     def __init__(self, inFilePath: str = None, withColumns: bool = False, inFileContent: dict = None):
         if inFilePath is not None:
             if len(inFilePath) > 0 and os.path.exists(inFilePath):
@@ -87,78 +103,111 @@ class MDEF:
             else:
                 raise ValueError(f"Invalid MDEF Content provided")
 
+    @staticmethod
+    def load(inFilePath: str, withColumns: bool = False):
+        """
+        Loads the MDEF from the given location by reusing the already parsed MDEF whenever the file is unchanged. \n
+        Parsed MDEFs are cached in memory as well as on the disk within `.ignore` so that every Driver of a Batch run
+        shares them regardless of the worker process it runs in \n
+        :param inFilePath: Location of the MDEF
+        :param withColumns: A Flag to parse the columns as well
+        :return: Returns MDEF Instance
+        """
+        if inFilePath is None or len(inFilePath) == 0 or not os.path.exists(inFilePath):
+            raise FileNotFoundError(f"{inFilePath} is an invalid location")
+        fileStat = os.stat(inFilePath)
+        signature = hashlib.sha1(f"{os.path.abspath(inFilePath)}|{fileStat.st_size}|{fileStat.st_mtime_ns}|"
+                                 f"{withColumns}|{MDEF.m_CacheVersion}".encode()).hexdigest()
+        if signature in MDEF.m_ParsedMDEFs:
+            return MDEF.m_ParsedMDEFs[signature]
+
+        cacheFilePath = os.path.abspath(os.path.join(m_DeleteFolder, m_MDEFCacheFolder, signature + '.pickle'))
+        mdef = None
+        if os.path.exists(cacheFilePath):
+            try:
+                with open(cacheFilePath, 'rb') as file:
+                    mdef = pickle.load(file)
+            except (pickle.UnpicklingError, EOFError, AttributeError):
+                mdef = None
+        if mdef is None:
+            mdef = MDEF(inFilePath, withColumns)
+            os.makedirs(os.path.dirname(cacheFilePath), exist_ok=True)
+            tempFilePath = f"{cacheFilePath}.{os.getpid()}.tmp"
+            with open(tempFilePath, 'wb') as file:
+                pickle.dump(mdef, file, pickle.HIGHEST_PROTOCOL)
+            os.replace(tempFilePath, cacheFilePath)
+        MDEF.m_ParsedMDEFs[signature] = mdef
+        return mdef
+
     def findDifference(self, inMDEF):
         """
         Finds the difference in Tables and Stored Procedures with respect to passed MDEF Content \n
         :param inMDEF: Another MDEF Instance to compare in order to find the difference between both
         :return: Returns the difference between both files in the form of MDEF Instance
         """
+        return MDEF.findContentDifference(self.MDEFContent, inMDEF)
+
+    @staticmethod
+    def findContentDifference(inMDEFContent: dict, inMDEF):
+        """
+        Finds the Tables and Stored Procedures of the MDEF content missing in the passed MDEF, so that the content
+        of a changed MDEF is compared without parsing it \n
+        :param inMDEFContent: MDEF content i.e. loaded MDEF file
+        :param inMDEF: Another MDEF Instance to compare in order to find the difference between both
+        :return: Returns the difference as MDEF content having both `Tables` & `StoredProcedures`, None if neither
+        has anything new
+        """
         if inMDEF is None:
             return None
-        mdefDiff = dict()
-
-        # Compare Stored Procedures
-        if len(self.MDEFStoredProcedures) > 0 and len(inMDEF.MDEFStoredProcedures) > 0:
-            mdefDiff[MDEF.m_StoredProcedures] = list()
-            index = 0
-            for storedProcName in self.MDEFStoredProcedures:
-                if storedProcName not in inMDEF.MDEFStoredProcedures:
-                    mdefDiff[MDEF.m_StoredProcedures].append(self.MDEFContent[MDEF.m_StoredProcedures][index])
-                index += 1
-
-        # Compare Tables
-        if len(self.Tables) > 0 and len(inMDEF.Tables) > 0:
-            mdefDiff[MDEF.m_Tables] = list()
-            index = 0
-            for table in self.MDEFContent[MDEF.m_Tables]:
-                if assure(table, MDEF.m_TableName) not in inMDEF.TableNames:
-                    mdefDiff[MDEF.m_Tables].append(self.MDEFContent[MDEF.m_Tables][index])
-                index += 1
-
-        return mdefDiff if len(mdefDiff[MDEF.m_Tables]) > 0 and len(mdefDiff[MDEF.m_StoredProcedures]) > 0 else None
+        storedProcedures = {storedProc.Name for storedProc in inMDEF.MDEFStoredProcedures}
+        mdefDiff = {
+            MDEF.m_StoredProcedures: [storedProc for storedProc in
+                                      assure(inMDEFContent, MDEF.m_StoredProcedures, True) or []
+                                      if assure(storedProc, MDEF.m_Name) not in storedProcedures],
+            MDEF.m_Tables: [table for table in assure(inMDEFContent, MDEF.m_Tables, True) or []
+                            if assure(table, MDEF.m_TableName) not in inMDEF.TableNames]
+        }
+        return mdefDiff if len(mdefDiff[MDEF.m_Tables]) > 0 or len(mdefDiff[MDEF.m_StoredProcedures]) > 0 else None
 
     def parseStoredProcedures(self, withColumns: bool = False):
-        """Parses Stored Procedures"""
+        """Parses Stored Procedures as `StoredProcedure` records"""
         if assure(self.MDEFContent, MDEF.m_StoredProcedures, True) and len(
                 self.MDEFContent[MDEF.m_StoredProcedures]) > 0:
             mdefStoredProcedures = list()
             if withColumns:
                 for storedProc in self.MDEFContent[MDEF.m_StoredProcedures]:
-                    columns = list()
                     if assure(storedProc, MDEF.m_ResultTable):
-                        for column in assure(storedProc[MDEF.m_ResultTable], MDEF.m_Columns):
-                            columns.append({
-                                assure(column, MDEF.m_Name): assure(column[MDEF.m_MetaData], MDEF.m_SQLType) if assure(
-                                    column, MDEF.m_MetaData) else None
-                            })
-                        mdefStoredProcedures.append({
-                            assure(storedProc, MDEF.m_Name): columns
-                        })
+                        columns = [(assure(column, MDEF.m_Name), assure(column[MDEF.m_MetaData], MDEF.m_SQLType)
+                                    if assure(column, MDEF.m_MetaData) else None)
+                                   for column in assure(storedProc[MDEF.m_ResultTable], MDEF.m_Columns)]
+                        mdefStoredProcedures.append(StoredProcedure(assure(storedProc, MDEF.m_Name), columns))
             else:
                 for storedProc in self.MDEFContent[MDEF.m_StoredProcedures]:
-                    mdefStoredProcedures.append(assure(storedProc, MDEF.m_Name))
+                    mdefStoredProcedures.append(StoredProcedure(assure(storedProc, MDEF.m_Name)))
 
             return mdefStoredProcedures
+        return list()
 
     def parseTables(self, withColumns: bool = False):
-        """Parses Tables"""
-        if assure(self.MDEFContent, MDEF.m_Tables) and len(self.MDEFContent[MDEF.m_Tables]) > 0:
+        """Parses Tables as `Table` & `VirtualTable` records"""
+        if len(assure(self.MDEFContent, MDEF.m_Tables)) > 0:
             mdefTables = list()
             for table in self.MDEFContent[MDEF.m_Tables]:
-                if assure(table, MDEF.m_TableName) in mdefTables:
+                if assure(table, MDEF.m_TableName) in self.TableNames:
                     raise Exception(
                         f"Error: {self.MDEFPath} contains more than one table with name {table[MDEF.m_TableName]}"
                     )
                 else:
-                    columns = dict()
+                    columns = list()
                     passdownableColumns = list()
                     if withColumns:
                         if len(assure(table, MDEF.m_Columns)) > 0:
                             for column in table[MDEF.m_Columns]:
                                 if assure(column, MDEF.m_Passdownable):
                                     passdownableColumns.append(assure(column, MDEF.m_Name))
-                                columns[assure(column, MDEF.m_Name)] = assure(column[MDEF.m_MetaData], MDEF.m_SQLType) \
-                                    if assure(column, MDEF.m_MetaData) else None
+                                columns.append((assure(column, MDEF.m_Name),
+                                                assure(column[MDEF.m_MetaData], MDEF.m_SQLType)
+                                                if assure(column, MDEF.m_MetaData) else None))
 
                     if assure(table, MDEF.m_APIAccess):
                         apiAccesses = list()
@@ -166,72 +215,96 @@ class MDEF:
                             if apiAccess in MDEF.m_APIAccesses:
                                 columns_req = assure(table[MDEF.m_APIAccess][apiAccess], MDEF.m_ColumnRequirements,
                                                      True)
-                                apiAccesses.append({
-                                    apiAccess: columns_req if columns_req else []
-                                })
-                        mdefTables.append({
-                            MDEF.m_Name: table[MDEF.m_TableName],
-                            MDEF.m_Columns: columns,
-                            MDEF.m_APIAccess: apiAccesses
-                        })
-                        self.TableNames[table[MDEF.m_TableName]] = passdownableColumns \
+                                apiAccesses.append((intern(apiAccess),
+                                                    tuple(columns_req) if columns_req else ()))
+                        mdefTables.append(Table(table[MDEF.m_TableName], columns, tuple(apiAccesses)))
+                        self.TableNames[mdefTables[-1].Name] = tuple(passdownableColumns) \
                             if len(passdownableColumns) > 0 else None
                     self.parseVirtualTables(table, mdefTables, withColumns)
 
             return mdefTables
+        return list()
 
     def parseVirtualTables(self, inTable: dict, inMDEFTables: list, withColumns: bool = False):
-        """Parses Virtual Tables"""
+        """Parses Virtual Tables as `VirtualTable` records"""
         if assure(inTable, MDEF.m_VirtualTables, True) and len(inTable[MDEF.m_VirtualTables]) > 0:
             for virtualTable in inTable[MDEF.m_VirtualTables]:
-                if assure(virtualTable, MDEF.m_TableName) in inMDEFTables:
+                if virtualTable[MDEF.m_TableName] in self.TableNames or \
+                        assure(virtualTable, MDEF.m_TableName) in self.VirtualTableNames:
                     raise Exception(f"Error: {self.MDEFPath} contains more than one table "
                                     f"with name {virtualTable[MDEF.m_TableName]}")
                 else:
-                    columns = dict()
+                    columns = list()
                     if withColumns and len(assure(virtualTable, MDEF.m_Columns)) > 0:
+                        # Columns of the parent by name i.e. the last one of any duplicate name
+                        parentColumns = list((inMDEFTables[-1].getColumnTypes() or dict()).items())
                         for column in virtualTable[MDEF.m_Columns]:
                             if MDEF.m_ParentColumn in column:
-                                columnIndex = 0
-                                for tableColumn, tableColumnType in inMDEFTables[-1][MDEF.m_Columns].items():
-                                    if columnIndex == int(column[MDEF.m_ParentColumn]):
-                                        columns[tableColumn] = tableColumnType
-                                        break
-                                    columnIndex += 1
+                                if int(column[MDEF.m_ParentColumn]) < len(parentColumns):
+                                    columns.append(parentColumns[int(column[MDEF.m_ParentColumn])])
                             else:
-                                columns[assure(column, MDEF.m_Name)] = assure(column[MDEF.m_MetaData], MDEF.m_SQLType) \
-                                    if assure(column, MDEF.m_MetaData) else None
-
-                    inMDEFTables.append({
-                        MDEF.m_Name: virtualTable[MDEF.m_TableName],
-                        MDEF.m_Columns: columns,
-                        'Virtual': True
-                    })
-                    self.VirtualTableNames.append(virtualTable[MDEF.m_TableName])
+                                columns.append((assure(column, MDEF.m_Name),
+                                                assure(column[MDEF.m_MetaData], MDEF.m_SQLType)
+                                                if assure(column, MDEF.m_MetaData) else None))
+
+                    inMDEFTables.append(VirtualTable(virtualTable[MDEF.m_TableName], columns))
+                    self.VirtualTableNames.append(inMDEFTables[-1].Name)
                     self.parseVirtualTables(virtualTable, inMDEFTables, withColumns)
 
 
 class TestWriter:
+    # Cost Model of the current run, Plans every Test-set except `SQL_SELECT_ALL` if set
+    m_CostModel = None
+    # Index of the Test-sets of the Test Definitions workspace, New tests are appended to the workspace if set
+    m_TestSetIndex = None
+    # (Testsuite, Test-set) and next Test ID Mapping of a chunked run, Tests of the later chunks are appended if set
+    m_NextTestIDs = None
+
+    @staticmethod
+    def _preferCheaperQueries():
+        """Returns True if the cheaper of the equally covering queries must be preferred due to the time budget"""
+        return TestWriter.m_CostModel is not None and TestWriter.m_CostModel.hasBudget()
+
+    @staticmethod
+    def _rankColumns(inTableName: str, inColumns: dict):
+        """
+        Orders the candidate columns of a filter by the planner i.e. by the rows the driver fetches for each, the
+        Passdownable and most selective ones first, so that the filters are passed down wherever the Test-set allows
+        any column \n
+        :param inTableName: Name of the Table
+        :param inColumns: Column Name and Column Values Mapping
+        :return: Returns Column Name and Column Values Mapping in the planned order
+        """
+        if TestWriter.m_CostModel is None:
+            return inColumns
+        return {columnName: inColumns[columnName]
+                for columnName in TestWriter.m_CostModel.rankColumns(inTableName, inColumns)}
 
     @staticmethod
-    def writeTestEnv(inTestEnvLoc: str, inConnectionString: str):
+    def writeTestEnv(inTestEnvLoc: str, inConnectionString: str, inTimeout: int = m_DefaultTimeout,
+                     inTestEnvFileName: str = m_TestEnv, inMaxConsecutiveTimeouts: int = m_MaxConsecutiveTimeouts,
+                     inMaxAccumulatedTimeouts: int = m_MaxAccumulatedTimeouts):
         """
         Prepares the Test Env File at the specified location \n
         :param inTestEnvLoc: Location to write Test Environment File
         :param inConnectionString: Connection String
+        :param inTimeout: Timeout of a query in seconds
+        :param inTestEnvFileName: Name of the Test Env File i.e. of a Testsuite or a Work Unit
+        :param inMaxConsecutiveTimeouts: Consecutive timeouts after which Touchstone gives up the run
+        :param inMaxAccumulatedTimeouts: Timeouts in total after which Touchstone gives up the run
         :return: Returns True if written successfully else False
         """
         if os.path.exists(inTestEnvLoc):
             if len(inConnectionString) > 0:
-                with open(os.path.join(inTestEnvLoc, m_TestEnv), 'w') as file:
+                with open(os.path.join(inTestEnvLoc, inTestEnvFileName), 'w') as file:
                     file.write('<?xml version="1.0" encoding="utf-8"?>\n')
                     file.write('<TestEnvironment>\n')
                     file.write(f"\t<ConnectionString>{inConnectionString}</ConnectionString>\n")
                     file.write('\t<_Monitor>\n')
                     file.write('\t\t<GenerateResults>true</GenerateResults>\n')
-                    file.write('\t\t<timeout>20</timeout>\n')
-                    file.write('\t\t<maxConsecutiveTimeout>15</maxConsecutiveTimeout>\n')
-                    file.write('\t\t<maxAccumulatedTimeout>50</maxAccumulatedTimeout>\n')
+                    file.write(f"\t\t<timeout>{inTimeout}</timeout>\n")
+                    file.write(f"\t\t<maxConsecutiveTimeout>{inMaxConsecutiveTimeouts}</maxConsecutiveTimeout>\n")
+                    file.write(f"\t\t<maxAccumulatedTimeout>{inMaxAccumulatedTimeouts}</maxAccumulatedTimeout>\n")
                     file.write('\t</_Monitor>\n')
                     file.write('\t<SqlWcharEncoding>UTF-32</SqlWcharEncoding>\n')
                     file.write('</TestEnvironment>')
@@ -244,25 +317,22 @@ class TestWriter:
             return False
 
     @staticmethod
-    def writeTestSuites(inRequiredTestSuites: dict):
+    def writeTestSuites(inRequiredTestSuites: dict, inExclusions: dict = None, inTestSuiteFileName: str = m_TestSuite):
         """
         Prepares Testsuite Folders and writes `TestSuite.xml` within the folder \n
         :param inRequiredTestSuites: A Dictionary having Testsuite as a key and list of test-sets as value
+        :param inExclusions: Test-set and list of (StartID, EndID, Reason) Mapping of the tests to exclude from the run
+        :param inTestSuiteFileName: Name of the Testsuite file to write i.e. a Shard of the Testsuite
         :return: Returns True if written successfully else False
         """
         outputFolderLoc = os.path.abspath(m_OutputFolder)
         if os.path.exists(outputFolderLoc):
             for testSuite, testSets in inRequiredTestSuites.items():
-                with open(os.path.join(os.path.join(outputFolderLoc, testSuite), m_TestSuite), 'w') as file:
+                with open(os.path.join(os.path.join(outputFolderLoc, testSuite), inTestSuiteFileName), 'w') as file:
                     file.write('<TestSuite Name="SQL Test">\n')
                     for test_set in testSets:
-                        file.write(f"\t<TestSet Name=\"{test_set}\" "
-                                   f"SetFile=\"{testSuite}/TestSets/{test_set}{m_TestFilesExtension}\">\n")
-                        file.write('\t\t<!--\n')
-                        file.write('\t\t<Exclusion StartID="6" EndID="6">Exclusion reason</Exclusion>\n')
-                        file.write('\t\t<Ignorable StartID="6" EndID="6">Ignorable reason</Ignorable>\n')
-                        file.write('\t\t-->\n')
-                        file.write('\t</TestSet>\n')
+                        file.write(TestWriter._formatTestSet(testSuite, test_set, inExclusions.get(test_set)
+                                                             if inExclusions is not None else None))
                     file.write('\t<GenerateResults>true</GenerateResults>\n')
                     file.write(f"\t<BaselineDirectory>{testSuite}\\ResultSets</BaselineDirectory>\n")
                     file.write('</TestSuite>')
@@ -271,6 +341,46 @@ class TestWriter:
             print('Error: Incorrect Test Suite Location')
             return False
 
+    @staticmethod
+    def writeCoalescedTestSuite(inBatchFolder: str, inUnits: list, inExclusions: dict = None):
+        """
+        Writes `TestSuite.xml` running the Test-sets of several Testsuites at once, whose Result-sets are written to the
+        `ResultSets` of the batch folder \n
+        :param inBatchFolder: Name of the folder of the batch within the Output folder
+        :param inUnits: List of (Testsuite, Test-set), Test-sets must be distinct
+        :param inExclusions: (Testsuite, Test-set) and list of (StartID, EndID, Reason) Mapping of the tests to exclude
+        :return: Returns True if written successfully else False
+        """
+        batchFolderLoc = os.path.abspath(os.path.join(m_OutputFolder, inBatchFolder))
+        if os.path.exists(batchFolderLoc):
+            with open(os.path.join(batchFolderLoc, m_TestSuite), 'w') as file:
+                file.write('<TestSuite Name="SQL Test">\n')
+                for unit in inUnits:
+                    file.write(TestWriter._formatTestSet(unit[0], unit[1], inExclusions.get(unit)
+                                                         if inExclusions is not None else None))
+                file.write('\t<GenerateResults>true</GenerateResults>\n')
+                file.write(f"\t<BaselineDirectory>{inBatchFolder}\\ResultSets</BaselineDirectory>\n")
+                file.write('</TestSuite>')
+            return True
+        else:
+            print('Error: Incorrect Test Suite Location')
+            return False
+
+    @staticmethod
+    def _formatTestSet(inTestSuite: str, inTestSet: str, inExclusions: list = None):
+        """Returns the `TestSet` element of the given Test-set as written within a Testsuite file"""
+        testSet = f"\t<TestSet Name=\"{inTestSet}\" " \
+                  f"SetFile=\"{inTestSuite}/TestSets/{inTestSet}{m_TestFilesExtension}\">\n"
+        if inExclusions is not None and len(inExclusions) > 0:
+            for startID, endID, reason in inExclusions:
+                testSet += f"\t\t<Exclusion StartID=\"{startID}\" EndID=\"{endID}\">{reason}</Exclusion>\n"
+        else:
+            testSet += '\t\t<!--\n' \
+                       '\t\t<Exclusion StartID="6" EndID="6">Exclusion reason</Exclusion>\n' \
+                       '\t\t<Ignorable StartID="6" EndID="6">Ignorable reason</Ignorable>\n' \
+                       '\t\t-->\n'
+        return testSet + '\t</TestSet>\n'
+
     @staticmethod
     def writeTestSets(inRequiredTestSuites: dict, inMdefDiff: MDEF, inExternalArgs: dict, onlySelectAll: bool = False,
                       inTableColumnsValues: dict = None):
@@ -325,6 +435,18 @@ class TestWriter:
                     elif testSet in TestSets.SQL_COLUMNS_1TABLE.value:
                         hadFailure = not TestWriter.writeSQLColumnTableTestsets(testSuite, testSet,
                                                                                 inTableColumnsValues, startingId)
+                    elif testSet in TestSets.PERF_FULL_SCAN.value:
+                        hadFailure = not TestWriter.writePerfFullScanTestsets(testSuite, testSet,
+                                                                              inTableColumnsValues, startingId)
+                    elif testSet in TestSets.PERF_SELECT_TOP_SWEEP.value:
+                        hadFailure = not TestWriter.writePerfSelectTopSweepTestsets(testSuite, testSet,
+                                                                                    inTableColumnsValues, startingId)
+                    elif testSet in TestSets.PERF_FILTER_PAIRS.value:
+                        hadFailure = not TestWriter.writePerfFilterPairsTestsets(testSuite, testSet, inMdefDiff,
+                                                                                 inTableColumnsValues, startingId)
+                    elif testSet in TestSets.PERF_PROJECTION.value:
+                        hadFailure = not TestWriter.writePerfProjectionTestsets(testSuite, testSet,
+                                                                                inTableColumnsValues, startingId)
 
                     if hadFailure:
                         print(f"Error: Generation of {testSet} for {testSuite} failed")
@@ -415,7 +537,7 @@ class TestWriter:
                 rowCount = max(list(map(len, columns.values())))
                 if rowCount > 0:
                     for columnName in columns:
-                        if random.randint(0, 50) % 2 == 0:
+                        if not TestWriter._preferCheaperQueries() and random.randint(0, 50) % 2 == 0:
                             queries.append(f"SELECT TOP {rowCount % 25} * FROM {table_name} ORDER BY {columnName}")
                         else:
                             queries.append(
@@ -446,7 +568,7 @@ class TestWriter:
                 queryCompleted = True
                 if len(columns) > 0:
                     query = f"SELECT * FROM {tableName} WHERE "
-                    for columnName, columnValues in columns.items():
+                    for columnName, columnValues in TestWriter._rankColumns(tableName, columns).items():
                         if len(columnValues) >= 2:
                             query += f"{columnName}={columnValues[0]} "
                             queryCompleted = not queryCompleted
@@ -479,11 +601,14 @@ class TestWriter:
             for tableName, columns in inTableColumnsValues.items():
                 columnsLen = len(columns)
                 requiredColIndex = random.randrange(0, (columnsLen % 10) - 1) if columnsLen % 10 > 1 else 0
+                if TestWriter.m_CostModel is not None:
+                    # The planned column i.e. a Passdownable one whenever the Table has any
+                    requiredColIndex = 0
                 index = 0
                 if columnsLen > 0:
-                    for columnName in columns:
+                    for columnName in TestWriter._rankColumns(tableName, columns):
                         if requiredColIndex == index:
-                            if random.randint(0, 5) % 2 == 0:
+                            if not TestWriter._preferCheaperQueries() and random.randint(0, 5) % 2 == 0:
                                 queries.append(f"SELECT * FROM {tableName} ORDER BY {columnName}")
                             else:
                                 queries.append(f"SELECT {columnName} FROM {tableName} ORDER BY {columnName}")
@@ -562,11 +687,11 @@ class TestWriter:
         if len(inTestSuite) > 0 and inTableColumnsValues is not None:
             queries = list()
             for tableName, columns in inTableColumnsValues.items():
-                for columnName in columns:
+                for columnName in TestWriter._rankColumns(tableName, columns):
                     totalColumnValues = len(columns[columnName])
                     if totalColumnValues > 2 and any(
                             map(lambda columnValue: isinstance(columnValue, str), columns[columnName])):
-                        if totalColumnValues % 2 == 0:
+                        if not TestWriter._preferCheaperQueries() and totalColumnValues % 2 == 0:
                             queries.append(f"SELECT * FROM {tableName} WHERE {columnName} IN "
                                            f"({', '.join(random.sample(columns[columnName], 2))})")
                         else:
@@ -592,7 +717,7 @@ class TestWriter:
             queries = list()
             queryWritten = False
             for tableName, columns in inTableColumnsValues.items():
-                for columnName, columnValues in columns.items():
+                for columnName, columnValues in TestWriter._rankColumns(tableName, columns).items():
                     for columnVal in columnValues:
                         if isinstance(columnVal, str) and len(columnVal) > 2:
                             queries.append(f"SELECT {columnName} FROM {tableName} WHERE {columnName} LIKE "
@@ -647,6 +772,123 @@ class TestWriter:
             print('Error: Invalid Parameters')
             return False
 
+    @staticmethod
+    def writePerfFullScanTestsets(inTestSuite: str, inTestSet: str, inTableColumnsValues: dict, inStartingID: int = 1):
+        """
+        Prepares Test Set for `PERF_FULL_SCAN` i.e. a scan of every row of each Table \n
+        :param inTestSet: Name of test case.
+        :param inTableColumnsValues: Key Value Pair Containing Table Name & Column Value Map
+        :param inStartingID: Starting Id of the test-set to write testcases further
+        :param inTestSuite: Name of associated Testsuite
+        :return: Returns True if all `PERF_FULL_SCAN` generated successfully else False
+        """
+        if len(inTestSuite) > 0 and inTableColumnsValues is not None:
+            queries = [f"SELECT * FROM {tableName}" for tableName, columns in inTableColumnsValues.items()
+                       if len(columns) > 0]
+            return TestWriter._prepareTestSet(inTestSuite, inTestSet, queries, inStartingID)
+        else:
+            print('Error: Invalid Parameters')
+            return False
+
+    @staticmethod
+    def writePerfSelectTopSweepTestsets(inTestSuite: str, inTestSet: str, inTableColumnsValues: dict,
+                                        inStartingID: int = 1):
+        """
+        Prepares Test Set for `PERF_SELECT_TOP_SWEEP` i.e. `SELECT TOP` of each Table at the increasing page sizes of
+        `m_PerformanceTopSizes`, up to the first size covering the observed row count of the Table \n
+        :param inTestSet: Name of test case.
+        :param inTableColumnsValues: Key Value Pair Containing Table Name & Column Value Map
+        :param inStartingID: Starting Id of the test-set to write testcases further
+        :param inTestSuite: Name of associated Testsuite
+        :return: Returns True if all `PERF_SELECT_TOP_SWEEP` generated successfully else False
+        """
+        if len(inTestSuite) > 0 and inTableColumnsValues is not None:
+            queries = list()
+            for tableName, columns in inTableColumnsValues.items():
+                if len(columns) == 0:
+                    continue
+                rowCount = TestWriter.m_CostModel.tableRowCounts.get(tableName) \
+                    if TestWriter.m_CostModel is not None else None
+                for size in m_PerformanceTopSizes:
+                    queries.append(f"SELECT TOP {size} * FROM {tableName}")
+                    if rowCount is not None and size >= rowCount:
+                        break
+            return TestWriter._prepareTestSet(inTestSuite, inTestSet, queries, inStartingID)
+        else:
+            print('Error: Invalid Parameters')
+            return False
+
+    @staticmethod
+    def writePerfFilterPairsTestsets(inTestSuite: str, inTestSet: str, inMdefDiff: MDEF, inTableColumnsValues: dict,
+                                     inStartingID: int = 1):
+        """
+        Prepares Test Set for `PERF_FILTER_PAIRS` i.e. the same filter of each Table once on a Passdownable column and
+        once on a column the driver filters locally, one after the other \n
+        :param inTestSet: Name of test case.
+        :param inMdefDiff: Difference of MDEFs as MDEF Instance
+        :param inTableColumnsValues: Key Value Pair Containing Table Name & Column Value Map
+        :param inStartingID: Starting Id of the test-set to write testcases further
+        :param inTestSuite: Name of associated Testsuite
+        :return: Returns True if all `PERF_FILTER_PAIRS` generated successfully else False
+        """
+        if len(inTestSuite) > 0 and inMdefDiff is not None and inTableColumnsValues is not None:
+            queries = list()
+            for tableName, columns in inTableColumnsValues.items():
+                passdownableColumns = inMdefDiff.TableNames.get(tableName) or []
+                passdownFilter, localFilter = None, None
+                for columnName, columnValues in columns.items():
+                    if len(columnValues) == 0:
+                        continue
+                    if columnName in passdownableColumns:
+                        passdownFilter = passdownFilter or f"{columnName} = {columnValues[0]}"
+                    else:
+                        localFilter = localFilter or f"{columnName} = {columnValues[0]}"
+                # Only Tables having both kinds of columns make a pair
+                if passdownFilter is not None and localFilter is not None:
+                    queries.append(f"SELECT * FROM {tableName} WHERE {passdownFilter}")
+                    queries.append(f"SELECT * FROM {tableName} WHERE {localFilter}")
+            return TestWriter._prepareTestSet(inTestSuite, inTestSet, queries, inStartingID)
+        else:
+            print('Error: Invalid Parameters')
+            return False
+
+    @staticmethod
+    def writePerfProjectionTestsets(inTestSuite: str, inTestSet: str, inTableColumnsValues: dict,
+                                    inStartingID: int = 1):
+        """
+        Prepares Test Set for `PERF_PROJECTION` i.e. every column of each Table listed explicitly followed by its first
+        column only \n
+        :param inTestSet: Name of test case.
+        :param inTableColumnsValues: Key Value Pair Containing Table Name & Column Value Map
+        :param inStartingID: Starting Id of the test-set to write testcases further
+        :param inTestSuite: Name of associated Testsuite
+        :return: Returns True if all `PERF_PROJECTION` generated successfully else False
+        """
+        if len(inTestSuite) > 0 and inTableColumnsValues is not None:
+            queries = list()
+            for tableName, columns in inTableColumnsValues.items():
+                if len(columns) > 1:
+                    queries.append(f"SELECT {', '.join(columns)} FROM {tableName}")
+                    queries.append(f"SELECT {next(iter(columns))} FROM {tableName}")
+            return TestWriter._prepareTestSet(inTestSuite, inTestSet, queries, inStartingID)
+        else:
+            print('Error: Invalid Parameters')
+            return False
+
+    @staticmethod
+    def _formatTest(inQuery: str, inTestID: int, inExecutionClass: str = None):
+        """
+        Returns the `Test` element of the given query as written within a Test-set, preceded by a comment of its
+        expected execution class if given
+        """
+        return (f"\t<!-- ExecutionClass: {inExecutionClass} -->\n" if inExecutionClass is not None else '') + \
+               f"\t<Test Name=\"SQL_QUERY\" JavaMethod=\"testSqlQuery\" dotNetMethod=\"TestSqlQuery\" " \
+               f"ID=\"{inTestID}\">\n" \
+               f"\t\t<SQL><![CDATA[{inQuery}]]></SQL>\n" \
+               '\t\t<ValidateColumns>True</ValidateColumns>\n' \
+               '\t\t<ValidateNumericExactly>True</ValidateNumericExactly>\n' \
+               '\t</Test>\n'
+
     @staticmethod
     def _prepareTestSet(inTestSuite: str, inTestSet: str, inQueries: list, inStartingID: int = 1):
         """
@@ -658,20 +900,35 @@ class TestWriter:
         :return: Returns True if Test-set written successfully else False
         """
         if inTestSuite is not None and len(inTestSuite) > 0 and inTestSet is not None and len(inTestSet) > 0:
+            if TestWriter.m_TestSetIndex is not None and inTestSet not in TestSets.SQL_SELECT_ALL.value:
+                # Test IDs of `SQL_SELECT_ALL` map to the Tables, so none of its tests can be skipped
+                inQueries = TestWriter.m_TestSetIndex.findNewQueries(inTestSuite, inTestSet, inQueries)
+            if TestWriter.m_CostModel is not None and inTestSet not in TestSets.SQL_SELECT_ALL.value:
+                inQueries = TestWriter.m_CostModel.plan(inTestSet, inQueries)
             testSetPath = os.path.abspath(os.path.join(os.path.join(m_OutputFolder, inTestSuite), m_TestSets))
             if os.path.exists(testSetPath):
-                with open(os.path.join(testSetPath, inTestSet + m_TestFilesExtension), 'w') as file:
-                    file.write(f"<TestSet Name=\"{inTestSet}\" JavaClass=\"com.simba.testframework.testcases"
-                               f".jdbc.resultvalidation.SqlTester\" dotNetClass=\"SqlTester\">\n")
-                    for query in inQueries:
-                        file.write(f"\t<Test Name=\"SQL_QUERY\" JavaMethod=\"testSqlQuery\" "
-                                   f"dotNetMethod=\"TestSqlQuery\" ID=\"{inStartingID}\">\n")
-                        file.write(f"\t\t<SQL><![CDATA[{query}]]></SQL>\n")
-                        file.write('\t\t<ValidateColumns>True</ValidateColumns>\n')
-                        file.write('\t\t<ValidateNumericExactly>True</ValidateNumericExactly>\n')
-                        file.write('\t</Test>\n')
-                        inStartingID += 1
-                    file.write('</TestSet>')
+                testElements = [(testID, query, TestWriter._formatTest(
+                    query, testID, TestWriter.m_CostModel.getExecutionClass(query)
+                    if TestWriter.m_CostModel is not None else None))
+                    for testID, query in enumerate(inQueries, inStartingID)]
+                tests = ''.join(testElement for testID, query, testElement in testElements)
+                testSetFilePath = os.path.join(testSetPath, inTestSet + m_TestFilesExtension)
+                if TestWriter.m_NextTestIDs is not None and (inTestSuite, inTestSet) in TestWriter.m_NextTestIDs:
+                    # Later chunk of the run, The tests go right before the closing tag written by the first chunk
+                    # with the same newlines the file was written in text mode with
+                    with open(testSetFilePath, 'r+b') as file:
+                        file.seek(-len(m_TestSetEndTag), os.SEEK_END)
+                        file.write(tests.replace('\n', os.linesep).encode('utf-8') + m_TestSetEndTag)
+                else:
+                    with open(testSetFilePath, 'w', encoding='utf-8') as file:
+                        file.write(f"<TestSet Name=\"{inTestSet}\" JavaClass=\"com.simba.testframework.testcases"
+                                   f".jdbc.resultvalidation.SqlTester\" dotNetClass=\"SqlTester\">\n")
+                        file.write(tests)
+                        file.write('</TestSet>')
+                if TestWriter.m_NextTestIDs is not None:
+                    TestWriter.m_NextTestIDs[(inTestSuite, inTestSet)] = inStartingID + len(inQueries)
+                if TestWriter.m_TestSetIndex is not None:
+                    TestWriter.m_TestSetIndex.append(inTestSuite, inTestSet, testElements)
                 return True
             else:
                 print(f"Error: Path {testSetPath} doesn't exist")
@@ -679,28 +936,235 @@ class TestWriter:
 
 
 class TestSetGenerator:
-    def __init__(self, inFilePath):
+    def __init__(self, inFilePath, inTimeBudget: float = None, inSelection: RunSelection = None,
+                 inChunkSize: int = None, inRefreshSamples: bool = False):
         self.inputFile = InputReader(inFilePath)
+        # Cache of the row samples of the run, set while running
+        self.sampleCache = None
+        self.refreshSamples = inRefreshSamples
         self.inMDEFToGenerateTests = None
+        self.timeBudget = inTimeBudget
+        self.plannedSeconds = 0.0
+        # Count of Tables processed at a time through the whole pipeline, None to process all the Tables at once
+        self.chunkSize = inChunkSize if inChunkSize is not None and inChunkSize > 0 else None
+        # Tables, Testsuites & Test-sets the run is restricted to, None to generate everything
+        self.selection = inSelection if inSelection is not None and inSelection.isRestricted() else None
+        # (Testsuite, Test-set) and Test IDs Mapping of the tests of the Tables not selected, kept as they are
+        self.keptTestIDs = dict()
 
     def run(self):
         requiredTestSuites = self.inputFile.getRequiredTestSuites()
         externalArgs = self.inputFile.getExternalArguments()
+        if self.selection is not None:
+            print(f"Restricting the run to {self.selection}")
+            requiredTestSuites = self.selection.filterTestSuites(requiredTestSuites)
+            if len(requiredTestSuites) == 0:
+                print('Error: No Test-sets of `TestSuite` match the selection')
+                return False
         if self.setupTestFolders(requiredTestSuites):
-            mdefDiff = self.findMDEFDifference()
-            if mdefDiff is not None:
-                if TestWriter.writeTestSets(requiredTestSuites, mdefDiff, externalArgs, onlySelectAll=True):
-                    if ResultSetGenerator.executeTestSuite(TestSuites.Integration.name, TestSets.SQL_SELECT_ALL.name):
-                        tableColumnValues = ResultSetGenerator.parseResultSets(
-                            mdefDiff, requiredTestSuites[TestSuites.Integration.name][TestSets.SQL_SELECT_ALL.name]
-                        )
-                        if tableColumnValues is not None and len(tableColumnValues) > 0:
-                            return TestWriter.writeTestSets(requiredTestSuites, mdefDiff, externalArgs, False,
-                                                            tableColumnValues)
-                        else:
-                            print('Error: Failed to generate result-sets of `SQL_SELECT_ALL`')
+            sampleCacheTTL = self.inputFile.getSampleCacheTTL()
+            self.sampleCache = SampleCache(m_OutputFolder, self.inputFile.getConnectionString(),
+                                           sampleCacheTTL if sampleCacheTTL is not None else m_DefaultTTL,
+                                           self.refreshSamples)
+            if self.inputFile.getTestDefinitionsLocation() is not None:
+                TestWriter.m_TestSetIndex = TestSetIndex(self.inputFile.getTestDefinitionsLocation())
+                requiredTestSuites = TestWriter.m_TestSetIndex.assignStartingIDs(requiredTestSuites)
+            if len(self.keptTestIDs) > 0:
+                # Tests of the selected Tables are appended after the tests kept of the rest of the Tables
+                for (testSuite, testSet), testIDs in self.keptTestIDs.items():
+                    requiredTestSuites[testSuite][testSet] = max(requiredTestSuites[testSuite][testSet],
+                                                                 max(testIDs) + 1)
+                TestWriter.m_NextTestIDs = {unit: requiredTestSuites[unit[0]][unit[1]] for unit in self.keptTestIDs}
+            try:
+                with m_Stream.phase('GenerateTestSets'):
+                    return self.generateTestSets(requiredTestSuites, externalArgs)
+            finally:
+                TestWriter.m_NextTestIDs = None
+                if TestWriter.m_TestSetIndex is not None:
+                    TestWriter.m_TestSetIndex.save()
+                    print(f"Appended {TestWriter.m_TestSetIndex.appendedTests} tests to "
+                          f"{self.inputFile.getTestDefinitionsLocation()}, "
+                          f"Skipped {TestWriter.m_TestSetIndex.skippedTests} tests already present")
+                    TestWriter.m_TestSetIndex = None
+                if self.sampleCache.hits > 0 or self.sampleCache.misses > 0:
+                    print(f"Sample Cache: {self.sampleCache.hits} Tables served, {self.sampleCache.misses} sampled")
+
+    def generateTestSets(self, inRequiredTestSuites: dict, inExternalArgs: dict):
+        """
+        Generates the Test-sets of the MDEF difference i.e. `SQL_SELECT_ALL` first and the rest from its Result-sets \n
+        :param inRequiredTestSuites: Testsuite and Test-set & Starting ID Mapping
+        :param inExternalArgs: External Arguments containing the input params for SP
+        :return: Returns True if generated successfully else False
+        """
+        if TestSets.SQL_SELECT_ALL.name not in inRequiredTestSuites.get(TestSuites.Integration.name, dict()):
+            # Selection of the Test-sets built from the External Arguments only i.e. `SQL_SP`
+            return all(TestWriter.writeSPTestSets(testSuite, testSet, inExternalArgs[testSuite], startingId)
+                       for testSuite, testSets in inRequiredTestSuites.items()
+                       for testSet, startingId in testSets.items() if testSet in TestSets.SQL_SP.value)
+        mdefDiff = self.findMDEFDifference()
+        if mdefDiff is not None:
+            if self.chunkSize is not None and len(mdefDiff.MDEFContent[MDEF.m_Tables]) > self.chunkSize:
+                return self.generateChunkedTestSets(inRequiredTestSuites, mdefDiff, inExternalArgs)
+            return self.generateMDEFTestSets(inRequiredTestSuites, mdefDiff, inExternalArgs)
+        else:
+            print('Warning: Provided MDEFs are identical. No difference found to generate new test-cases.')
+
+    def generateChunkedTestSets(self, inRequiredTestSuites: dict, inMdefDiff: MDEF, inExternalArgs: dict):
+        """
+        Generates the Test-sets of the MDEF difference a chunk of Tables at a time through the whole pipeline i.e.
+        `SQL_SELECT_ALL` of the chunk is executed & parsed and the rest of the Test-sets are appended with the tests of
+        the chunk. Test IDs stay contiguous across the chunks and the Test-sets are complete after every chunk \n
+        :param inRequiredTestSuites: Testsuite and Test-set & Starting ID Mapping
+        :param inMdefDiff: MDEF Difference as MDEF Instance
+        :param inExternalArgs: External Arguments containing the input params for SP
+        :return: Returns True if generated successfully else False
+        """
+        tables = inMdefDiff.MDEFContent[MDEF.m_Tables]
+        chunks = (len(tables) + self.chunkSize - 1) // self.chunkSize
+        # Test-sets having tests of the Tables not selected are appended to from the first chunk on
+        nextTestIDs = TestWriter.m_NextTestIDs
+        TestWriter.m_NextTestIDs = dict(nextTestIDs or dict())
+        try:
+            for chunk, index in enumerate(range(0, len(tables), self.chunkSize), 1):
+                # Tables of the chunk along with their Virtual Tables, Stored Procedures do not depend on the Tables
+                chunkMdef = MDEF(inFileContent={MDEF.m_Tables: tables[index:index + self.chunkSize]},
+                                 withColumns=True)
+                chunkTestSuites = dict()
+                for testSuite, testSets in inRequiredTestSuites.items():
+                    chunkTestSets = {testSet: TestWriter.m_NextTestIDs.get((testSuite, testSet), startingId)
+                                     for testSet, startingId in testSets.items()
+                                     if chunk == 1 or testSet not in TestSets.SQL_SP.value}
+                    if len(chunkTestSets) > 0:
+                        chunkTestSuites[testSuite] = chunkTestSets
+                # Excludes the `SQL_SELECT_ALL` tests of the previous chunks from the run of this chunk
+                firstID = inRequiredTestSuites[TestSuites.Integration.name][TestSets.SQL_SELECT_ALL.name]
+                chunkStartID = chunkTestSuites[TestSuites.Integration.name][TestSets.SQL_SELECT_ALL.name]
+                selectAllExclusions = [(firstID, chunkStartID - 1, 'Executed within a previous chunk')] \
+                    if chunkStartID > firstID else None
+                print(f"Chunk {chunk} of {chunks}: {len(chunkMdef.Tables)} Tables")
+                if not self.generateMDEFTestSets(chunkTestSuites, chunkMdef, inExternalArgs, selectAllExclusions):
+                    print(f"Error: Chunk {chunk} of {chunks} failed")
+                    return False
+            return True
+        finally:
+            TestWriter.m_NextTestIDs = nextTestIDs
+
+    def generateMDEFTestSets(self, inRequiredTestSuites: dict, inMdefDiff: MDEF, inExternalArgs: dict,
+                             inSelectAllExclusions: list = None):
+        """
+        Generates the Test-sets of the given Tables i.e. `SQL_SELECT_ALL` first and the rest from its Result-sets \n
+        :param inRequiredTestSuites: Testsuite and Test-set & Starting ID Mapping
+        :param inMdefDiff: MDEF Difference as MDEF Instance
+        :param inExternalArgs: External Arguments containing the input params for SP
+        :param inSelectAllExclusions: List of (StartID, EndID, Reason) of the `SQL_SELECT_ALL` tests not to execute
+        :return: Returns True if generated successfully else False
+        """
+        if TestWriter.writeTestSets(inRequiredTestSuites, inMdefDiff, inExternalArgs, onlySelectAll=True):
+            startingID = inRequiredTestSuites[TestSuites.Integration.name][TestSets.SQL_SELECT_ALL.name]
+            tableColumnValues, tableRowCounts, columnSketches = dict(), dict(), dict()
+            cachedSamples = self.sampleCache.get(inMdefDiff.Tables) if self.sampleCache is not None else dict()
+            for tableName, (columnValues, rowCount, sketches) in cachedSamples.items():
+                tableRowCounts[tableName] = rowCount
+                if columnValues is not None:
+                    tableColumnValues[tableName] = columnValues
+                if sketches is not None:
+                    columnSketches[tableName] = sketches
+            if len(cachedSamples) < len(inMdefDiff.Tables):
+                # Tables served from the Cache are excluded from the discovery run
+                cachedIDs = [testID for testID, table in enumerate(inMdefDiff.Tables, startingID)
+                             if table.Name in cachedSamples]
+                keptIDs = self.keptTestIDs.get((TestSuites.Integration.name, TestSets.SQL_SELECT_ALL.name), ())
+                exclusions = list(inSelectAllExclusions or []) + [
+                    (startID, endID, 'Sample served from the Cache')
+                    for startID, endID in toIDRanges(cachedIDs)] + [
+                    (startID, endID, 'Table not selected') for startID, endID in toIDRanges(keptIDs)]
+                if not self.discoverSamples(inMdefDiff, startingID, exclusions, set(cachedSamples), tableColumnValues,
+                                            tableRowCounts, columnSketches):
+                    return False
             else:
-                print('Warning: Provided MDEFs are identical. No difference found to generate new test-cases.')
+                print(f"Samples of all the {len(cachedSamples)} Tables served from the Cache, "
+                      f"skipping the discovery run")
+            if len(tableColumnValues) > 0:
+                TestWriter.m_CostModel = self.buildCostModel(inMdefDiff, tableRowCounts, columnSketches)
+                # Time budget spans every chunk of the run
+                TestWriter.m_CostModel.plannedSeconds = self.plannedSeconds
+                try:
+                    return TestWriter.writeTestSets(inRequiredTestSuites, inMdefDiff, inExternalArgs, False,
+                                                    tableColumnValues)
+                finally:
+                    self.plannedSeconds = TestWriter.m_CostModel.plannedSeconds
+                    print(f"Planned run time: {TestWriter.m_CostModel.plannedSeconds:.1f}s" +
+                          (f" of {self.timeBudget:.1f}s budget" if self.timeBudget is not None else ''))
+                    TestWriter.m_CostModel = None
+            else:
+                print('Error: Failed to generate result-sets of `SQL_SELECT_ALL`')
+        return False
+
+    def discoverSamples(self, inMdefDiff: MDEF, inStartingID: int, inExclusions: list, inCachedTables: set,
+                        ioTableColumnValues: dict, ioTableRowCounts: dict, ioColumnSketches: dict):
+        """
+        Executes the discovery `SQL_SELECT_ALL` of the Tables not served from the Cache, samples their Result-sets and
+        stores the samples within the Cache \n
+        :param inMdefDiff: MDEF Difference as MDEF Instance
+        :param inStartingID: Starting ID of the `SQL_SELECT_ALL` tests of the given Tables
+        :param inExclusions: List of (StartID, EndID, Reason) of the `SQL_SELECT_ALL` tests not to execute
+        :param inCachedTables: Names of the Tables served from the Cache
+        :param ioTableColumnValues: Table Name and Column Name & Values Mapping, Filled with the new samples
+        :param ioTableRowCounts: Table Name and Row Count Mapping, Filled with the new samples
+        :param ioColumnSketches: Table Name and Column Name & `ColumnSketch` Mapping, Filled with the new samples
+        :return: Returns True if sampled successfully else False
+        """
+        testSuiteFileName = m_TestSuite
+        if len(inExclusions) > 0:
+            testSuiteFileName = f"TestSuite_Discovery{m_TestFilesExtension}"
+            TestWriter.writeTestSuites({TestSuites.Integration.name: [TestSets.SQL_SELECT_ALL.name]},
+                                       {TestSets.SQL_SELECT_ALL.name: inExclusions}, testSuiteFileName)
+        runHistory = RunHistory(m_OutputFolder)
+        timeout = runHistory.deriveTimeout(TestSuites.Integration.name, TestSets.SQL_SELECT_ALL.name,
+                                           inHeadroom=self.inputFile.getTimeoutHeadroom())
+        testEnvFileName = ResultSetGenerator.writeUnitTestEnv(
+            self.inputFile.getConnectionString(), TestSuites.Integration.name, TestSets.SQL_SELECT_ALL.name, timeout,
+            inTestCount=len(inMdefDiff.Tables) - len(inCachedTables),
+            inTimeoutRate=runHistory.getTimeoutRate(TestSuites.Integration.name, TestSets.SQL_SELECT_ALL.name))
+        with m_Stream.phase('Discovery', Tables=len(inMdefDiff.Tables) - len(inCachedTables)):
+            executed = ResultSetGenerator.executeTestSuite(TestSuites.Integration.name, TestSets.SQL_SELECT_ALL.name,
+                                                           testSuiteFileName, testEnvFileName)
+        if executed:
+            if self.inputFile.getCompression(TestSuites.Integration.name) is not None:
+                ResultSetGenerator.compressResultSets(
+                    TestSuites.Integration.name, self.inputFile.getCompression(TestSuites.Integration.name))
+            tableRowCounts, columnSketches = dict(), dict()
+            with m_Stream.phase('ParseResultSets'):
+                tableColumnValues = ResultSetGenerator.parseResultSets(inMdefDiff, inStartingID, tableRowCounts,
+                                                                       columnSketches, inCachedTables)
+            if tableColumnValues is not None:
+                if self.sampleCache is not None:
+                    self.sampleCache.put([table for table in inMdefDiff.Tables if table.Name not in inCachedTables],
+                                         tableColumnValues, tableRowCounts, columnSketches)
+                ioTableColumnValues.update(tableColumnValues)
+                ioTableRowCounts.update(tableRowCounts)
+                ioColumnSketches.update(columnSketches)
+                return True
+        print('Error: Failed to generate result-sets of `SQL_SELECT_ALL`')
+        return False
+
+    def buildCostModel(self, inMdefDiff: MDEF, inTableRowCounts: dict, inColumnSketches: dict = None):
+        """
+        Builds the Cost Model from the Table row counts and the recorded timings of the `SQL_SELECT_ALL` tests \n
+        :param inMdefDiff: MDEF Difference as MDEF Instance
+        :param inTableRowCounts: Table Name and Row Count Mapping
+        :param inColumnSketches: Table Name and Column Name & `ColumnSketch` Mapping
+        :return: Returns CostModel Instance
+        """
+        observations = list()
+        testSeconds = RunHistory(m_OutputFolder).getTestSeconds(TestSuites.Integration.name,
+                                                                TestSets.SQL_SELECT_ALL.name)
+        for testID, seconds in testSeconds.items():
+            resultSetEntry = ResultSetCatalog.getEntry(TestSuites.Integration.name, TestSets.SQL_SELECT_ALL.name,
+                                                       testID)
+            if resultSetEntry is not None:
+                observations.append((resultSetEntry['RowCount'], seconds))
+        return CostModel(inTableRowCounts, inMdefDiff.TableNames, observations, self.timeBudget, inColumnSketches)
 
     def findMDEFDifference(self):
         mdefDiffMode = self.inputFile.getMDEFDifferenceFindMode()
@@ -711,19 +1175,19 @@ class TestSetGenerator:
             newerMdefRev = self.inputFile.getNewerMDEFRevision()
             if olderMdefRev is not None and newerMdefRev is not None:
                 olderMdefLoc = PerforceUtility.getRevision(mdefLoc, olderMdefRev)
-                olderMdef = MDEF(olderMdefLoc) if olderMdefLoc is not None else None
+                olderMdef = MDEF.load(olderMdefLoc) if olderMdefLoc is not None else None
                 newerMdefLoc = PerforceUtility.getRevision(mdefLoc, newerMdefRev)
-                newerMdef = MDEF(newerMdefLoc) if newerMdefLoc is not None else None
+                newerMdef = MDEF.load(newerMdefLoc) if newerMdefLoc is not None else None
                 mdefDiff = newerMdef.findDifference(olderMdef)
             else:
                 latest_mdef_revision_num = PerforceUtility.getLatestRevisionNumber(mdefLoc)
                 olderMdefLoc = PerforceUtility.getRevision(mdefLoc, latest_mdef_revision_num - 1)
-                olderMdef = MDEF(olderMdefLoc) if olderMdefLoc is not None else None
+                olderMdef = MDEF.load(olderMdefLoc) if olderMdefLoc is not None else None
                 latestMdefLoc = PerforceUtility.getRevision(mdefLoc)
-                latestMdef = MDEF(latestMdefLoc) if latestMdefLoc is not None else None
+                latestMdef = MDEF.load(latestMdefLoc) if latestMdefLoc is not None else None
                 mdefDiff = latestMdef.findDifference(olderMdef)
             if mdefDiff is not None:
-                return MDEF(inFileContent=mdefDiff, withColumns=True)
+                return self.selectTables(mdefDiff)
             else:
                 print('No Difference found between the specified version of MDEF')
                 return None
@@ -731,33 +1195,53 @@ class TestSetGenerator:
             modifedMdefLoc = self.inputFile.getModifiedMDEFLocation()
             if modifedMdefLoc is not None:
                 if self.inputFile.isFirstRevision():
-                    return MDEF(inFilePath=modifedMdefLoc, withColumns=True)
+                    if self.selection is None or self.selection.tables is None:
+                        return MDEF.load(modifedMdefLoc, withColumns=True)
+                    return self.selectTables(MDEF.load(modifedMdefLoc).MDEFContent)
                 else:
                     latestMdefLoc = PerforceUtility.getRevision(self.inputFile.getMDEFLocation())
-                    latestMdef = MDEF(latestMdefLoc) if latestMdefLoc is not None else None
-                    modifedMdef = MDEF(modifedMdefLoc)
+                    latestMdef = MDEF.load(latestMdefLoc) if latestMdefLoc is not None else None
+                    modifedMdef = MDEF.load(modifedMdefLoc)
                     mdefDiff = modifedMdef.findDifference(latestMdef)
                 if mdefDiff is not None:
-                    return MDEF(inFileContent=mdefDiff, withColumns=True)
+                    return self.selectTables(mdefDiff)
                 else:
                     print('No Difference found between the specified version of MDEF')
                     return None
             else:
                 raise Exception(f"{m_ModifiedMDEFLocation} is an invalid value! Provide a correct one.")
 
-    def setupOutputFolder(self):
+    def selectTables(self, inMDEFContent: dict):
+        """
+        Parses the selected Tables of the given MDEF content, so that only those are fetched, executed and written \n
+        :param inMDEFContent: MDEF content i.e. the difference of the MDEFs
+        :return: Returns the MDEF Instance of the selected Tables, None if no Table is selected
+        """
+        if self.selection is None or self.selection.tables is None:
+            return MDEF(inFileContent=inMDEFContent, withColumns=True)
+        selectedContent = dict(inMDEFContent)
+        selectedContent[MDEF.m_Tables] = self.selection.filterTables(assure(inMDEFContent, MDEF.m_Tables, True) or [],
+                                                                     MDEF.m_TableName)
+        if len(selectedContent[MDEF.m_Tables]) == 0:
+            print(f"Warning: No Tables of the MDEF difference match {', '.join(self.selection.tables)}")
+            return None
+        print(f"Selected {len(selectedContent[MDEF.m_Tables])} of {len(inMDEFContent[MDEF.m_Tables])} Tables")
+        return MDEF(inFileContent=selectedContent, withColumns=True)
+
+    @staticmethod
+    def setupOutputFolder():
         """
         Makes a directory name `Output` and puts required files of TouchStone with the same by copying from the
         location environment variable `TOUCHSTONE_DIR` refers \n
         :return: Returns True if `Output` setup successfully else raises an Exception.
         """
-        if m_OutputFolder in os.listdir() and os.path.exists(m_OutputFolder) and os.path.isdir(m_OutputFolder):
+        if os.path.exists(m_OutputFolder) and os.path.isdir(m_OutputFolder):
             return True if checkFilesInDir(os.path.abspath(m_OutputFolder), m_TouchStoneAssets) else \
-                copyFilesInDir(TOUCHSTONE_DIR, os.path.abspath(m_OutputFolder), m_TouchStoneAssets)
+                copyFilesInDir(TOUCHSTONE_DIR, os.path.abspath(m_OutputFolder), m_TouchStoneAssets, inLink=True)
         else:
             try:
-                os.mkdir(m_OutputFolder)
-                return copyFilesInDir(TOUCHSTONE_DIR, os.path.abspath(m_OutputFolder), m_TouchStoneAssets)
+                os.makedirs(m_OutputFolder)
+                return copyFilesInDir(TOUCHSTONE_DIR, os.path.abspath(m_OutputFolder), m_TouchStoneAssets, inLink=True)
             except PermissionError as e:
                 print('Error:', e)
                 return False
@@ -775,6 +1259,8 @@ class TestSetGenerator:
                 rmtree(envsFolderPath)
             os.mkdir(envsFolderPath)
             if TestWriter.writeTestEnv(envsFolderPath, self.inputFile.getConnectionString()):
+                if self.selection is not None:
+                    return self.setupSelectedTestFolders(inRequiredTestSuites)
                 for testSuite in inRequiredTestSuites.keys():
                     currTestSuitePath = os.path.abspath(os.path.join(outputFolderPath, testSuite))
                     if os.path.exists(currTestSuitePath):
@@ -788,40 +1274,777 @@ class TestSetGenerator:
         else:
             return False
 
+    def setupSelectedTestFolders(self, inRequiredTestSuites: dict):
+        """
+        Prepares the TestSuites' Folders of a restricted run, Only the Test-sets & Result-sets of the selection are
+        removed whereas the rest of the output stays as it is. Of a selection of Tables, only the tests of those Tables
+        and their Result-sets are removed from the Test-sets \n
+        :param inRequiredTestSuites: Testsuite and Test-set & Starting ID Mapping of the selection
+        :return: Returns True if succeeded else False
+        """
+        outputFolderPath = os.path.abspath(m_OutputFolder)
+        configuredTestSuites = self.inputFile.getRequiredTestSuites()
+        self.keptTestIDs = dict()
+        for testSuite, testSets in inRequiredTestSuites.items():
+            currTestSuitePath = os.path.join(outputFolderPath, testSuite)
+            os.makedirs(os.path.join(currTestSuitePath, m_TestSets), exist_ok=True)
+            os.makedirs(os.path.join(currTestSuitePath, m_ResultSets), exist_ok=True)
+            removedTestIDs = dict()
+            for testSet in testSets:
+                testSetPath = os.path.join(currTestSuitePath, m_TestSets, testSet + m_TestFilesExtension)
+                if os.path.exists(testSetPath):
+                    removedTestIDs[testSet] = self.removeSelectedTests(testSuite, testSet, testSetPath)
+            resultSetsPath = os.path.join(currTestSuitePath, m_ResultSets)
+            for fileName in os.listdir(resultSetsPath):
+                match = m_ResultSetFileRegex.match(fileName)
+                if match is not None and match.group('TestSet') in testSets and \
+                        (removedTestIDs.get(match.group('TestSet')) is None or
+                         int(match.group('TestID')) in removedTestIDs[match.group('TestSet')]):
+                    os.remove(os.path.join(resultSetsPath, fileName))
+            ResultSetCatalog.update(testSuite)
+        # Testsuite files list every configured Test-set, the selected ones are run through `-rts`
+        return TestWriter.writeTestSuites({testSuite: configuredTestSuites[testSuite]
+                                           for testSuite in inRequiredTestSuites})
+
+    def removeSelectedTests(self, inTestSuite: str, inTestSet: str, inTestSetPath: str):
+        """
+        Removes the tests of the selection from the Test-set, The tests of the Tables not selected are kept in place \n
+        :param inTestSuite: Name of the Testsuite
+        :param inTestSet: Name of the Test-set
+        :param inTestSetPath: Path of the Test-set within the Output folder
+        :return: Returns the set of the removed Test IDs, None if the whole Test-set is removed
+        """
+        if self.selection.tables is not None:
+            with open(inTestSetPath, 'r', encoding='utf-8') as file:
+                content = file.read()
+            testElements = list(m_TestElementRegex.finditer(content))
+            keptElements = [testElement for testElement in testElements
+                            if not self.selection.isQuerySelected(testElement.group(2))]
+            if len(keptElements) > 0:
+                with open(inTestSetPath, 'w', encoding='utf-8') as file:
+                    file.write(content[:testElements[0].start()])
+                    file.write(''.join(testElement.group(0) for testElement in keptElements))
+                    file.write(m_TestSetEndTag.decode('utf-8'))
+                self.keptTestIDs[(inTestSuite, inTestSet)] = [int(testElement.group(1))
+                                                              for testElement in keptElements]
+                print(f"Kept {len(keptElements)} tests of {inTestSet} of the Tables not selected")
+                return {int(testElement.group(1)) for testElement in testElements} - \
+                    set(self.keptTestIDs[(inTestSuite, inTestSet)])
+        os.remove(inTestSetPath)
+        return None
+
+
+class ResultSetCatalog:
+    """
+    Represents the Catalog of the Result-sets generated within `Output`, an SQLite index updated as Touchstone output
+    lands so that lookups, success checks and missing tests are indexed reads instead of file system probes.
+    """
+
+    @staticmethod
+    def _connect():
+        connection = sqlite3.connect(os.path.join(m_OutputFolder, m_ResultSetCatalog), timeout=30)
+        connection.execute('CREATE TABLE IF NOT EXISTS ResultSets (TestSuite TEXT NOT NULL, TestSet TEXT NOT NULL, '
+                           'TestID INTEGER NOT NULL, Path TEXT NOT NULL, Size INTEGER, MTime REAL, RowCount INTEGER, '
+                           'Columns TEXT, PRIMARY KEY (TestSuite, TestSet, TestID))')
+        return connection
+
+    @staticmethod
+    def update(inTestSuite: str):
+        """
+        Indexes the Result-sets of the given Testsuite, Only new or changed files are read \n
+        :param inTestSuite: Name of the Testsuite
+        :return: Returns the number of Result-sets indexed or re-indexed
+        """
+        resultSetsPath = os.path.join(m_OutputFolder, inTestSuite, m_ResultSets)
+        if not os.path.exists(resultSetsPath):
+            return 0
+        with ResultSetCatalog._connect() as connection:
+            indexedFiles = {(testSet, testID): (path, size, mtime) for testSet, testID, path, size, mtime in
+                            connection.execute('SELECT TestSet, TestID, Path, Size, MTime FROM ResultSets '
+                                               'WHERE TestSuite = ?', (inTestSuite,))}
+            presentFiles = dict()
+            for entry in os.scandir(resultSetsPath):
+                match = m_ResultSetFileRegex.match(entry.name)
+                if match is None or not entry.is_file():
+                    continue
+                key = (match.group('TestSet'), int(match.group('TestID')))
+                entryStat = entry.stat()
+                # Both compressed and uncompressed variants might be present, The latest one wins
+                if key not in presentFiles or presentFiles[key][2] < entryStat.st_mtime:
+                    presentFiles[key] = (os.path.abspath(entry.path), entryStat.st_size, entryStat.st_mtime)
+
+            updatedEntries = list()
+            for key, fileInfo in presentFiles.items():
+                if indexedFiles.get(key) == fileInfo:
+                    continue
+                try:
+                    rowDescriptionsCount, rowCount, columns, rows, bytesRead = \
+                        ResultSetGenerator._readResultSet(fileInfo[0], 0)
+                except (Etree.ParseError, OSError, EOFError, TypeError, ValueError, AttributeError, IndexError):
+                    # Touchstone might be still writing it, Indexed without the descriptors for now
+                    rowCount, columns = None, None
+                updatedEntries.append((inTestSuite, key[0], key[1], fileInfo[0], fileInfo[1], fileInfo[2], rowCount,
+                                       json.dumps(columns) if columns is not None else None))
+            connection.executemany('INSERT OR REPLACE INTO ResultSets VALUES (?, ?, ?, ?, ?, ?, ?, ?)', updatedEntries)
+            connection.executemany('DELETE FROM ResultSets WHERE TestSuite = ? AND TestSet = ? AND TestID = ?',
+                                   [(inTestSuite, testSet, testID) for testSet, testID in indexedFiles
+                                    if (testSet, testID) not in presentFiles])
+        return len(updatedEntries)
+
+    @staticmethod
+    def getEntry(inTestSuite: str, inTestSet: str, inTestID: int):
+        """
+        Finds the indexed Result-set of the given test \n
+        :return: Returns the Mapping of Path, Size, MTime, RowCount & Columns if indexed else None
+        """
+        with ResultSetCatalog._connect() as connection:
+            entry = connection.execute('SELECT Path, Size, MTime, RowCount, Columns FROM ResultSets WHERE TestSuite = ? '
+                                       'AND TestSet = ? AND TestID = ?', (inTestSuite, inTestSet, inTestID)).fetchone()
+        if entry is None:
+            return None
+        return {
+            'Path': entry[0],
+            'Size': entry[1],
+            'MTime': entry[2],
+            'RowCount': entry[3],
+            'Columns': json.loads(entry[4]) if entry[4] is not None else None
+        }
+
+    @staticmethod
+    def getPath(inTestSuite: str, inTestSet: str, inTestID: int):
+        """Returns the path of the indexed Result-set of the given test, None if not indexed"""
+        entry = ResultSetCatalog.getEntry(inTestSuite, inTestSet, inTestID)
+        return entry['Path'] if entry is not None else None
+
+    @staticmethod
+    def hasResultSets(inTestSuite: str, inTestSet: str = None, inSince: float = None):
+        """
+        Checks whether any Result-set is indexed for the given Testsuite or Test-set \n
+        :param inTestSuite: Name of the Testsuite
+        :param inTestSet: Name of the Test-set, All the Test-sets if not specified
+        :param inSince: Only Result-sets written at or after this time are considered so that stale ones are ignored
+        :return: Returns True if found else False
+        """
+        query = 'SELECT 1 FROM ResultSets WHERE TestSuite = ?'
+        params = [inTestSuite]
+        if inTestSet is not None:
+            query += ' AND TestSet = ?'
+            params.append(inTestSet)
+        if inSince is not None:
+            query += ' AND MTime >= ?'
+            params.append(inSince)
+        with ResultSetCatalog._connect() as connection:
+            return connection.execute(query + ' LIMIT 1', params).fetchone() is not None
+
+    @staticmethod
+    def getEntries(inTestSuite: str, inTestSet: str = None, inSince: float = None):
+        """
+        Finds the indexed Result-sets of the given Testsuite or Test-set \n
+        :param inTestSuite: Name of the Testsuite
+        :param inTestSet: Name of the Test-set, All the Test-sets if not specified
+        :param inSince: Only Result-sets written at or after this time are considered so that stale ones are ignored
+        :return: Returns the list of (Test-set, Test ID, MTime) ordered by MTime
+        """
+        query = 'SELECT TestSet, TestID, MTime FROM ResultSets WHERE TestSuite = ?'
+        params = [inTestSuite]
+        if inTestSet is not None:
+            query += ' AND TestSet = ?'
+            params.append(inTestSet)
+        if inSince is not None:
+            query += ' AND MTime >= ?'
+            params.append(inSince)
+        with ResultSetCatalog._connect() as connection:
+            return connection.execute(query + ' ORDER BY MTime', params).fetchall()
+
+    @staticmethod
+    def getMissingTestIDs(inTestSuite: str, inTestSet: str, inTestIDs: list, inSince: float = None):
+        """
+        Finds the tests having no indexed Result-set \n
+        :param inTestSuite: Name of the Testsuite
+        :param inTestSet: Name of the Test-set
+        :param inTestIDs: Test IDs expected to have the Result-set
+        :param inSince: Only Result-sets written at or after this time are considered so that stale ones are ignored
+        :return: Returns the list of Test IDs without Result-set
+        """
+        query = 'SELECT TestID FROM ResultSets WHERE TestSuite = ? AND TestSet = ?'
+        params = [inTestSuite, inTestSet]
+        if inSince is not None:
+            query += ' AND MTime >= ?'
+            params.append(inSince)
+        with ResultSetCatalog._connect() as connection:
+            indexedIDs = {testID for testID, in connection.execute(query, params)}
+        return [testID for testID in inTestIDs if testID not in indexedIDs]
+
+
+class TestSetIndex:
+    """
+    Represents the Index of the Test-sets within the Test Definitions workspace i.e. the last Test ID, the hashes of the
+    queries and the offset of the closing `</TestSet>` of each Test-set file, kept in `Output/TestSetIndex.json` and
+    re-read only for the files changed since.
+    """
+
+    def __init__(self, inTestDefinitionsLocation: str):
+        """
+        :param inTestDefinitionsLocation: Location of the workspace having `<Testsuite>/TestSets/<Test-set>.xml`
+        """
+        self.testDefinitionsLocation = inTestDefinitionsLocation
+        self.indexPath = os.path.join(m_OutputFolder, m_TestSetIndex)
+        self.entries = dict()
+        if os.path.exists(self.indexPath):
+            with open(self.indexPath, 'r') as file:
+                self.entries = json.load(file)
+        self.appendedTests = 0
+        self.skippedTests = 0
+
+    @staticmethod
+    def hashQuery(inQuery: str):
+        return hashlib.sha1(canonicalizeQuery(inQuery).encode('utf-8')).hexdigest()
+
+    def getTestSetPath(self, inTestSuite: str, inTestSet: str):
+        return os.path.abspath(os.path.join(self.testDefinitionsLocation, inTestSuite, m_TestSets,
+                                            inTestSet + m_TestFilesExtension))
+
+    def getEntry(self, inTestSuite: str, inTestSet: str):
+        """
+        Finds the Index entry of the given Test-set, Reads the Test-set file only if changed since indexed \n
+        :param inTestSuite: Name of the Testsuite
+        :param inTestSet: Name of the Test-set
+        :return: Returns Dictionary having LastID, QueryHashes, CloseOffset & Newline of the Test-set, None if the
+        Test-set does not exist in the workspace
+        """
+        testSetPath = self.getTestSetPath(inTestSuite, inTestSet)
+        if not os.path.exists(testSetPath):
+            self.entries.pop(testSetPath, None)
+            return None
+        stat = os.stat(testSetPath)
+        entry = self.entries.get(testSetPath)
+        if entry is None or entry['Size'] != stat.st_size or entry['MTime'] != stat.st_mtime_ns:
+            with open(testSetPath, 'rb') as file:
+                content = file.read()
+            tests = m_TestRegex.findall(content.decode('utf-8'))
+            entry = {'Size': stat.st_size, 'MTime': stat.st_mtime_ns,
+                     'LastID': max([int(testID) for testID, query in tests], default=0),
+                     'QueryHashes': sorted({TestSetIndex.hashQuery(query) for testID, query in tests}),
+                     'CloseOffset': content.rfind(m_TestSetEndTag),
+                     'Newline': '\r\n' if b'\r\n' in content else '\n'}
+            self.entries[testSetPath] = entry
+        return entry
+
+    def assignStartingIDs(self, inRequiredTestSuites: dict):
+        """
+        Assigns the Starting ID of every Test-set following the last Test ID within the workspace \n
+        :param inRequiredTestSuites: Testsuite and Test-set & Starting ID Mapping
+        :return: Returns Testsuite and Test-set & Starting ID Mapping, The given Starting ID is kept for the Test-sets
+        not in the workspace yet
+        """
+        requiredTestSuites = dict()
+        for testSuite, testSets in inRequiredTestSuites.items():
+            requiredTestSuites[testSuite] = dict()
+            for testSet, startingID in testSets.items():
+                entry = self.getEntry(testSuite, testSet)
+                requiredTestSuites[testSuite][testSet] = entry['LastID'] + 1 \
+                    if entry is not None and entry['LastID'] > 0 else startingID
+        return requiredTestSuites
+
+    def findNewQueries(self, inTestSuite: str, inTestSet: str, inQueries: list):
+        """
+        Skips the queries already present within the Test-set of the workspace or repeated within the given ones \n
+        :param inTestSuite: Name of the Testsuite
+        :param inTestSet: Name of the Test-set
+        :param inQueries: List of queries
+        :return: Returns the list of queries to append
+        """
+        entry = self.getEntry(inTestSuite, inTestSet)
+        queryHashes = set(entry['QueryHashes']) if entry is not None else set()
+        newQueries = list()
+        for query in inQueries:
+            queryHash = TestSetIndex.hashQuery(query)
+            if queryHash not in queryHashes:
+                queryHashes.add(queryHash)
+                newQueries.append(query)
+        if len(newQueries) < len(inQueries):
+            self.skippedTests += len(inQueries) - len(newQueries)
+            print(f"Skipped {len(inQueries) - len(newQueries)} tests of {inTestSet} already present in "
+                  f"{self.getTestSetPath(inTestSuite, inTestSet)}")
+        return newQueries
+
+    def append(self, inTestSuite: str, inTestSet: str, inTests: list):
+        """
+        Appends the tests in place to the Test-set of the workspace i.e. writes them over the closing `</TestSet>`
+        followed by the rest of the file, Creates the Test-set if not present yet. Tests whose query is already present
+        are left out, as the ones of `SQL_SELECT_ALL` are written to the Output whatever the workspace \n
+        :param inTestSuite: Name of the Testsuite
+        :param inTestSet: Name of the Test-set
+        :param inTests: List of (Test ID, SQL Query, `Test` element as written within a Test-set)
+        """
+        testSetPath = self.getTestSetPath(inTestSuite, inTestSet)
+        entry = self.getEntry(inTestSuite, inTestSet)
+        if entry is not None and entry['CloseOffset'] >= 0:
+            queryHashes = set(entry['QueryHashes'])
+            inTests = [test for test in inTests if TestSetIndex.hashQuery(test[1]) not in queryHashes]
+        if len(inTests) == 0:
+            return
+        if entry is None or entry['CloseOffset'] < 0:
+            if entry is not None:
+                print(f"Warning: {testSetPath} has no closing `</TestSet>`, Rewriting it")
+            os.makedirs(os.path.dirname(testSetPath), exist_ok=True)
+            copyfile(os.path.join(m_OutputFolder, inTestSuite, m_TestSets, inTestSet + m_TestFilesExtension),
+                     testSetPath)
+        else:
+            tests = ''.join(testElement for testID, query, testElement in inTests).replace(
+                '\n', entry['Newline']).encode('utf-8')
+            with open(testSetPath, 'r+b') as file:
+                file.seek(entry['CloseOffset'])
+                remaining = file.read()
+                file.seek(entry['CloseOffset'])
+                file.write(tests)
+                file.write(remaining)
+            stat = os.stat(testSetPath)
+            entry.update({'Size': stat.st_size, 'MTime': stat.st_mtime_ns,
+                          'LastID': max([entry['LastID']] + [testID for testID, query, testElement in inTests]),
+                          'QueryHashes': sorted(queryHashes.union(
+                              TestSetIndex.hashQuery(query) for testID, query, testElement in inTests)),
+                          'CloseOffset': entry['CloseOffset'] + len(tests)})
+        self.appendedTests += len(inTests)
+        print(f"Appended {len(inTests)} tests to {testSetPath} from ID {inTests[0][0]}")
+
+    def save(self):
+        temporaryPath = self.indexPath + '.tmp'
+        with open(temporaryPath, 'w') as file:
+            json.dump(self.entries, file)
+        os.replace(temporaryPath, self.indexPath)
+
 
 class ResultSetGenerator:
-    def __init__(self, in_filepath):
+    def __init__(self, in_filepath, in_workers: int = 1, in_time_budget: float = None,
+                 in_selection: RunSelection = None, in_chunk_size: int = None, in_refresh_samples: bool = False,
+                 in_coalesce: bool = False):
         self.inputFileName = in_filepath
         self.inputFile = InputReader(in_filepath)
+        self.workers = in_workers
+        self.timeBudget = in_time_budget
+        self.selection = in_selection
+        self.chunkSize = in_chunk_size
+        self.refreshSamples = in_refresh_samples
+        # If set to True, Small Work Units are coalesced into one Touchstone run whenever it shortens the run
+        self.coalesce = in_coalesce
 
     def run(self):
-        if TestSetGenerator(self.inputFileName).run():
-            for testSuite in self.inputFile.getRequiredTestSuites():
-                if not ResultSetGenerator.executeTestSuite(testSuite):
-                    print(f"Error: {testSuite} could not be generated!")
+        testSetGenerator = TestSetGenerator(self.inputFileName, self.timeBudget, self.selection, self.chunkSize,
+                                            self.refreshSamples)
+        if testSetGenerator.run():
+            # Tests of the Tables not selected keep their Result-sets, hence are not executed again
+            keptTestIDs = {unit: set(testIDs) for unit, testIDs in testSetGenerator.keptTestIDs.items()}
+            # Identical queries across the Test-sets are executed only once
+            requiredTestSuites = self.inputFile.getRequiredTestSuites()
+            if self.selection is not None and self.selection.isRestricted():
+                # `SQL_SELECT_ALL` kept only for sampling has been executed while generating the Test-sets already
+                requiredTestSuites = self.selection.filterTestSuites(requiredTestSuites, withPrerequisites=False)
+            tests = dict()
+            for testSuite, testSets in requiredTestSuites.items():
+                # Queries of the performance Test-sets are timed, so each of them is executed whatever the duplicates
+                for testSet in [testSet for testSet in testSets if testSet not in m_PerformanceTestSets]:
+                    for testID, query in ResultSetGenerator.getTests(testSuite, testSet).items():
+                        if testID not in keptTestIDs.get((testSuite, testSet), ()):
+                            tests[(testSuite, testSet, testID)] = query
+            deduplicator = QueryDeduplicator(tests)
+            testSuiteFileNames, unitExclusions = dict(), dict()
+            for testSuite, testSets in requiredTestSuites.items():
+                exclusions = deduplicator.getExclusions(testSuite)
+                for testSet in testSets:
+                    if (testSuite, testSet) in keptTestIDs:
+                        exclusions.setdefault(testSet, list()).extend(
+                            (startID, endID, 'Table not selected')
+                            for startID, endID in toIDRanges(keptTestIDs[(testSuite, testSet)]))
+                unitExclusions.update({(testSuite, testSet): exclusions[testSet] for testSet in exclusions})
+                if len(exclusions) > 0:
+                    TestWriter.writeTestSuites({testSuite: testSets}, exclusions, m_DeduplicatedTestSuite)
+                    testSuiteFileNames[testSuite] = m_DeduplicatedTestSuite
+
+            # Every Test-set is a Work Unit, scheduled Longest-first as per the Run History
+            runHistory = RunHistory(m_OutputFolder)
+            predictedSeconds, unitTestIDs, timeouts, testEnvFileNames = dict(), dict(), dict(), dict()
+            performanceSeconds = dict()
+            for testSuite, testSets in requiredTestSuites.items():
+                for testSet in testSets:
+                    if testSet in m_PerformanceTestSets:
+                        primaryTestIDs = [testID for testID in ResultSetGenerator.getTestIDs(testSuite, testSet)
+                                          if testID not in keptTestIDs.get((testSuite, testSet), ())]
+                    else:
+                        primaryTestIDs = [testID for testSuiteName, testSetName, testID in deduplicator.primaryTests
+                                          if testSuiteName == testSuite and testSetName == testSet]
+                    # Test-sets made of duplicate queries only are served entirely from the shared Result-sets
+                    if len(primaryTestIDs) > 0:
+                        unit = (testSuite, testSet)
+                        (performanceSeconds if testSet in m_PerformanceTestSets else predictedSeconds)[unit] = \
+                            runHistory.predictSeconds(testSuite, testSet, primaryTestIDs)
+                        unitTestIDs[unit] = primaryTestIDs
+                        # Timeout of each Work Unit follows the observed latency of its tests
+                        timeouts[unit] = runHistory.deriveTimeout(testSuite, testSet, primaryTestIDs,
+                                                                  self.inputFile.getTimeoutHeadroom())
+                        testEnvFileNames[unit] = ResultSetGenerator.writeUnitTestEnv(
+                            self.inputFile.getConnectionString(), testSuite, testSet, timeouts[unit],
+                            inTestCount=len(primaryTestIDs),
+                            inTimeoutRate=runHistory.getTimeoutRate(testSuite, testSet))
+            # File system time granularity might put the Result-sets slightly before the start of the run
+            runStartTime = time.time() - 2
+
+            # Small Work Units are run as batches of one Touchstone run each wherever it shortens the run
+            batches = TestScheduler.coalesce(predictedSeconds, self.workers) if self.coalesce else list()
+            batchIndexes = {tuple(batch): index for index, batch in enumerate(batches, 1)}
+            scheduledSeconds = {unit: seconds for unit, seconds in predictedSeconds.items()
+                                if not any(unit in batch for batch in batches)}
+            for batch in batchIndexes:
+                scheduledSeconds[batch] = m_StartupSeconds + sum(max(predictedSeconds[unit] - m_StartupSeconds, 0.0)
+                                                                 for unit in batch)
+            if len(batches) > 0:
+                print(f"Coalesced {sum(map(len, batches))} small Work Units into {len(batches)} Touchstone runs")
+
+            def executeUnit(inUnit):
+                if inUnit in batchIndexes:
+                    return ResultSetGenerator.executeCoalescedUnits(
+                        batchIndexes[inUnit], list(inUnit), unitExclusions, self.inputFile.getConnectionString(),
+                        max(timeouts[unit] for unit in inUnit))
+                return ResultSetGenerator.executeTestSuite(inUnit[0], inUnit[1],
+                                                           testSuiteFileNames.get(inUnit[0], m_TestSuite),
+                                                           testEnvFileNames[inUnit])
+
+            with m_Stream.phase('Execute', Units=len(scheduledSeconds)):
+                results = TestScheduler.run(scheduledSeconds, self.workers, executeUnit)
+            for batch in batchIndexes:
+                results.update(results.pop(batch))
+            if len(performanceSeconds) > 0:
+                # Performance Test-sets run one at a time once the rest is done, so their timings are not skewed by
+                # the load of the other Work Units
+                performanceStartTime = time.time() - 2
+                with m_Stream.phase('ExecutePerformance', Units=len(performanceSeconds)):
+                    results.update(TestScheduler.run(performanceSeconds, 1, executeUnit))
+            with m_Stream.phase('Retry'):
+                missingTests = self.retryTimedOutTests(unitTestIDs, timeouts, runStartTime, results)
+            with m_Stream.phase('ShareResultSets'):
+                ResultSetGenerator.shareResultSets(deduplicator)
+            if len(performanceSeconds) > 0:
+                self.reportPerformance({unit: unitTestIDs[unit] for unit in performanceSeconds}, performanceStartTime)
+
+            hadFailure = False
+            # Baselines are hashed in a canonical form, so only the ones actually changed are copied to the workspace
+            baselineStore, baselineChanges = BaselineStore(m_OutputFolder), dict()
+            for testSuite, testSets in requiredTestSuites.items():
+                failedTestSets = [testSet for testSet in testSets if not results.get((testSuite, testSet), True)]
+                if len(failedTestSets) > 0:
+                    print(f"Error: {testSuite} could not be generated for {', '.join(failedTestSets)}!")
+                    hadFailure = True
+                else:
+                    # Tests still without Result-set fail alone, The Result-sets of the rest of the Testsuite are kept
+                    for testSet in testSets:
+                        if (testSuite, testSet) in missingTests:
+                            print(f"Error: {testSuite}/{testSet} has no Result-set for the tests "
+                                  f"{', '.join(map(str, missingTests[(testSuite, testSet)]))}!")
+                            hadFailure = True
+                    if self.inputFile.getCompression(testSuite) is not None:
+                        with m_Stream.phase('Compress', TestSuite=testSuite):
+                            ResultSetGenerator.compressResultSets(testSuite, self.inputFile.getCompression(testSuite))
+                    with m_Stream.phase('SyncBaselines', TestSuite=testSuite):
+                        baselineChanges[testSuite] = ResultSetGenerator.syncBaselines(
+                            baselineStore, testSuite, runStartTime, self.inputFile.getTestDefinitionsLocation())
+            if len(baselineChanges) > 0:
+                baselineStore.report(baselineChanges)
+            return not hadFailure
+        return False
+
+    def reportPerformance(self, inUnitTestIDs: dict, inSince: float):
+        """
+        Records the timing of every query of the performance Test-sets executed in the Performance History and flags
+        the queries slower than in the previous run beyond the `PerformanceRegressionThreshold` \n
+        :param inUnitTestIDs: Work Unit and list of Test IDs executed Mapping of the performance Test-sets
+        :param inSince: Start time of the runs of the performance Test-sets
+        :return: Returns the list of (Testsuite, Test-set, SQL Query, Baseline Seconds, Seconds) of the regressions
+        """
+        runHistory = RunHistory(m_OutputFolder)
+        timings = list()
+        for (testSuite, testSet), testIDs in inUnitTestIDs.items():
+            # Tests without a Result-set of this run have no timing of this run either
+            missingIDs = set(ResultSetCatalog.getMissingTestIDs(testSuite, testSet, testIDs, inSince))
+            testSeconds = runHistory.getTestSeconds(testSuite, testSet)
+            queries = ResultSetGenerator.getTests(testSuite, testSet)
+            timings.extend((testSuite, testSet, queries[testID], testSeconds[testID]) for testID in testIDs
+                           if testID not in missingIDs and testID in testSeconds and testID in queries)
+        regressions = PerformanceHistory(m_OutputFolder).report(timings,
+                                                                self.inputFile.getPerformanceRegressionThreshold())
+        print(f"Recorded the timings of {len(timings)} performance queries, {len(regressions)} regressions")
+        for testSuite, testSet, query, baselineSeconds, seconds in regressions:
+            print(f"Warning: Performance regression in {testSuite}/{testSet}: {baselineSeconds:.2f}s -> "
+                  f"{seconds:.2f}s for {query}")
+        return regressions
+
+    def retryTimedOutTests(self, inUnitTestIDs: dict, inTimeouts: dict, inSince: float, ioResults: dict):
+        """
+        Re-runs the tests of every Work Unit which timed out or were never run due to the timeouts, in a separate run
+        with a higher timeout, so that a few slow queries do not fail the whole baseline. A Work Unit fails only if none
+        of its tests has a Result-set, The tests still missing are returned to be reported on their own \n
+        :param inUnitTestIDs: Work Unit and list of Test IDs executed Mapping
+        :param inTimeouts: Work Unit and timeout of its run Mapping
+        :param inSince: Start time of the runs
+        :param ioResults: Work Unit and Result Mapping, Updated with the results of the re-runs
+        :return: Returns Work Unit and list of Test IDs still without Result-set Mapping
+        """
+        missingTests = dict()
+        runHistory = RunHistory(m_OutputFolder)
+        for (testSuite, testSet), testIDs in inUnitTestIDs.items():
+            missingIDs = ResultSetCatalog.getMissingTestIDs(testSuite, testSet, testIDs, inSince)
+            runHistory.recordTimeouts(testSuite, testSet, len(testIDs), len(missingIDs))
+            if len(missingIDs) == 0:
+                continue
+            timeout = getRetryTimeout(inTimeouts[(testSuite, testSet)])
+            print(f"Warning: {len(missingIDs)} tests of {testSuite}/{testSet} timed out or did not run, "
+                  f"re-running those with a timeout of {timeout}s")
+            missingIDSet = set(missingIDs)
+            exclusions = [(startID, endID, 'Completed within the first run') for startID, endID in
+                          toIDRanges([testID for testID in ResultSetGenerator.getTestIDs(testSuite, testSet)
+                                      if testID not in missingIDSet])]
+            testSuiteFileName = f"TestSuite_Retry_{testSet}{m_TestFilesExtension}"
+            TestWriter.writeTestSuites({testSuite: [testSet]}, {testSet: exclusions}, testSuiteFileName)
+            # Every test of the re-run timed out once, so Touchstone must not give up on those timing out again
+            testEnvFileName = ResultSetGenerator.writeUnitTestEnv(self.inputFile.getConnectionString(), testSuite,
+                                                                  testSet, timeout, '_Retry', len(missingIDs), 1.0)
+            retryStartTime = time.time() - 2
+            ResultSetGenerator.executeTestSuite(testSuite, testSet, testSuiteFileName, testEnvFileName)
+            stillMissingIDs = ResultSetCatalog.getMissingTestIDs(testSuite, testSet, missingIDs, retryStartTime)
+            if len(stillMissingIDs) > 0:
+                print(f"Error: {len(stillMissingIDs)} tests of {testSuite}/{testSet} timed out with {timeout}s as "
+                      f"well i.e. {', '.join(map(str, stillMissingIDs))}")
+                missingTests[(testSuite, testSet)] = stillMissingIDs
+            # Result-sets of the tests completed in either run are still a baseline, whatever the first run returned
+            ioResults[(testSuite, testSet)] = len(stillMissingIDs) < len(testIDs)
+        return missingTests
 
     @staticmethod
-    def executeTestSuite(inTestSuite: str, withSpecificTestSet: str = None):
+    def writeUnitTestEnv(inConnectionString: str, inTestSuite: str, inTestSet: str, inTimeout: int,
+                         inSuffix: str = '', inTestCount: int = None, inTimeoutRate: float = None):
+        """
+        Writes the Test Env File of a Work Unit with the given timeout and the limits of the timeouts derived from its
+        tests \n
+        :param inConnectionString: Connection String
+        :param inTestSuite: Name of the Testsuite
+        :param inTestSet: Name of the Test-set
+        :param inTimeout: Timeout of a query in seconds
+        :param inSuffix: Suffix of the file name i.e. of a re-run
+        :param inTestCount: Number of tests of the Work Unit, None to keep the default limits of the timeouts
+        :param inTimeoutRate: Fraction of the tests of the Work Unit expected to time out, None if never observed
+        :return: Returns the name of the Test Env File, The default one if it could not be written
+        """
+        testEnvFileName = f"{os.path.splitext(m_TestEnv)[0]}_{inTestSuite}_{inTestSet}{inSuffix}{m_TestFilesExtension}"
+        maxConsecutiveTimeouts, maxAccumulatedTimeouts = deriveTimeoutLimits(inTestCount, inTimeoutRate) \
+            if inTestCount is not None else (m_MaxConsecutiveTimeouts, m_MaxAccumulatedTimeouts)
+        if TestWriter.writeTestEnv(os.path.abspath(os.path.join(m_OutputFolder, m_EnvsFolder)), inConnectionString,
+                                   inTimeout, testEnvFileName, maxConsecutiveTimeouts, maxAccumulatedTimeouts):
+            return testEnvFileName
+        return m_TestEnv
+
+    @staticmethod
+    def shareResultSets(inDeduplicator: QueryDeduplicator):
+        """
+        Copies the Result-set of each executed unique query to every test having the same query \n
+        :param inDeduplicator: Deduplication plan of the run
+        :return: Returns the number of Result-sets shared
+        """
+        for testSuite in {testSuite for testSuite, testSet, testID in inDeduplicator.primaryTests}:
+            ResultSetCatalog.update(testSuite)
+        sharedResultSets = 0
+        updatedTestSuites = set()
+        for (testSuite, testSet, testID), (primarySuite, primarySet, primaryID) in \
+                inDeduplicator.duplicateTests.items():
+            primaryPath = ResultSetCatalog.getPath(primarySuite, primarySet, primaryID)
+            if primaryPath is None:
+                print(f"Error: Result-set of {primarySet}-{primaryID} to share with {testSet}-{testID} not found")
+                continue
+            # Keeps the compression extension, if any, of the executed Result-set
+            extension = primaryPath[primaryPath.rindex(m_TestFilesExtension) + len(m_TestFilesExtension):]
+            copyfile(primaryPath, os.path.join(m_OutputFolder, testSuite, m_ResultSets,
+                                               ResultSetGenerator.getResultSetFileName(testSet, testID) + extension))
+            sharedResultSets += 1
+            updatedTestSuites.add(testSuite)
+        for testSuite in updatedTestSuites:
+            ResultSetCatalog.update(testSuite)
+        print(f"Executed {len(inDeduplicator.primaryTests)} unique queries, {inDeduplicator.getSavedExecutions()} "
+              f"executions saved by sharing {sharedResultSets} Result-sets")
+        return sharedResultSets
+
+    @staticmethod
+    def getResultSetFileName(inTestSet: str, inTestID: int):
+        """Returns the name of the Result-set file Touchstone generates for the given test"""
+        return f"{inTestSet}-SQL_QUERY-{inTestID}{m_TestFilesExtension}"
+
+    @staticmethod
+    def getTests(inTestSuite: str, inTestSet: str):
+        """
+        Finds the tests written in the given Test-set \n
+        :param inTestSuite: Name of the Testsuite
+        :param inTestSet: Name of the Test-set
+        :return: Returns Test ID and SQL Query Mapping
+        """
+        testSetPath = os.path.join(m_OutputFolder, inTestSuite, m_TestSets, inTestSet + m_TestFilesExtension)
+        if os.path.exists(testSetPath):
+            with open(testSetPath, 'r', encoding='utf-8') as file:
+                return {int(testID): query for testID, query in m_TestRegex.findall(file.read())}
+        return dict()
+
+    @staticmethod
+    def getTestIDs(inTestSuite: str, inTestSet: str):
+        """
+        Finds the IDs of the tests written in the given Test-set \n
+        :param inTestSuite: Name of the Testsuite
+        :param inTestSet: Name of the Test-set
+        :return: Returns the list of Test IDs
+        """
+        return list(ResultSetGenerator.getTests(inTestSuite, inTestSet).keys())
+
+    @staticmethod
+    def executeTestSuite(inTestSuite: str, withSpecificTestSet: str = None, inTestSuiteFileName: str = m_TestSuite,
+                         inTestEnvFileName: str = m_TestEnv):
         """
         Runs Touchstone test for given testsuite \n
         :param withSpecificTestSet: Name of test-set to run Touchstone for that particular test-set only
         :param inTestSuite: Name of the Testsuite
+        :param inTestSuiteFileName: Name of the Testsuite file to run i.e. a Shard of the Testsuite
+        :param inTestEnvFileName: Name of the Test Env file within `Envs` i.e. of a Work Unit
         :return: True if succeeded else False
         """
         if len(inTestSuite) > 0:
-            touchstone_cmd = f"{m_TouchStone} -te {m_EnvsFolder}\\{m_TestEnv} " \
-                             f"-ts {inTestSuite}\\{m_TestSuite} -o {inTestSuite}"
-            if withSpecificTestSet is not None and len(withSpecificTestSet) > 0:
-                touchstone_cmd += f" -rts {withSpecificTestSet}"
-            currentDir = os.path.abspath(os.curdir)
-            os.chdir(m_OutputFolder)
-            subprocess.call(touchstone_cmd)
-            os.chdir(currentDir)
-            return True if len(os.listdir(os.path.join(os.path.join(m_OutputFolder, inTestSuite), m_ResultSets))) > 0 \
-                else False
+            # File system time granularity might put the Result-sets slightly before the start of the run
+            startTime = time.time() - 2
+            ResultSetGenerator._runTouchstone(inTestSuite, withSpecificTestSet, inTestSuiteFileName, inTestEnvFileName)
+            ResultSetCatalog.update(inTestSuite)
+            ResultSetGenerator.recordHistory(inTestSuite, withSpecificTestSet, startTime + 2)
+            return ResultSetCatalog.hasResultSets(inTestSuite, withSpecificTestSet, startTime)
         else:
             print('Error: Invalid Testsuite Name')
 
+    @staticmethod
+    def executeCoalescedUnits(inBatchIndex: int, inUnits: list, inExclusions: dict, inConnectionString: str,
+                              inTimeout: int):
+        """
+        Runs the Test-sets of several Work Units in one Touchstone run, so that Touchstone starts and connects once, and
+        routes their Result-sets back to the `ResultSets` of the Testsuite each Test-set belongs to \n
+        :param inBatchIndex: Index of the batch within the run
+        :param inUnits: List of (Testsuite, Test-set), Test-sets must be distinct
+        :param inExclusions: (Testsuite, Test-set) and list of (StartID, EndID, Reason) Mapping of the tests to exclude
+        :param inConnectionString: Connection String
+        :param inTimeout: Timeout of a query in seconds
+        :return: Returns Work Unit and Result Mapping
+        """
+        batchFolder = f"{m_CoalescedFolder}_{inBatchIndex}"
+        batchResultSetsPath = os.path.join(m_OutputFolder, batchFolder, m_ResultSets)
+        rmtree(os.path.join(m_OutputFolder, batchFolder), ignore_errors=True)
+        os.makedirs(batchResultSetsPath)
+        if not TestWriter.writeCoalescedTestSuite(batchFolder, inUnits, inExclusions):
+            return {unit: False for unit in inUnits}
+        testEnvFileName = ResultSetGenerator.writeUnitTestEnv(inConnectionString, m_CoalescedFolder, str(inBatchIndex),
+                                                              inTimeout)
+        # File system time granularity might put the Result-sets slightly before the start of the run
+        startTime = time.time() - 2
+        ResultSetGenerator._runTouchstone(batchFolder, None, m_TestSuite, testEnvFileName)
+        # Moved as they are, so the modification times still tell the order of the tests within the run
+        testSuites = {testSet: testSuite for testSuite, testSet in inUnits}
+        for entry in os.scandir(batchResultSetsPath):
+            match = m_ResultSetFileRegex.match(entry.name)
+            if match is not None and match.group('TestSet') in testSuites:
+                os.replace(entry.path, os.path.join(m_OutputFolder, testSuites[match.group('TestSet')], m_ResultSets,
+                                                    entry.name))
+        for testSuite in set(testSuites.values()):
+            ResultSetCatalog.update(testSuite)
+        ResultSetGenerator.recordCoalescedHistory(inUnits, startTime + 2)
+        return {unit: ResultSetCatalog.hasResultSets(unit[0], unit[1], startTime) for unit in inUnits}
+
+    @staticmethod
+    def recordCoalescedHistory(inUnits: list, inStartTime: float):
+        """
+        Records the wall time of each test of a coalesced run and of each of its Work Units in the Run History. \n
+        Time of a test is derived from the time its Result-set landed after the previous one of the whole run, and the
+        time of a Work Unit is the time of its tests plus a startup, so that it is predicted as if it had been run on
+        its own \n
+        :param inUnits: List of (Testsuite, Test-set) of the run
+        :param inStartTime: Start time of the run
+        """
+        entries = sorted((mtime, testSuite, testSet, testID) for testSuite, unitTestSet in inUnits
+                         for testSet, testID, mtime in ResultSetCatalog.getEntries(testSuite, unitTestSet,
+                                                                                  inStartTime - 2))
+        testTimings, unitSeconds = dict(), {unit: m_StartupSeconds for unit in inUnits}
+        previousTime = inStartTime
+        for mtime, testSuite, testSet, testID in entries:
+            seconds = max(mtime - previousTime, 0.0)
+            testTimings.setdefault(testSuite, list()).append((testSet, testID, seconds))
+            unitSeconds[(testSuite, testSet)] += seconds
+            previousTime = max(mtime, previousTime)
+        runHistory = RunHistory(m_OutputFolder)
+        for testSuite, timings in testTimings.items():
+            runHistory.recordTests(testSuite, timings)
+        for (testSuite, testSet), seconds in unitSeconds.items():
+            runHistory.recordUnit(testSuite, testSet, seconds)
+
+    @staticmethod
+    def _runTouchstone(inTestSuite: str, withSpecificTestSet: str = None, inTestSuiteFileName: str = m_TestSuite,
+                       inTestEnvFileName: str = m_TestEnv):
+        """Runs Touchstone for the Testsuite file within the given folder of the Output folder and waits for it"""
+        # Touchstone is referred by its absolute path and runs within `Output` without changing the directory of
+        # this process, so that several Drivers or Testsuites can be executed concurrently
+        touchstone_cmd = f"\"{os.path.join(os.path.abspath(m_OutputFolder), m_TouchStone)}\" " \
+                         f"-te {m_EnvsFolder}\\{inTestEnvFileName} " \
+                         f"-ts {inTestSuite}\\{inTestSuiteFileName} -o {inTestSuite}"
+        if withSpecificTestSet is not None and len(withSpecificTestSet) > 0:
+            touchstone_cmd += f" -rts {withSpecificTestSet}"
+        # Result-sets landing while Touchstone runs tell its progress
+        with ResultSetTailer(m_Stream, f"{inTestSuite}/{withSpecificTestSet}" if withSpecificTestSet else inTestSuite,
+                             os.path.join(m_OutputFolder, inTestSuite, m_ResultSets),
+                             ResultSetGenerator.countTests(inTestSuite, inTestSuiteFileName, withSpecificTestSet)
+                             if m_Stream.isEnabled() else 0,
+                             m_ResultSetFileRegex, {withSpecificTestSet} if withSpecificTestSet else None):
+            subprocess.call(touchstone_cmd, cwd=os.path.abspath(m_OutputFolder))
+
+    @staticmethod
+    def countTests(inTestSuite: str, inTestSuiteFileName: str = m_TestSuite, withSpecificTestSet: str = None):
+        """
+        Counts the tests a Testsuite file runs i.e. the tests of its Test-sets but the excluded ones \n
+        :param inTestSuite: Name of the folder of the Testsuite file within the Output folder
+        :param inTestSuiteFileName: Name of the Testsuite file
+        :param withSpecificTestSet: Name of the only Test-set run, All the Test-sets if not specified
+        :return: Returns the number of tests, 0 if the Testsuite file could not be read
+        """
+        try:
+            testSuite = Etree.parse(os.path.join(m_OutputFolder, inTestSuite, inTestSuiteFileName)).getroot()
+        except (Etree.ParseError, OSError):
+            return 0
+        testCount = 0
+        for testSet in testSuite.iter('TestSet'):
+            if withSpecificTestSet and testSet.get('Name') != withSpecificTestSet:
+                continue
+            exclusions = [(int(exclusion.get('StartID')), int(exclusion.get('EndID')))
+                          for exclusion in testSet.iter('Exclusion')]
+            testSetPath = os.path.join(m_OutputFolder, testSet.get('SetFile'))
+            if os.path.exists(testSetPath):
+                with open(testSetPath, 'r', encoding='utf-8') as file:
+                    testCount += sum(1 for testID, query in m_TestRegex.findall(file.read())
+                                     if not any(startID <= int(testID) <= endID for startID, endID in exclusions))
+        return testCount
+
+    @staticmethod
+    def recordHistory(inTestSuite: str, inTestSet: str, inStartTime: float):
+        """
+        Records the wall time of the Touchstone run and of each of its tests in the Run History. \n
+        Time of a test is derived from the time its Result-set landed after the previous one \n
+        :param inTestSuite: Name of the Testsuite
+        :param inTestSet: Name of the Test-set run, None if the whole Testsuite was run
+        :param inStartTime: Start time of the run
+        """
+        runHistory = RunHistory(m_OutputFolder)
+        runHistory.recordUnit(inTestSuite, inTestSet, time.time() - inStartTime)
+        testTimings = list()
+        previousTime = inStartTime
+        for testSet, testID, mtime in ResultSetCatalog.getEntries(inTestSuite, inTestSet, inStartTime - 2):
+            testTimings.append((testSet, testID, max(mtime - previousTime, 0.0)))
+            previousTime = max(mtime, previousTime)
+        runHistory.recordTests(inTestSuite, testTimings)
+
     @staticmethod
     def _convertDataType(inData: str, inSQLtype: str):
         """
@@ -842,65 +2065,169 @@ class ResultSetGenerator:
             return f"\'{str(inData)}\'"
 
     @staticmethod
-    def parseResultSets(inMdefDiff: MDEF, inStartingID: int = 1):
+    def syncBaselines(inBaselineStore: BaselineStore, inTestSuite: str, inSince: float,
+                      inTestDefinitionsLocation: str = None):
+        """
+        Stores the Result-sets of the Testsuite written in this run and copies the changed ones to the workspace \n
+        :param inBaselineStore: Store of the baselines
+        :param inTestSuite: Name of the Testsuite
+        :param inSince: Start time of the run, Result-sets written before it are left out
+        :param inTestDefinitionsLocation: Workspace having `<Testsuite>/ResultSets`, Compared with the previous run only
+        if None
+        :return: Returns the changes of the baselines as per `BaselineStore.sync`
         """
-        Parses the `Result-sets` generated and maps to its relevant columns \n
+        resultSets = [(testSet, testID, ResultSetCatalog.getPath(inTestSuite, testSet, testID))
+                      for testSet, testID, mtime in ResultSetCatalog.getEntries(inTestSuite, inSince=inSince)]
+        workspaceResultSetsPath = os.path.join(inTestDefinitionsLocation, inTestSuite, m_ResultSets) \
+            if inTestDefinitionsLocation is not None else None
+        return inBaselineStore.sync(inTestSuite, [resultSet for resultSet in resultSets if resultSet[2] is not None],
+                                    workspaceResultSetsPath)
+
+    @staticmethod
+    def compressResultSets(inTestSuite: str, inCompression: str):
+        """
+        Compresses the Result-sets of the given Testsuite \n
+        :param inTestSuite: Name of the Testsuite
+        :param inCompression: Compression to use i.e. `gzip` or `lzma`
+        :return: Returns the number of bytes saved
+        """
+        resultSetsPath = os.path.join(m_OutputFolder, inTestSuite, m_ResultSets)
+        originalSize, compressedSize = 0, 0
+        for fileName in os.listdir(resultSetsPath):
+            if fileName.endswith(m_TestFilesExtension):
+                fileSizes = compressFile(os.path.join(resultSetsPath, fileName), inCompression)
+                originalSize += fileSizes[0]
+                compressedSize += fileSizes[1]
+        ResultSetCatalog.update(inTestSuite)
+        if originalSize > 0:
+            print(f"Compressed Result-sets of {inTestSuite} with {inCompression}: {originalSize} -> {compressedSize} "
+                  f"bytes, {originalSize - compressedSize} bytes saved")
+        return originalSize - compressedSize
+
+    @staticmethod
+    def _readResultSet(inFilePath: str, inMaxRows: int, inFastPath: bool = True, inOnRow=None, inOnColumns=None):
+        """
+        Reads the Column Descriptors & the first rows of the given Result-set while streaming through the file \n
+        :param inFilePath: Path of the Result-set, Might be compressed
+        :param inMaxRows: Maximum number of rows to read
+        :param inFastPath: If True, Uncompressed Result-sets are scanned as bytes and the XML Parser is used only if
+        the fast path cannot read them exactly
+        :param inOnRow: If provided, Called with every row of the Result-set
+        :param inOnColumns: If provided, Called with the List of (Name, Type) of Columns before the first row, Called
+        again whenever the XML Parser reads the rows once more after the fast path fell back to it
+        :return: Returns RowDescriptions Count, RowCount, List of (Name, Type) of Columns, List of Rows having
+        (IsNull, Value) of each Column and the number of bytes read
+        """
+        if inFastPath and inFilePath.endswith('.xml'):
+            resultSet = FastResultSetReader.readResultSet(inFilePath, inMaxRows, inOnRow, inOnColumns)
+            if resultSet is not None:
+                return resultSet
+        rowDescriptionsCount, rowCount = 0, 0
+        columns, rows = list(), list()
+        depth, rowDescriptionsDepth = 0, None
+        with openFile(inFilePath) as file:
+            for event, element in Etree.iterparse(file, events=('start', 'end')):
+                if event == 'start':
+                    depth += 1
+                    if element.tag == 'RowDescriptions':
+                        rowDescriptionsCount += 1
+                        rowCount = int(element.attrib.get('RowCount'))
+                        rowDescriptionsDepth = depth
+                        if inOnColumns is not None:
+                            inOnColumns(columns)
+                        if inMaxRows == 0 and inOnRow is None:
+                            # Only the descriptors are required which precede the rows
+                            break
+                    continue
+
+                if element.tag == 'Column':
+                    columns.append((element[0].text.strip(), element[1].attrib.get('Type').strip()))
+                    element.clear()
+                elif rowDescriptionsDepth is not None and depth == rowDescriptionsDepth + 1:
+                    if len(rows) < inMaxRows or inOnRow is not None:
+                        row = [(assure(columnValue.attrib, 'IsNull', ignoreError=True), columnValue.text)
+                               for columnValue in element]
+                        if len(rows) < inMaxRows:
+                            rows.append(row)
+                        if inOnRow is not None:
+                            inOnRow(row)
+                    element.clear()
+                elif element.tag == 'RowDescriptions':
+                    rowDescriptionsDepth = None
+                depth -= 1
+            bytesRead = file.tell()
+        return rowDescriptionsCount, rowCount, columns, rows, bytesRead
+
+    @staticmethod
+    def parseResultSets(inMdefDiff: MDEF, inStartingID: int = 1, inTableRowCounts: dict = None,
+                        inColumnSketches: dict = None, inSkippedTables: set = None):
+        """
+        Parses the `Result-sets` generated and maps to its relevant columns. Every row is read once and the values are
+        taken from a uniform Reservoir of the rows \n
         :param inMdefDiff: MDEF Difference as MDEF Instance
         :param inStartingID: Starting Testcase Id for `SQL_SELECT_ALL` Testset
+        :param inTableRowCounts: If provided, Filled with the Table Name and Row Count Mapping
+        :param inColumnSketches: If provided, Filled with the Table Name and Column Name & `ColumnSketch` Mapping
+        :param inSkippedTables: Names of the Tables whose Result-sets were not generated i.e. served from the Cache
         :return: Returns Table Columns Values Mapping
         """
         if inMdefDiff is not None:
             resultSetsPath = os.path.abspath(os.path.join(os.path.join(m_OutputFolder, TestSuites.Integration.name),
                                                           m_ResultSets))
             totalResultSets = len(inMdefDiff.Tables)
-            etree = None
             tableColumnValues = dict()
-            for testCaseId in range(inStartingID, inStartingID + totalResultSets):
-                if os.path.exists(os.path.join(resultSetsPath, f"{TestSets.SQL_SELECT_ALL.name}-SQL_QUERY-"
-                                                               f"{testCaseId}{m_TestFilesExtension}")):
-                    invalidRowDesc = True
-                    rowCount = 0
-                    with open(os.path.abspath(os.path.join(resultSetsPath, f"{TestSets.SQL_SELECT_ALL.name}-SQL_QUERY-"
-                                                                           f"{testCaseId}{m_TestFilesExtension}"))) as file:
-                        etree = Etree.fromstring(file.read().strip())
-                        rowDescriptions = None
-                        for child in etree.iter('RowDescriptions'):
-                            rowDescriptions = child
-                            invalidRowDesc = not invalidRowDesc
-                            rowCount = int(child.attrib.get('RowCount'))
-                        if invalidRowDesc:
-                            print('More than one RowDescriptions found in the resultset')
-                            return None
-                        if rowCount > 0:
-                            rowCount %= 30
-                            currTableName = inMdefDiff.Tables[testCaseId - inStartingID][MDEF.m_Name]
-                            tableColumnValues[currTableName] = dict()
-                            columnCount = 0
-                            for column in etree.iter('Column'):
-                                columnCount += 1
-                                columnName = column[0].text.strip()
-                                columnType = column[1].attrib.get('Type').strip()
-                                tableColumnValues[currTableName][columnName] = list()
-                                currColumnValues = set()
-                                if columnName in inMdefDiff.Tables[testCaseId - inStartingID][MDEF.m_Columns]:
-                                    for i in range(1, rowCount + 1):
-                                        columnValue = rowDescriptions[i - 1][columnCount - 1]
-                                        if not assure(columnValue.attrib, 'IsNull', ignoreError=True) and \
-                                                columnValue.text is not None and columnValue.text.strip() != 'none' and \
-                                                len(columnValue.text.strip()) > 0:
-                                            currColumnValues.add(
-                                                ResultSetGenerator._convertDataType(columnValue.text.strip(), columnType)
-                                            )
-                                    tableColumnValues[currTableName][columnName] = list(currColumnValues)
-                                else:
-                                    print('Error: Column Name mismatched')
-                                    return None
-                            if columnCount != len(inMdefDiff.Tables[testCaseId - inStartingID][MDEF.m_Columns]):
-                                print(
-                                    'Error: Column Count mismatched! There might be duplicate columns in ' + currTableName)
+            bytesRead, bytesOnDisk, startTime = 0, 0, time.perf_counter()
+            parsedResultSets, lastEmitTime = 0, startTime
+            ResultSetCatalog.update(TestSuites.Integration.name)
+            for testCaseId in range(inStartingID, inStartingID + len(inMdefDiff.Tables)):
+                if inSkippedTables is not None and \
+                        inMdefDiff.Tables[testCaseId - inStartingID][MDEF.m_Name] in inSkippedTables:
+                    totalResultSets -= 1
+                    continue
+                resultSetEntry = ResultSetCatalog.getEntry(TestSuites.Integration.name, TestSets.SQL_SELECT_ALL.name,
+                                                           testCaseId)
+                if resultSetEntry is not None:
+                    # Descriptors precede the rows, so every row is sampled within the same read of the Result-set. A
+                    # fresh Sampler per descriptors discards the rows of a fast path which fell back to the XML Parser
+                    samplers = list()
+                    rowDescriptionsCount, rowCount, columns, rows, currBytesRead = ResultSetGenerator._readResultSet(
+                        resultSetEntry['Path'], 0, inOnRow=lambda inRow: samplers[-1].addRow(inRow),
+                        inOnColumns=lambda inColumns: samplers.append(
+                            ResultSetSampler(list(inColumns), ResultSetGenerator._convertDataType)))
+                    if rowDescriptionsCount != 1:
+                        print('More than one RowDescriptions found in the resultset')
+                        return None
+                    currTableName = inMdefDiff.Tables[testCaseId - inStartingID][MDEF.m_Name]
+                    currTableColumns = inMdefDiff.Tables[testCaseId - inStartingID][MDEF.m_Columns]
+                    if inTableRowCounts is not None:
+                        inTableRowCounts[currTableName] = rowCount
+                    if rowCount > 0:
+                        for columnName, columnType in columns:
+                            if columnName not in currTableColumns:
+                                print('Error: Column Name mismatched')
                                 return None
+                        if len(columns) != len(currTableColumns):
+                            print(
+                                'Error: Column Count mismatched! There might be duplicate columns in ' + currTableName)
+                            return None
+                        tableColumnValues[currTableName] = samplers[-1].getColumnValues()
+                        if inColumnSketches is not None:
+                            inColumnSketches[currTableName] = samplers[-1].getColumnSketches()
+                    bytesRead += currBytesRead
+                    bytesOnDisk += resultSetEntry['Size']
+                    parsedResultSets += 1
+                    if m_Stream.isEnabled() and time.perf_counter() - lastEmitTime >= m_TailInterval:
+                        lastEmitTime = time.perf_counter()
+                        m_Stream.emit(m_Parsed, ResultSets=parsedResultSets, Total=totalResultSets, Bytes=bytesRead,
+                                      BytesOnDisk=bytesOnDisk, Seconds=lastEmitTime - startTime)
                 else:
-                    print('Error: Invalid Path', os.path.join(resultSetsPath, f"{TestSets.SQL_SELECT_ALL.name}-SQL_QUERY-"
-                                                               f"{testCaseId}{m_TestFilesExtension}"), 'doesn\'t exist!')
+                    print('Error: Invalid Path', os.path.join(resultSetsPath, ResultSetGenerator.getResultSetFileName(
+                        TestSets.SQL_SELECT_ALL.name, testCaseId)), 'doesn\'t exist!')
                     return None
+            elapsedTime = time.perf_counter() - startTime
+            m_Stream.emit(m_Parsed, ResultSets=parsedResultSets, Total=totalResultSets, Bytes=bytesRead,
+                          BytesOnDisk=bytesOnDisk, Seconds=elapsedTime)
+            if elapsedTime > 0:
+                print(f"Parsed {totalResultSets} Result-sets: {bytesRead} bytes ({bytesOnDisk} bytes on disk) in "
+                      f"{elapsedTime:.3f}s, {bytesRead / elapsedTime / (1024 * 1024):.2f} MB/s")
             return tableColumnValues
@@ -1,7 +1,7 @@
 import json
 import os
 
-from GenUtility import assure, getEnvVariableValue
+from GenUtility import assure, getEnvVariableValue, m_CompressionExtensions
 
 # Global Variable
 m_ConnectionString = 'ConnectionString'
@@ -14,6 +14,10 @@ m_PerforceLocation = 'PerforceLocation'
 m_MDEFLocation = 'MDEFLocation'
 m_TestDefinitionsLocation = 'TestDefinitionsLocation'
 m_TestSuite = 'TestSuite'
+m_Compression = 'Compression'
+m_TimeoutHeadroom = 'TimeoutHeadroom'
+m_SampleCacheTTL = 'SampleCacheTTL'
+m_PerformanceRegressionThreshold = 'PerformanceRegressionThreshold'
 
 # Perfoce Variables
 P4_ROOT = 'P4_ROOT'
@@ -82,6 +86,44 @@ class InputReader:
                 for test_suite, args_map in in_file[m_ExternalArguments].items():
                     if len(args_map) > 0:
                         self.inExternalArguments[test_suite] = args_map
+
+            self.inTestDefinitionsLocation = None
+            if assure(in_file, m_TestDefinitionsLocation, True):
+                if os.path.isdir(in_file[m_TestDefinitionsLocation]):
+                    self.inTestDefinitionsLocation = in_file[m_TestDefinitionsLocation]
+                else:
+                    raise FileNotFoundError(f"{in_file[m_TestDefinitionsLocation]} "
+                                            f"is not a valid location for {m_TestDefinitionsLocation}")
+
+            self.inCompression = dict()
+            if assure(in_file, m_Compression, True):
+                for test_suite, compression in in_file[m_Compression].items():
+                    if compression not in m_CompressionExtensions:
+                        raise Exception(f"Error: Invalid Value `{compression}` for `{m_Compression}` of {test_suite}. "
+                                        f"Must be one of {list(m_CompressionExtensions)}")
+                    self.inCompression[test_suite] = compression
+
+            self.inTimeoutHeadroom = None
+            if assure(in_file, m_TimeoutHeadroom, True):
+                if not isinstance(in_file[m_TimeoutHeadroom], (int, float)) or in_file[m_TimeoutHeadroom] < 1:
+                    raise Exception(f"Error: Invalid Value `{in_file[m_TimeoutHeadroom]}` for `{m_TimeoutHeadroom}`. "
+                                    f"Must be a number of at least 1")
+                self.inTimeoutHeadroom = float(in_file[m_TimeoutHeadroom])
+
+            self.inSampleCacheTTL = None
+            if m_SampleCacheTTL in in_file and in_file[m_SampleCacheTTL] is not None:
+                if not isinstance(in_file[m_SampleCacheTTL], (int, float)) or in_file[m_SampleCacheTTL] < 0:
+                    raise Exception(f"Error: Invalid Value `{in_file[m_SampleCacheTTL]}` for `{m_SampleCacheTTL}`. "
+                                    f"Must be a number of seconds, 0 to disable the cache")
+                self.inSampleCacheTTL = float(in_file[m_SampleCacheTTL])
+
+            self.inPerformanceRegressionThreshold = None
+            if assure(in_file, m_PerformanceRegressionThreshold, True):
+                if not isinstance(in_file[m_PerformanceRegressionThreshold], (int, float)) or \
+                        in_file[m_PerformanceRegressionThreshold] <= 0:
+                    raise Exception(f"Error: Invalid Value `{in_file[m_PerformanceRegressionThreshold]}` for "
+                                    f"`{m_PerformanceRegressionThreshold}`. Must be a positive fraction i.e. 0.25")
+                self.inPerformanceRegressionThreshold = float(in_file[m_PerformanceRegressionThreshold])
         else:
             raise FileNotFoundError(f"{in_filepath} not found")
 
@@ -117,3 +159,18 @@ class InputReader:
 
     def getExternalArguments(self):
         return self.inExternalArguments
+
+    def getTestDefinitionsLocation(self):
+        return self.inTestDefinitionsLocation
+
+    def getTimeoutHeadroom(self):
+        return self.inTimeoutHeadroom
+
+    def getSampleCacheTTL(self):
+        return self.inSampleCacheTTL
+
+    def getPerformanceRegressionThreshold(self):
+        return self.inPerformanceRegressionThreshold
+
+    def getCompression(self, in_test_suite: str):
+        return self.inCompression[in_test_suite] if in_test_suite in self.inCompression else None
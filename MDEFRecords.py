@@ -0,0 +1,218 @@
+"""
+Compact records of the parsed MDEF i.e. Tables, Virtual Tables, Columns and Stored Procedures. Records keep their
+fields in `__slots__` and the columns as tuples of the names & the interned SQL Types, and can still be read the way
+the parsed MDEF used to be i.e. `table['Name']`, `table['Columns']`, `table['APIAccess']`
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+from abc import ABCMeta, abstractmethod
+
+# Global Variables
+# Tuples of SQL Types shared by the records, Tables mostly repeat the same sequence of types
+m_SQLTypes = dict()
+
+
+def intern(inValue):
+    """Interns the given string so that every occurrence across the MDEFs shares one object"""
+    return sys.intern(inValue) if isinstance(inValue, str) else inValue
+
+
+def internSQLTypes(inSQLTypes: tuple):
+    """Interns the given tuple of SQL Types so that the records having the same sequence of types share one tuple"""
+    return m_SQLTypes.setdefault(inSQLTypes, inSQLTypes)
+
+
+class Column:
+    __slots__ = ('Name', 'SQLType')
+
+    def __init__(self, inName: str, inSQLType: str = None):
+        self.Name = inName
+        self.SQLType = inSQLType
+
+    def __eq__(self, inOther):
+        return isinstance(inOther, Column) and (self.Name, self.SQLType) == (inOther.Name, inOther.SQLType)
+
+    def __hash__(self):
+        return hash((self.Name, self.SQLType))
+
+    def __repr__(self):
+        return f"Column({self.Name!r}, {self.SQLType!r})"
+
+
+class _Record(metaclass=ABCMeta):
+    """Compatibility of the records with the dictionaries the parsed MDEF used to have"""
+    __slots__ = ()
+    m_Keys = ()
+
+    def __getitem__(self, inKey: str):
+        if inKey not in self.m_Keys:
+            raise KeyError(inKey)
+        return self._getField(inKey)
+
+    def __contains__(self, inKey: str):
+        return inKey in self.m_Keys
+
+    def get(self, inKey: str, inDefault=None):
+        return self._getField(inKey) if inKey in self.m_Keys else inDefault
+
+    def keys(self):
+        return list(self.m_Keys)
+
+    def items(self):
+        return [(key, self._getField(key)) for key in self.m_Keys]
+
+    @abstractmethod
+    def _getField(self, inKey: str):
+        """Returns the value of the given key of `m_Keys` the way the parsed MDEF used to have it"""
+
+    def toDict(self):
+        return dict(self.items())
+
+
+class _ColumnsRecord(_Record):
+    """
+    Record having columns, kept as the tuples of the names and interned SQL Types rather than a record per column.
+    `Column` records are built only when asked for
+    """
+    __slots__ = ('Name', 'ColumnNames', 'SQLTypes')
+
+    def __init__(self, inName: str, inColumns: list = None):
+        """
+        :param inName: Name of the record
+        :param inColumns: List of (Column Name, SQL Type), None if the columns were not parsed
+        """
+        # Names are referenced as parsed, the MDEF content keeps them anyway and interning every distinct name would
+        # only grow the table of the interned strings
+        self.Name = inName
+        self.ColumnNames = tuple(columnName for columnName, sqlType in inColumns) if inColumns is not None else None
+        self.SQLTypes = internSQLTypes(tuple(intern(sqlType) for columnName, sqlType in inColumns)) \
+            if inColumns is not None else None
+
+    @property
+    def Columns(self):
+        """Returns the tuple of `Column`, None if the columns were not parsed"""
+        return tuple(map(Column, self.ColumnNames, self.SQLTypes)) if self.ColumnNames is not None else None
+
+    def getColumnTypes(self):
+        """Returns Column Name and SQL Type Mapping in the order of the columns, The last of any duplicate name wins"""
+        return dict(zip(self.ColumnNames, self.SQLTypes)) if self.ColumnNames is not None else None
+
+    def __eq__(self, inOther):
+        return type(self) is type(inOther) and \
+            (self.Name, self.ColumnNames, self.SQLTypes) == (inOther.Name, inOther.ColumnNames, inOther.SQLTypes)
+
+    def __hash__(self):
+        return hash((self.Name, self.ColumnNames, self.SQLTypes))
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.Name!r}, {len(self.ColumnNames or ())} Columns)"
+
+
+class Table(_ColumnsRecord):
+    __slots__ = ('APIAccess',)
+    m_Keys = ('Name', 'Columns', 'APIAccess')
+    IsVirtual = False
+
+    def __init__(self, inName: str, inColumns: list, inAPIAccess: tuple = ()):
+        """
+        :param inName: Name of the Table
+        :param inColumns: List of (Column Name, SQL Type)
+        :param inAPIAccess: Tuple of (API Access, Tuple of Column Requirements)
+        """
+        super().__init__(inName, inColumns)
+        self.APIAccess = inAPIAccess
+
+    def _getField(self, inKey: str):
+        if inKey == 'Name':
+            return self.Name
+        elif inKey == 'Columns':
+            return self.getColumnTypes()
+        elif inKey == 'APIAccess':
+            return [{apiAccess: list(requirements)} for apiAccess, requirements in self.APIAccess]
+        raise KeyError(inKey)
+
+
+class VirtualTable(Table):
+    __slots__ = ()
+    m_Keys = ('Name', 'Columns', 'Virtual')
+    IsVirtual = True
+
+    def _getField(self, inKey: str):
+        if inKey == 'Virtual':
+            return True
+        return super()._getField(inKey)
+
+
+class StoredProcedure(_ColumnsRecord):
+    __slots__ = ()
+    m_Keys = ('Name', 'Columns')
+
+    def _getField(self, inKey: str):
+        if inKey == 'Name':
+            return self.Name
+        elif inKey == 'Columns':
+            return [{columnName: sqlType} for columnName, sqlType in zip(self.ColumnNames, self.SQLTypes)] \
+                if self.ColumnNames is not None else None
+        raise KeyError(inKey)
+
+
+def _measure(inBuild):
+    tracemalloc.start()
+    startTime = time.perf_counter()
+    result = inBuild()
+    elapsedTime = time.perf_counter() - startTime
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, allocated, elapsedTime
+
+
+if __name__ == '__main__':
+    # Measures the memory of the parsed records against the dictionaries the parsed MDEF used to have on a synthetic
+    # MDEF i.e python MDEFRecords.py [<tables> [<columns per table>]]
+    from Generator import MDEF
+
+    tableCount = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    columnCount = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    sqlTypes = ['SQL_WVARCHAR', 'SQL_INTEGER', 'SQL_DOUBLE', 'SQL_BIT', 'SQL_TYPE_TIMESTAMP']
+    # Columns common to the Tables i.e. `Id`, `CreatedAt` followed by the ones specific to each Table
+    commonColumns = ['Id', 'Name', 'CreatedAt', 'UpdatedAt', 'Status', 'OwnerId', 'Description', 'Url']
+
+    def synthesizeColumn(inTableIndex: int, inColumnIndex: int):
+        columnName = commonColumns[inColumnIndex] if inColumnIndex < len(commonColumns) \
+            else f"Table{inTableIndex}Field{inColumnIndex}"
+        return {MDEF.m_Name: columnName, MDEF.m_Passdownable: inColumnIndex % 4 == 0,
+                MDEF.m_MetaData: {MDEF.m_SQLType: sqlTypes[inColumnIndex % len(sqlTypes)]}}
+
+    content = {
+        MDEF.m_Tables: [{
+            MDEF.m_TableName: f"Table{index}",
+            MDEF.m_APIAccess: {'ReadAPI': {MDEF.m_ColumnRequirements: ['Id']}, 'CreateAPI': {}},
+            MDEF.m_Columns: [synthesizeColumn(index, column) for column in range(columnCount)],
+            MDEF.m_VirtualTables: [{
+                MDEF.m_TableName: f"Table{index}_Items",
+                MDEF.m_Columns: [{MDEF.m_ParentColumn: 0}, synthesizeColumn(index, columnCount)]
+            }] if index % 10 == 0 else []
+        } for index in range(tableCount)],
+        MDEF.m_StoredProcedures: [{
+            MDEF.m_Name: f"Procedure{index}",
+            MDEF.m_ResultTable: {MDEF.m_Columns: [synthesizeColumn(index, 0)]}
+        } for index in range(tableCount // 10)]
+    }
+
+    # Loaded the way the MDEF files are i.e. every value is a string of its own
+    content = json.loads(json.dumps(content))
+    mdef, recordsMemory, recordsSeconds = _measure(lambda: MDEF(inFileContent=content, withColumns=True))
+    # The dictionaries & lists the parsed MDEF used to keep, sharing the same strings
+    legacy, legacyMemory, legacySeconds = _measure(lambda: (
+        [table.toDict() for table in mdef.Tables],
+        {name: list(columns) if columns is not None else None for name, columns in mdef.TableNames.items()},
+        [{procedure.Name: procedure['Columns']} for procedure in mdef.MDEFStoredProcedures],
+        list(mdef.VirtualTableNames)
+    ))
+    print(f"{len(mdef.Tables)} Tables, {len(mdef.MDEFStoredProcedures)} Stored Procedures")
+    print(f"Records: {recordsMemory / (1024 * 1024):.2f} MB parsed in {recordsSeconds:.3f}s")
+    print(f"Dictionaries: {legacyMemory / (1024 * 1024):.2f} MB")
+    print(f"Saved: {(1 - recordsMemory / legacyMemory) * 100:.1f}%")
@@ -0,0 +1,111 @@
+"""
+History of the timings of the performance Test-sets per query, and the regressions of each run against the previous one
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from QueryDeduplicator import canonicalizeQuery
+
+# Global Variables
+m_PerformanceHistory = 'PerformanceHistory.db'
+m_PerformanceReport = 'PerformanceReport.json'
+m_RegressionThreshold = 0.25
+# Slowdowns smaller than this are within the noise of the timings taken from the Result-sets
+m_MinRegressionSeconds = 0.5
+
+
+def hashQuery(inQuery: str):
+    """Returns the hash of the canonical form of the query, so a query is tracked whatever its Test ID"""
+    return hashlib.sha1(canonicalizeQuery(inQuery).encode('utf-8')).hexdigest()
+
+
+class PerformanceHistory:
+    """
+    Represents the local History of the wall time of every query of the performance Test-sets per run.
+    """
+
+    def __init__(self, inOutputFolder: str):
+        self.historyPath = os.path.join(inOutputFolder, m_PerformanceHistory)
+        self.reportPath = os.path.join(inOutputFolder, m_PerformanceReport)
+
+    def _connect(self):
+        connection = sqlite3.connect(self.historyPath, timeout=30)
+        connection.execute('CREATE TABLE IF NOT EXISTS Runs (RunID INTEGER PRIMARY KEY AUTOINCREMENT, '
+                           'RecordedAt REAL NOT NULL)')
+        connection.execute('CREATE TABLE IF NOT EXISTS Timings (RunID INTEGER NOT NULL, TestSuite TEXT NOT NULL, '
+                           'TestSet TEXT NOT NULL, QueryHash TEXT NOT NULL, Query TEXT NOT NULL, '
+                           'Seconds REAL NOT NULL)')
+        connection.execute('CREATE INDEX IF NOT EXISTS TimingsIndex ON Timings (RunID, TestSuite, TestSet, QueryHash)')
+        return connection
+
+    def recordRun(self, inTimings: list):
+        """
+        Records the wall time of every query of a run \n
+        :param inTimings: List of (Testsuite, Test-set, SQL Query, Seconds)
+        :return: Returns the ID of the recorded run
+        """
+        with self._connect() as connection:
+            runID = connection.execute('INSERT INTO Runs (RecordedAt) VALUES (?)', (time.time(),)).lastrowid
+            connection.executemany('INSERT INTO Timings VALUES (?, ?, ?, ?, ?, ?)',
+                                   [(runID, testSuite, testSet, hashQuery(query), query, seconds)
+                                    for testSuite, testSet, query, seconds in inTimings])
+        return runID
+
+    def getTimings(self, inRunID: int):
+        """Returns (Testsuite, Test-set, Query Hash) and (SQL Query, Seconds) Mapping of the given run"""
+        with self._connect() as connection:
+            return {(testSuite, testSet, queryHash): (query, seconds) for testSuite, testSet, queryHash, query, seconds
+                    in connection.execute('SELECT TestSuite, TestSet, QueryHash, Query, Seconds FROM Timings '
+                                          'WHERE RunID = ?', (inRunID,))}
+
+    def getBaselineRunID(self, inRunID: int):
+        """Returns the ID of the run preceding the given run, None if it is the first run"""
+        with self._connect() as connection:
+            return connection.execute('SELECT MAX(RunID) FROM Runs WHERE RunID < ?', (inRunID,)).fetchone()[0]
+
+    def findRegressions(self, inRunID: int, inThreshold: float = None):
+        """
+        Compares the timings of the given run with the ones of the previous run i.e. the baseline \n
+        :param inRunID: ID of the run
+        :param inThreshold: Fraction of the baseline time a query may slow down by, `m_RegressionThreshold` if None
+        :return: Returns the list of (Testsuite, Test-set, SQL Query, Baseline Seconds, Seconds) of the queries slower
+        than the baseline beyond the threshold, slowest first
+        """
+        baselineRunID = self.getBaselineRunID(inRunID)
+        if baselineRunID is None:
+            return list()
+        threshold = inThreshold if inThreshold is not None else m_RegressionThreshold
+        baseline = self.getTimings(baselineRunID)
+        regressions = list()
+        for key, (query, seconds) in self.getTimings(inRunID).items():
+            if key in baseline:
+                baselineSeconds = baseline[key][1]
+                if seconds > baselineSeconds * (1 + threshold) and seconds - baselineSeconds >= m_MinRegressionSeconds:
+                    regressions.append((key[0], key[1], query, baselineSeconds, seconds))
+        return sorted(regressions, key=lambda inRegression: inRegression[4] - inRegression[3], reverse=True)
+
+    def report(self, inTimings: list, inThreshold: float = None):
+        """
+        Records the timings of a run, flags its regressions against the previous run and writes both to the report \n
+        :param inTimings: List of (Testsuite, Test-set, SQL Query, Seconds)
+        :param inThreshold: Fraction of the baseline time a query may slow down by, `m_RegressionThreshold` if None
+        :return: Returns the list of the regressions as per `findRegressions`
+        """
+        runID = self.recordRun(inTimings)
+        regressions = self.findRegressions(runID, inThreshold)
+        with open(self.reportPath, 'w') as file:
+            json.dump({
+                'RunID': runID,
+                'BaselineRunID': self.getBaselineRunID(runID),
+                'Threshold': inThreshold if inThreshold is not None else m_RegressionThreshold,
+                'Timings': [{'TestSuite': testSuite, 'TestSet': testSet, 'Query': query, 'Seconds': seconds}
+                            for testSuite, testSet, query, seconds in inTimings],
+                'Regressions': [{'TestSuite': testSuite, 'TestSet': testSet, 'Query': query,
+                                 'BaselineSeconds': baselineSeconds, 'Seconds': seconds}
+                                for testSuite, testSet, query, baselineSeconds, seconds in regressions]
+            }, file, indent=2)
+        return regressions
@@ -0,0 +1,229 @@
+"""
+Progress events of a run i.e. phases, Result-sets landing while Touchstone runs, throughput and ETA, written as JSON
+Lines to a file and rendered compactly on the console
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# Global Variables
+m_ProgressFile = 'Progress.jsonl'
+# Seconds between two scans of the Result-sets folder while Touchstone runs
+m_TailInterval = 1.0
+# Seconds between two progress lines on a console which is not a terminal i.e. redirected to a log
+m_ConsoleInterval = 10.0
+# Events
+m_PhaseStart = 'PhaseStart'
+m_PhaseEnd = 'PhaseEnd'
+m_ResultSet = 'ResultSet'
+m_Progress = 'Progress'
+m_Parsed = 'Parsed'
+m_UnitEnd = 'UnitEnd'
+
+
+def formatSeconds(inSeconds: float):
+    """Returns the seconds as `1h02m03s`, `2m03s` or `3s`"""
+    if inSeconds is None:
+        return '?'
+    minutes, seconds = divmod(int(round(inSeconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours > 0:
+        return f"{hours}h{minutes:02d}m{seconds:02d}s"
+    return f"{minutes}m{seconds:02d}s" if minutes > 0 else f"{seconds}s"
+
+
+class FileSink:
+    """Writes every event as a line of JSON to the given file, flushed so that the file can be tailed"""
+
+    def __init__(self, inFilePath: str):
+        directory = os.path.dirname(os.path.abspath(inFilePath))
+        os.makedirs(directory, exist_ok=True)
+        self.file = open(inFilePath, 'w')
+
+    def write(self, inEvent: dict):
+        self.file.write(json.dumps(inEvent) + '\n')
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class ConsoleSink:
+    """
+    Renders the events compactly on the console i.e. a line per phase and the progress of the running Touchstone
+    overwritten in place on a terminal, or every `m_ConsoleInterval` seconds otherwise
+    """
+
+    def __init__(self, inStream=None):
+        self.stream = inStream if inStream is not None else sys.stdout
+        self.isTerminal = hasattr(self.stream, 'isatty') and self.stream.isatty()
+        self.lastProgressTime = 0.0
+        self.progressPending = False
+
+    def write(self, inEvent: dict):
+        event = inEvent['Event']
+        if event == m_Progress:
+            if not self.isTerminal and inEvent['Time'] - self.lastProgressTime < m_ConsoleInterval and \
+                    inEvent['Completed'] < inEvent['Total']:
+                return
+            self.lastProgressTime = inEvent['Time']
+            line = f"[{inEvent['Unit']}] {inEvent['Completed']}/{inEvent['Total']} tests, " \
+                   f"{inEvent['TestsPerSecond']:.1f}/s, ETA {formatSeconds(inEvent['ETASeconds'])}"
+            if self.isTerminal:
+                self.stream.write('\r' + line.ljust(79)[:120])
+                self.progressPending = True
+            else:
+                self.stream.write(line + '\n')
+        elif event in [m_PhaseStart, m_PhaseEnd, m_UnitEnd]:
+            self._endProgressLine()
+            if event == m_PhaseStart:
+                self.stream.write(f"> {inEvent['Phase']}\n")
+            elif event == m_PhaseEnd:
+                self.stream.write(f"< {inEvent['Phase']} in {formatSeconds(inEvent['Seconds'])}\n")
+            else:
+                self.stream.write(f"Work Units {inEvent['Completed']}/{inEvent['Total']} done, "
+                                  f"ETA {formatSeconds(inEvent['ETASeconds'])}\n")
+        self.stream.flush()
+
+    def _endProgressLine(self):
+        if self.progressPending:
+            self.stream.write('\n')
+            self.progressPending = False
+
+    def close(self):
+        self._endProgressLine()
+
+
+class ProgressStream:
+    """
+    Represents the stream of the progress events of a run dispatched to its sinks. Without any sink nothing is built or
+    scanned, so emitting costs a check only
+    """
+
+    def __init__(self):
+        self.sinks = list()
+        self.lock = threading.Lock()
+
+    def addSink(self, inSink):
+        self.sinks.append(inSink)
+
+    def isEnabled(self):
+        return len(self.sinks) > 0
+
+    def emit(self, inEvent: str, **inFields):
+        """
+        Dispatches the event to every sink \n
+        :param inEvent: Name of the event i.e. `m_PhaseStart`
+        :param inFields: Fields of the event
+        """
+        if len(self.sinks) == 0:
+            return
+        event = {'Time': time.time(), 'Event': inEvent}
+        event.update(inFields)
+        with self.lock:
+            for sink in self.sinks:
+                sink.write(event)
+
+    @contextmanager
+    def phase(self, inPhase: str, **inFields):
+        """Emits the start of the phase and its end along with the time it took, whether it succeeded or not"""
+        self.emit(m_PhaseStart, Phase=inPhase, **inFields)
+        startTime = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.emit(m_PhaseEnd, Phase=inPhase, Seconds=time.perf_counter() - startTime, **inFields)
+
+    def close(self):
+        with self.lock:
+            for sink in self.sinks:
+                sink.close()
+            self.sinks = list()
+
+
+class ResultSetTailer:
+    """
+    Represents the tailing of a Result-sets folder while Touchstone runs i.e. a background thread scanning the folder
+    for the Result-sets written since the start and emitting the progress, throughput and ETA of the run
+    """
+
+    def __init__(self, inStream: ProgressStream, inUnit: str, inResultSetsPath: str, inTotalTests: int,
+                 inFileRegex, inTestSets: set = None):
+        """
+        :param inStream: Stream to emit the events to
+        :param inUnit: Name of the run i.e. `<Testsuite>/<Test-set>`
+        :param inResultSetsPath: Folder Touchstone writes the Result-sets to
+        :param inTotalTests: Number of tests of the run
+        :param inFileRegex: Compiled Regex of the Result-set file names having the `TestSet` group
+        :param inTestSets: Names of the Test-sets of the run, Result-sets of any other Test-set are ignored if given
+        """
+        self.stream = inStream
+        self.unit = inUnit
+        self.resultSetsPath = inResultSetsPath
+        self.totalTests = inTotalTests
+        self.fileRegex = inFileRegex
+        self.testSets = inTestSets
+        self.seenFiles = set()
+        # Files of the other Test-sets, skipped without matching them again. Result-sets of the previous runs are not
+        # as Touchstone overwrites them
+        self.ignoredFiles = set()
+        self.stopped = threading.Event()
+        self.thread = None
+        self.startTime = None
+
+    def __enter__(self):
+        if self.stream.isEnabled():
+            self.startTime = time.time()
+            self.thread = threading.Thread(target=self._tail, daemon=True)
+            self.thread.start()
+        return self
+
+    def __exit__(self, inType, inValue, inTraceback):
+        if self.thread is not None:
+            self.stopped.set()
+            self.thread.join()
+            self.scan()
+
+    def _tail(self):
+        while not self.stopped.wait(m_TailInterval):
+            self.scan()
+
+    def scan(self):
+        """Emits every Result-set written since the start and not seen yet, followed by the progress of the run"""
+        newFiles = 0
+        try:
+            entries = list(os.scandir(self.resultSetsPath))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.name in self.seenFiles or entry.name in self.ignoredFiles:
+                continue
+            match = self.fileRegex.match(entry.name)
+            if match is None or (self.testSets is not None and match.group('TestSet') not in self.testSets):
+                self.ignoredFiles.add(entry.name)
+                continue
+            try:
+                entryStat = entry.stat()
+            except OSError:
+                continue
+            # File system time granularity might put the Result-sets slightly before the start of the run
+            if entryStat.st_mtime < self.startTime - 2:
+                continue
+            self.seenFiles.add(entry.name)
+            newFiles += 1
+            self.stream.emit(m_ResultSet, Unit=self.unit, File=entry.name, Bytes=entryStat.st_size)
+        # Emitted on every scan, a run whose count stops growing is stuck rather than slow
+        elapsedTime = max(time.time() - self.startTime, 1e-6)
+        completed = len(self.seenFiles)
+        testsPerSecond = completed / elapsedTime
+        self.stream.emit(m_Progress, Unit=self.unit, Completed=completed, Total=self.totalTests, NewResultSets=newFiles,
+                         ElapsedSeconds=elapsedTime, TestsPerSecond=testsPerSecond,
+                         ETASeconds=max(self.totalTests - completed, 0) / testsPerSecond if testsPerSecond > 0 else None)
+
+
+# Stream of the process, Sinks are added as per the command line
+m_Stream = ProgressStream()
@@ -0,0 +1,70 @@
+"""
+Canonicalization of the generated queries to execute each unique query only once per run
+"""
+
+import re
+
+from GenUtility import toIDRanges
+
+# Global Variables
+m_TokenRegex = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")")
+m_OperatorRegex = re.compile(r'\s*([=<>,()])\s*')
+m_WhitespaceRegex = re.compile(r'\s+')
+
+
+def canonicalizeQuery(inQuery: str):
+    """
+    Canonicalizes the query so that queries differing only in case of the keywords & identifiers or in whitespace
+    compare equal. Quoted literals are kept as they are \n
+    :param inQuery: SQL Query
+    :return: Returns the canonical form of the query
+    """
+    tokens = list()
+    for index, token in enumerate(m_TokenRegex.split(inQuery.strip().rstrip(';'))):
+        if index % 2 == 1:
+            tokens.append(token)
+        else:
+            token = m_WhitespaceRegex.sub(' ', token.upper())
+            tokens.append(m_OperatorRegex.sub(r'\1', token))
+    return ''.join(tokens).strip()
+
+
+class QueryDeduplicator:
+    """
+    Represents the Deduplication plan of a run i.e. which test executes a unique query and which tests reuse its
+    Result-set.
+    """
+
+    def __init__(self, inTests: dict):
+        """
+        :param inTests: (Testsuite, Test-set, Test ID) and SQL Query Mapping of every test of the run
+        """
+        self.primaryTests = dict()
+        self.duplicateTests = dict()
+        canonicalQueries = dict()
+        for test in sorted(inTests):
+            canonicalQuery = canonicalizeQuery(inTests[test])
+            if canonicalQuery in canonicalQueries:
+                self.duplicateTests[test] = canonicalQueries[canonicalQuery]
+            else:
+                canonicalQueries[canonicalQuery] = test
+                self.primaryTests[test] = canonicalQuery
+
+    def getSavedExecutions(self):
+        return len(self.duplicateTests)
+
+    def getExclusions(self, inTestSuite: str):
+        """
+        Finds the duplicate tests of the Testsuite to exclude from its run as ranges of consecutive Test IDs \n
+        :param inTestSuite: Name of the Testsuite
+        :return: Returns Test-set and list of (StartID, EndID, Reason) Mapping
+        """
+        duplicateIDs = dict()
+        for testSuite, testSet, testID in self.duplicateTests:
+            if testSuite == inTestSuite:
+                duplicateIDs.setdefault(testSet, list()).append(testID)
+        exclusions = dict()
+        for testSet, testIDs in duplicateIDs.items():
+            exclusions[testSet] = [(startID, endID, 'Duplicate query, Result-set is shared')
+                                   for startID, endID in toIDRanges(testIDs)]
+        return exclusions
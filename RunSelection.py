@@ -0,0 +1,100 @@
+"""
+Selection of the Tables, Testsuites and Test-sets a run is restricted to, so that fixing the tests of a few Tables
+regenerates & re-executes only those
+"""
+
+from fnmatch import fnmatchcase
+
+from CostModel import m_FromRegex
+from TestTypes import TestSuites, TestSets
+
+# Global Variables
+# Test-sets built from the External Arguments rather than from the Result-sets of `SQL_SELECT_ALL`
+m_IndependentTestSets = TestSets.SQL_SP.value + TestSets.SQL_SELECT_ALL.value
+
+
+def _splitPatterns(inPatterns):
+    """Returns the list of patterns from the comma separated string or the list of patterns, None if not given"""
+    if inPatterns is None:
+        return None
+    if isinstance(inPatterns, str):
+        inPatterns = inPatterns.split(',')
+    patterns = [pattern.strip() for pattern in inPatterns if len(pattern.strip()) > 0]
+    return patterns if len(patterns) > 0 else None
+
+
+def _matches(inName: str, inPatterns: list):
+    """Returns True if the name matches any of the glob patterns, compared case-insensitively"""
+    return any(fnmatchcase(inName.lower(), pattern.lower()) for pattern in inPatterns)
+
+
+class RunSelection:
+    """
+    Represents the Tables (glob patterns), Testsuites and Test-sets a run is restricted to. Anything not given is not
+    restricted.
+    """
+
+    def __init__(self, inTables=None, inTestSuites=None, inTestSets=None):
+        """
+        :param inTables: Comma separated string or list of the glob patterns of the Table names i.e. `Order*`
+        :param inTestSuites: Comma separated string or list of the Testsuite names
+        :param inTestSets: Comma separated string or list of the Test-set names
+        """
+        self.tables = _splitPatterns(inTables)
+        self.testSuites = _splitPatterns(inTestSuites)
+        self.testSets = _splitPatterns(inTestSets)
+
+    def isRestricted(self):
+        return self.tables is not None or self.testSuites is not None or self.testSets is not None
+
+    def isTableSelected(self, inTableName: str):
+        return self.tables is None or _matches(inTableName, self.tables)
+
+    def isTestSetSelected(self, inTestSuite: str, inTestSet: str):
+        return (self.testSuites is None or _matches(inTestSuite, self.testSuites)) and \
+            (self.testSets is None or _matches(inTestSet, self.testSets))
+
+    def isQuerySelected(self, inQuery: str):
+        """Returns True if the query reads a selected Table, Queries of the Stored Procedures read no Table"""
+        tableMatch = m_FromRegex.search(inQuery)
+        return tableMatch is not None and self.isTableSelected(tableMatch.group(1).strip('[]"'))
+
+    def filterTables(self, inTables: list, inNameKey: str):
+        """
+        Keeps the selected Tables of the MDEF content, Virtual Tables follow the Table they belong to \n
+        :param inTables: List of the Tables of the MDEF content
+        :param inNameKey: Key of the Table name within a Table
+        :return: Returns the list of the selected Tables
+        """
+        if self.tables is None:
+            return inTables
+        return [table for table in inTables if self.isTableSelected(table[inNameKey])]
+
+    def filterTestSuites(self, inRequiredTestSuites: dict, withPrerequisites: bool = True):
+        """
+        Keeps the selected Testsuites & Test-sets, Test-sets not built from any Table i.e. `SQL_SP` are left out of a
+        selection of Tables \n
+        :param inRequiredTestSuites: Testsuite and Test-set & Starting ID Mapping
+        :param withPrerequisites: If set to True, Keeps `SQL_SELECT_ALL` as well whenever any selected Test-set is
+        built from its Result-sets
+        :return: Returns the Testsuite and Test-set & Starting ID Mapping of the selection
+        """
+        selectedTestSuites = dict()
+        for testSuite, testSets in inRequiredTestSuites.items():
+            selectedTestSets = {testSet: startingID for testSet, startingID in testSets.items()
+                                if self.isTestSetSelected(testSuite, testSet) and
+                                (self.tables is None or testSet not in TestSets.SQL_SP.value)}
+            if len(selectedTestSets) > 0:
+                selectedTestSuites[testSuite] = selectedTestSets
+        selectAllTestSuite, selectAllTestSet = TestSuites.Integration.name, TestSets.SQL_SELECT_ALL.name
+        if withPrerequisites and selectAllTestSet in inRequiredTestSuites.get(selectAllTestSuite, dict()) and \
+                any(testSet not in m_IndependentTestSets
+                    for testSets in selectedTestSuites.values() for testSet in testSets):
+            selectedTestSuites.setdefault(selectAllTestSuite, dict())[selectAllTestSet] = \
+                inRequiredTestSuites[selectAllTestSuite][selectAllTestSet]
+        return selectedTestSuites
+
+    def __str__(self):
+        return ', '.join(f"{name}: {', '.join(values)}" for name, values in
+                         [('Tables', self.tables), ('Testsuites', self.testSuites), ('Test-sets', self.testSets)]
+                         if values is not None)
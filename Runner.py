@@ -1,31 +1,159 @@
+import atexit
+import os
 import sys
+import Generator
 from Generator import TestSetGenerator, ResultSetGenerator
+from BatchRunner import BatchRunner
+from WorkQueue import WorkQueueCoordinator, WorkQueueWorker
+from Watcher import MDEFWatcher
+from RunSelection import RunSelection
+from ProgressEvents import ConsoleSink, FileSink, m_Stream, m_ProgressFile
 
 
 # Global Variables
 m_InputFile = 'input.json'
 m_TestSetsOption = '-ts'
 m_ResultSetsOption = '-rs'
+m_WorkerOption = '-worker'
+m_BatchOption = '-batch'
+m_WorkersOption = '-workers'
+m_CoordinatorOption = '-coordinator'
+m_ShardOption = '-shard'
+m_WatchOptions = ['--watch', '-watch']
+m_TimeBudgetOption = '--time-budget'
+m_TablesOption = '-tables'
+m_SuitesOption = '-suites'
+m_TestSetsSelectionOption = '-testsets'
+m_ChunkOption = '-chunk'
+m_RefreshSamplesOption = '--refresh-samples'
+m_CoalesceOption = '-coalesce'
+m_ProgressOption = '-progress'
+m_EventsOption = '-events'
+m_Usage = "i.e python Runner.py -ts/-rs [--time-budget <seconds>] [-tables <pattern,...>] [-suites <name,...>] " \
+          "[-testsets <name,...>] [-chunk <tables>] [--refresh-samples]\n" \
+          "     python Runner.py -rs -workers <count> [--time-budget <seconds>] [-coalesce]\n" \
+          "     python Runner.py -ts/-rs -batch <input-file/dir>... [-workers <count>]\n" \
+          "     python Runner.py -ts --watch\n" \
+          "     python Runner.py -rs -coordinator <queue-dir> [-shard <tests-per-unit>]\n" \
+          "     python Runner.py -worker <queue-dir>\n" \
+          "     Any mode also takes [-progress] [-events <file.jsonl>]"
 
 
 class Runner:
-    def run(self, in_mode):
+    def run(self, in_mode, in_workers: int = 1, in_time_budget: float = None, in_selection: RunSelection = None,
+            in_chunk_size: int = None, in_refresh_samples: bool = False, in_coalesce: bool = False):
         if in_mode == m_TestSetsOption:
-            TestSetGenerator(m_InputFile).run()
+            return TestSetGenerator(m_InputFile, in_time_budget, in_selection, in_chunk_size, in_refresh_samples).run()
         else:
-            ResultSetGenerator(m_InputFile).run()
+            return ResultSetGenerator(m_InputFile, in_workers, in_time_budget, in_selection, in_chunk_size,
+                                      in_refresh_samples, in_coalesce).run()
+
+    def runBatch(self, in_mode, in_input_locations: list, in_workers: int = None):
+        return BatchRunner(in_input_locations, in_workers).run(in_mode == m_ResultSetsOption)
+
+    def runCoordinator(self, in_queue_dir: str, in_shard_size: int = None):
+        return WorkQueueCoordinator(m_InputFile, in_queue_dir, in_shard_size).run()
+
+    def runWorker(self, in_queue_dir: str):
+        return WorkQueueWorker(in_queue_dir).run()
+
+    def watch(self):
+        return MDEFWatcher(m_InputFile).run()
+
+
+def getOptionValue(in_args: list, in_option: str, in_default=None):
+    """
+    Finds the value passed for the given option i.e `-option <value>` \n
+    :param in_args: Command line arguments
+    :param in_option: Name of the option
+    :param in_default: Value to return if the option is not passed
+    :return: Returns the value of the option
+    """
+    lowered_args = list(map(str.lower, in_args))
+    if in_option in lowered_args and lowered_args.index(in_option) + 1 < len(in_args):
+        return in_args[lowered_args.index(in_option) + 1]
+    return in_default
+
+
+def parseNumber(in_value: str, in_option: str, in_type=int):
+    """
+    Parses the value passed for a numeric option \n
+    :param in_value: Value of the option, None if not passed
+    :param in_option: Name of the option
+    :param in_type: Type of the number i.e. `int` or `float`
+    :return: Returns the number, None if not passed. Raises ValueError if not a number
+    """
+    if in_value is None:
+        return None
+    try:
+        return in_type(in_value)
+    except ValueError:
+        raise ValueError(f"{in_option} expects a number, got {in_value}")
+
+
+def parseBatchArguments(in_args: list):
+    """
+    Parses the Batch arguments i.e `-batch <input-file/dir>... [-workers <count>]` \n
+    :param in_args: Command line arguments following the mode parameter
+    :return: Returns the list of Input Locations and the number of Workers. Raises ValueError if the count of
+    Workers is not a number
+    """
+    input_locations, workers = list(), None
+    index = 0
+    while index < len(in_args):
+        if in_args[index].lower() == m_WorkersOption and index + 1 < len(in_args):
+            workers = parseNumber(in_args[index + 1], m_WorkersOption)
+            index += 2
+        else:
+            if in_args[index].lower() != m_BatchOption:
+                input_locations.append(in_args[index])
+            index += 1
+    return input_locations, workers
 
 
 if __name__ == '__main__':
     if len(sys.argv) < 2:
         print("Missing mode parameter.")
-        print("i.e python Runner.py -ts/-rs")
+        print(m_Usage)
+        sys.exit(1)
     mode = sys.argv[1].lower()
+    options = sys.argv[2:]
     runner = Runner()
-    if mode == m_TestSetsOption:
-        runner.run(m_TestSetsOption)
-    elif mode == m_ResultSetsOption:
-        runner.run(m_ResultSetsOption)
+    if m_ProgressOption in map(str.lower, options):
+        m_Stream.addSink(ConsoleSink())
+    if m_EventsOption in map(str.lower, options):
+        eventsFile = getOptionValue(options, m_EventsOption)
+        m_Stream.addSink(FileSink(eventsFile if eventsFile is not None and not eventsFile.startswith('-')
+                                  else os.path.join(Generator.m_OutputFolder, m_ProgressFile)))
+    atexit.register(m_Stream.close)
+    isBatch = mode in [m_TestSetsOption, m_ResultSetsOption] and m_BatchOption in map(str.lower, options)
+    try:
+        if isBatch:
+            inputLocations, workerCount = parseBatchArguments(options)
+        else:
+            workerCount = parseNumber(getOptionValue(options, m_WorkersOption, '1'), m_WorkersOption)
+        shardSize = parseNumber(getOptionValue(options, m_ShardOption), m_ShardOption)
+        timeBudget = parseNumber(getOptionValue(options, m_TimeBudgetOption), m_TimeBudgetOption, float)
+        chunkSize = parseNumber(getOptionValue(options, m_ChunkOption), m_ChunkOption)
+    except ValueError as e:
+        print(f"Invalid Option: {e}")
+        print(m_Usage)
+        sys.exit(1)
+    if isBatch:
+        sys.exit(0 if runner.runBatch(mode, inputLocations, workerCount) else 1)
+    elif mode == m_ResultSetsOption and getOptionValue(options, m_CoordinatorOption) is not None:
+        sys.exit(0 if runner.runCoordinator(getOptionValue(options, m_CoordinatorOption), shardSize) else 1)
+    elif mode == m_TestSetsOption and any(map(lambda option: option.lower() in m_WatchOptions, options)):
+        runner.watch()
+    elif mode == m_WorkerOption and len(options) > 0:
+        sys.exit(0 if runner.runWorker(options[0]) else 1)
+    elif mode in [m_TestSetsOption, m_ResultSetsOption]:
+        selection = RunSelection(getOptionValue(options, m_TablesOption), getOptionValue(options, m_SuitesOption),
+                                 getOptionValue(options, m_TestSetsSelectionOption))
+        sys.exit(0 if runner.run(mode, workerCount, timeBudget, selection, chunkSize,
+                                 m_RefreshSamplesOption in map(str.lower, options),
+                                 m_CoalesceOption in map(str.lower, options)) else 1)
     else:
         print("Invalid Operation Code")
-        print("i.e python Runner.py -ts/-rs")
+        print(m_Usage)
+        sys.exit(1)
@@ -0,0 +1,95 @@
+"""
+Persistent Cache of the row samples of the Tables keyed by the Connection String, the Table name and the hash of the
+Table's columns in the MDEF, so that the discovery `SQL_SELECT_ALL` runs only for Tables not sampled recently
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+import time
+
+# Global Variables
+m_SampleCache = 'SampleCache.db'
+m_DefaultTTL = 24 * 60 * 60
+
+
+def hashSchema(inColumnNames: tuple, inSQLTypes: tuple):
+    """Returns the hash of the columns of a Table i.e. any change of a column name, type or order changes it"""
+    return hashlib.sha1(repr((tuple(inColumnNames or ()), tuple(inSQLTypes or ()))).encode('utf-8')).hexdigest()
+
+
+class SampleCache:
+    """
+    Represents the Cache of the row samples of a Data Source i.e. the Column Values, Row Count and Column Sketches of
+    every sampled Table.
+    """
+
+    def __init__(self, inOutputFolder: str, inConnectionString: str, inTTL: float = m_DefaultTTL,
+                 inRefresh: bool = False):
+        """
+        :param inOutputFolder: Folder of the Cache
+        :param inConnectionString: Connection String of the Data Source, Only its hash is stored
+        :param inTTL: Age in seconds after which a sample is taken again
+        :param inRefresh: If set to True, Every Table is sampled again whatever the age of its sample
+        """
+        self.cachePath = os.path.join(inOutputFolder, m_SampleCache)
+        self.connectionHash = hashlib.sha1(inConnectionString.encode('utf-8')).hexdigest()
+        self.ttl = inTTL
+        self.refresh = inRefresh
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self):
+        connection = sqlite3.connect(self.cachePath, timeout=30)
+        connection.execute('CREATE TABLE IF NOT EXISTS Samples (ConnectionHash TEXT NOT NULL, TableName TEXT NOT NULL, '
+                           'SchemaHash TEXT NOT NULL, SampledAt REAL NOT NULL, Sample BLOB NOT NULL, '
+                           'PRIMARY KEY (ConnectionHash, TableName))')
+        return connection
+
+    def isEnabled(self):
+        return self.ttl > 0
+
+    def get(self, inTables: list):
+        """
+        Finds the fresh samples of the given Tables \n
+        :param inTables: List of `Table` records
+        :return: Returns Table Name and (Column Values, Row Count, Column Sketches) Mapping of the Tables sampled within
+        the TTL with the same columns, Column Values is None for an empty Table
+        """
+        samples = dict()
+        if not self.isEnabled() or self.refresh or len(inTables) == 0:
+            self.misses += len(inTables)
+            return samples
+        schemaHashes = {table.Name: hashSchema(table.ColumnNames, table.SQLTypes) for table in inTables}
+        with self._connect() as connection:
+            for tableName, schemaHash, sampledAt, sample in connection.execute(
+                    'SELECT TableName, SchemaHash, SampledAt, Sample FROM Samples WHERE ConnectionHash = ?',
+                    (self.connectionHash,)):
+                if schemaHashes.get(tableName) == schemaHash and time.time() - sampledAt <= self.ttl:
+                    try:
+                        samples[tableName] = pickle.loads(sample)
+                    except (pickle.UnpicklingError, EOFError, AttributeError):
+                        continue
+        self.hits += len(samples)
+        self.misses += len(inTables) - len(samples)
+        # In the order of the Tables, so the Test-sets are written alike whether sampled or served from the Cache
+        return {table.Name: samples[table.Name] for table in inTables if table.Name in samples}
+
+    def put(self, inTables: list, inTableColumnValues: dict, inTableRowCounts: dict, inColumnSketches: dict):
+        """
+        Stores the samples of the given Tables just taken \n
+        :param inTables: List of `Table` records sampled
+        :param inTableColumnValues: Table Name and Column Name & Values Mapping, Empty Tables are not present
+        :param inTableRowCounts: Table Name and Row Count Mapping
+        :param inColumnSketches: Table Name and Column Name & `ColumnSketch` Mapping
+        """
+        if not self.isEnabled():
+            return
+        sampledAt = time.time()
+        rows = [(self.connectionHash, table.Name, hashSchema(table.ColumnNames, table.SQLTypes), sampledAt,
+                 pickle.dumps((inTableColumnValues.get(table.Name), inTableRowCounts[table.Name],
+                               inColumnSketches.get(table.Name)), pickle.HIGHEST_PROTOCOL))
+                for table in inTables if table.Name in inTableRowCounts]
+        with self._connect() as connection:
+            connection.executemany('INSERT OR REPLACE INTO Samples VALUES (?, ?, ?, ?, ?)', rows)
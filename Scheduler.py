@@ -0,0 +1,286 @@
+"""
+Run History of the Touchstone executions and the Longest-first Scheduler of the Work Units built on top of it
+"""
+
+import heapq
+import math
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ProgressEvents import m_Stream, m_UnitEnd
+
+# Global Variables
+m_RunHistory = 'RunHistory.db'
+m_AllTestSets = '*'
+m_HistoryDepth = 5
+m_DefaultTestSeconds = 1.0
+m_DefaultTimeout = 20
+m_MinTimeout = 5
+m_MaxTimeout = 600
+m_TimeoutPercentile = 0.95
+m_TimeoutHeadroom = 3.0
+m_RetryTimeoutFactor = 4
+# Timeouts after which Touchstone gives up a run i.e. the Data Source stopped responding, on top of the ones expected
+m_MaxConsecutiveTimeouts = 15
+m_MaxAccumulatedTimeouts = 50
+# Time Touchstone takes to start i.e. loading the ICU libraries and connecting to the Data Source
+m_StartupSeconds = 3.0
+# Work Units whose queries take less than this many startups are worth coalescing into one run
+m_CoalesceFactor = 2
+
+
+class RunHistory:
+    """
+    Represents the local History of the wall time taken per Testsuite, Test-set and Test ID.
+    """
+
+    def __init__(self, inOutputFolder: str):
+        self.historyPath = os.path.join(inOutputFolder, m_RunHistory)
+
+    def _connect(self):
+        connection = sqlite3.connect(self.historyPath, timeout=30)
+        connection.execute('CREATE TABLE IF NOT EXISTS Units (TestSuite TEXT NOT NULL, TestSet TEXT NOT NULL, '
+                           'Seconds REAL NOT NULL, RecordedAt REAL NOT NULL)')
+        connection.execute('CREATE TABLE IF NOT EXISTS Tests (TestSuite TEXT NOT NULL, TestSet TEXT NOT NULL, '
+                           'TestID INTEGER NOT NULL, Seconds REAL NOT NULL, RecordedAt REAL NOT NULL)')
+        connection.execute('CREATE TABLE IF NOT EXISTS Timeouts (TestSuite TEXT NOT NULL, TestSet TEXT NOT NULL, '
+                           'Tests INTEGER NOT NULL, TimedOut INTEGER NOT NULL, RecordedAt REAL NOT NULL)')
+        connection.execute('CREATE INDEX IF NOT EXISTS UnitsIndex ON Units (TestSuite, TestSet, RecordedAt)')
+        connection.execute('CREATE INDEX IF NOT EXISTS TestsIndex ON Tests (TestSuite, TestSet, TestID, RecordedAt)')
+        return connection
+
+    def recordUnit(self, inTestSuite: str, inTestSet: str, inSeconds: float):
+        """
+        Records the wall time of a Touchstone run \n
+        :param inTestSuite: Name of the Testsuite
+        :param inTestSet: Name of the Test-set, None if the whole Testsuite was run
+        :param inSeconds: Wall time of the run
+        """
+        with self._connect() as connection:
+            connection.execute('INSERT INTO Units VALUES (?, ?, ?, ?)',
+                               (inTestSuite, inTestSet if inTestSet is not None else m_AllTestSets, inSeconds,
+                                time.time()))
+
+    def recordTests(self, inTestSuite: str, inTestTimings: list):
+        """
+        Records the wall time of every test of a Touchstone run \n
+        :param inTestSuite: Name of the Testsuite
+        :param inTestTimings: List of (Test-set, Test ID, Seconds)
+        """
+        recordedAt = time.time()
+        with self._connect() as connection:
+            connection.executemany('INSERT INTO Tests VALUES (?, ?, ?, ?, ?)',
+                                   [(inTestSuite, testSet, testID, seconds, recordedAt)
+                                    for testSet, testID, seconds in inTestTimings])
+
+    def recordTimeouts(self, inTestSuite: str, inTestSet: str, inTestCount: int, inTimedOutCount: int):
+        """
+        Records how many tests of a Touchstone run timed out or did not run due to the timeouts \n
+        :param inTestSuite: Name of the Testsuite
+        :param inTestSet: Name of the Test-set
+        :param inTestCount: Number of tests of the run
+        :param inTimedOutCount: Number of tests of the run without Result-set
+        """
+        with self._connect() as connection:
+            connection.execute('INSERT INTO Timeouts VALUES (?, ?, ?, ?, ?)',
+                               (inTestSuite, inTestSet, inTestCount, inTimedOutCount, time.time()))
+
+    def getTimeoutRate(self, inTestSuite: str, inTestSet: str):
+        """Returns the fraction of the tests of the recent runs of the Test-set which timed out, None if unknown"""
+        with self._connect() as connection:
+            counts = connection.execute(
+                'SELECT SUM(Tests), SUM(TimedOut) FROM (SELECT Tests, TimedOut FROM Timeouts WHERE TestSuite = ? AND '
+                'TestSet = ? ORDER BY RecordedAt DESC LIMIT ?)', (inTestSuite, inTestSet, m_HistoryDepth)).fetchone()
+        return counts[1] / counts[0] if counts[0] else None
+
+    def getUnitSeconds(self, inTestSuite: str, inTestSet: str):
+        """Returns the average wall time of the recent runs of the given Test-set, None if never run"""
+        with self._connect() as connection:
+            timings = [seconds for seconds, in connection.execute(
+                'SELECT Seconds FROM Units WHERE TestSuite = ? AND TestSet = ? ORDER BY RecordedAt DESC LIMIT ?',
+                (inTestSuite, inTestSet, m_HistoryDepth))]
+        return sum(timings) / len(timings) if len(timings) > 0 else None
+
+    def getTestSeconds(self, inTestSuite: str, inTestSet: str):
+        """Returns the Test ID and the latest wall time Mapping of the given Test-set"""
+        with self._connect() as connection:
+            return {testID: seconds for testID, seconds in connection.execute(
+                'SELECT TestID, Seconds FROM Tests WHERE TestSuite = ? AND TestSet = ? ORDER BY RecordedAt',
+                (inTestSuite, inTestSet))}
+
+    def getLatencies(self, inTestSuite: str, inTestSet: str = None, inTestIDs: list = None):
+        """
+        Finds the latest wall time of each test \n
+        :param inTestSuite: Name of the Testsuite
+        :param inTestSet: Name of the Test-set, None for every Test-set of the Testsuite
+        :param inTestIDs: IDs of the tests to consider i.e. a Shard of the Test-set, None for every test
+        :return: Returns the list of the latest wall times
+        """
+        query = 'SELECT TestSet, TestID, Seconds FROM Tests WHERE TestSuite = ?'
+        params = [inTestSuite]
+        if inTestSet is not None:
+            query += ' AND TestSet = ?'
+            params.append(inTestSet)
+        with self._connect() as connection:
+            latencies = {(testSet, testID): seconds for testSet, testID, seconds in
+                         connection.execute(query + ' ORDER BY RecordedAt', params)}
+        if inTestIDs is not None:
+            testIDs = set(inTestIDs)
+            return [seconds for (testSet, testID), seconds in latencies.items() if testID in testIDs]
+        return list(latencies.values())
+
+    def deriveTimeout(self, inTestSuite: str, inTestSet: str = None, inTestIDs: list = None,
+                      inHeadroom: float = None):
+        """
+        Derives the Touchstone timeout of a run from the observed latency of its tests i.e. the high percentile of the
+        latencies times the headroom, within the bounds of `m_MinTimeout` & `m_MaxTimeout` \n
+        :param inTestSuite: Name of the Testsuite
+        :param inTestSet: Name of the Test-set, None for every Test-set of the Testsuite
+        :param inTestIDs: IDs of the tests of the run, None for every test
+        :param inHeadroom: Multiple of the observed latency to allow, `m_TimeoutHeadroom` if None
+        :return: Returns the timeout in seconds, `m_DefaultTimeout` if nothing was observed yet
+        """
+        latencies = sorted(self.getLatencies(inTestSuite, inTestSet, inTestIDs))
+        if len(latencies) == 0:
+            return m_DefaultTimeout
+        percentileLatency = latencies[min(int(len(latencies) * m_TimeoutPercentile), len(latencies) - 1)]
+        timeout = math.ceil(percentileLatency * (inHeadroom if inHeadroom is not None else m_TimeoutHeadroom))
+        return min(max(timeout, m_MinTimeout), m_MaxTimeout)
+
+    def getAverageTestSeconds(self):
+        """Returns the average wall time of a test across the whole History, None if the History is empty"""
+        with self._connect() as connection:
+            return connection.execute('SELECT AVG(Seconds) FROM Tests').fetchone()[0]
+
+    def predictSeconds(self, inTestSuite: str, inTestSet: str, inTestIDs: list):
+        """
+        Predicts the wall time of the given Test-set from the History \n
+        :param inTestSuite: Name of the Testsuite
+        :param inTestSet: Name of the Test-set
+        :param inTestIDs: IDs of the tests within the Test-set
+        :return: Returns the predicted wall time in seconds
+        """
+        unitSeconds = self.getUnitSeconds(inTestSuite, inTestSet)
+        if unitSeconds is not None:
+            return unitSeconds
+        testSeconds = self.getTestSeconds(inTestSuite, inTestSet)
+        averageTestSeconds = self.getAverageTestSeconds()
+        if averageTestSeconds is None:
+            averageTestSeconds = m_DefaultTestSeconds
+        return sum(testSeconds[testID] if testID in testSeconds else averageTestSeconds for testID in inTestIDs)
+
+
+class TestScheduler:
+    """
+    Represents the Scheduler which packs the Work Units Longest-first across the available Workers.
+    """
+
+    @staticmethod
+    def plan(inPredictedSeconds: dict, inWorkers: int):
+        """
+        Packs the Work Units Longest-first i.e. each next longest unit goes to the least loaded Worker \n
+        :param inPredictedSeconds: Work Unit and predicted wall time Mapping
+        :param inWorkers: Number of Workers
+        :return: Returns the Work Units ordered Longest-first and the predicted total wall time
+        """
+        orderedUnits = sorted(inPredictedSeconds, key=lambda inUnit: inPredictedSeconds[inUnit], reverse=True)
+        workerLoads = [0.0] * max(inWorkers, 1)
+        heapq.heapify(workerLoads)
+        for unit in orderedUnits:
+            heapq.heappush(workerLoads, heapq.heappop(workerLoads) + inPredictedSeconds[unit])
+        return orderedUnits, max(workerLoads)
+
+    @staticmethod
+    def coalesce(inPredictedSeconds: dict, inWorkers: int, inStartupSeconds: float = m_StartupSeconds):
+        """
+        Groups the small Work Units into batches to run in one Touchstone run each, so that the startup is paid once per
+        batch. A batch is kept within the longer of the longest Work Unit and the even share of a Worker, so coalescing
+        never makes the run longer than executing the units in parallel i.e. with many Workers and few small units
+        nothing is coalesced \n
+        :param inPredictedSeconds: Work Unit i.e. (Testsuite, Test-set) and predicted wall time Mapping
+        :param inWorkers: Number of Workers
+        :param inStartupSeconds: Time Touchstone takes to start, included in the predicted wall time of every unit
+        :return: Returns the list of the batches of two or more Work Units, Units of a batch have distinct Test-sets as
+        their Result-sets share one folder
+        """
+        if len(inPredictedSeconds) < 2:
+            return list()
+        # Time of the queries of each unit, i.e. what remains when run within a batch
+        workSeconds = {unit: max(seconds - inStartupSeconds, 0.0) for unit, seconds in inPredictedSeconds.items()}
+        # Longest unit or the share of each Worker when every unit runs on its own, whichever bounds the run
+        batchLimit = max(max(inPredictedSeconds.values()), sum(inPredictedSeconds.values()) / max(inWorkers, 1))
+        smallUnits = sorted([unit for unit, seconds in workSeconds.items()
+                             if seconds <= inStartupSeconds * m_CoalesceFactor],
+                            key=lambda inUnit: workSeconds[inUnit], reverse=True)
+        # First-fit of the largest small units first
+        batches, batchSeconds = list(), list()
+        for unit in smallUnits:
+            for index, batch in enumerate(batches):
+                if batchSeconds[index] + workSeconds[unit] <= batchLimit and \
+                        all(batchUnit[1] != unit[1] for batchUnit in batch):
+                    batch.append(unit)
+                    batchSeconds[index] += workSeconds[unit]
+                    break
+            else:
+                batches.append([unit])
+                batchSeconds.append(inStartupSeconds + workSeconds[unit])
+        return [batch for batch in batches if len(batch) > 1]
+
+    @staticmethod
+    def run(inPredictedSeconds: dict, inWorkers: int, inExecute):
+        """
+        Executes the Work Units Longest-first over the Workers and reports the predicted versus actual wall time \n
+        :param inPredictedSeconds: Work Unit and predicted wall time Mapping
+        :param inWorkers: Number of Workers
+        :param inExecute: Callable executing a Work Unit, Returns True if succeeded else False
+        :return: Returns Work Unit and Result Mapping
+        """
+        orderedUnits, predictedSeconds = TestScheduler.plan(inPredictedSeconds, inWorkers)
+        results = dict()
+        resultsLock = threading.Lock()
+        startTime = time.perf_counter()
+
+        totalSeconds = sum(inPredictedSeconds.values())
+        completedSeconds = [0.0]
+
+        def executeUnit(inUnit):
+            result = inExecute(inUnit)
+            with resultsLock:
+                results[inUnit] = result
+                completedSeconds[0] += inPredictedSeconds[inUnit]
+                # Remaining predicted time scaled by how the run keeps up with the prediction so far
+                elapsedSeconds = time.perf_counter() - startTime
+                m_Stream.emit(m_UnitEnd, Unit=str(inUnit), Succeeded=bool(result), Completed=len(results),
+                              Total=len(orderedUnits), ElapsedSeconds=elapsedSeconds,
+                              ETASeconds=(totalSeconds - completedSeconds[0]) * elapsedSeconds / completedSeconds[0]
+                              if completedSeconds[0] > 0 else None)
+
+        # Workers pull the next longest unit as soon as they get free, which follows the plan
+        with ThreadPoolExecutor(max_workers=max(inWorkers, 1)) as pool:
+            list(pool.map(executeUnit, orderedUnits))
+        actualSeconds = time.perf_counter() - startTime
+        print(f"Executed {len(orderedUnits)} Work Units with {max(inWorkers, 1)} Workers: "
+              f"Predicted {predictedSeconds:.1f}s, Actual {actualSeconds:.1f}s")
+        return results
+
+
+def getRetryTimeout(inTimeout: int):
+    """Returns the timeout of the run re-executing the tests which timed out with the given timeout"""
+    return min(max(inTimeout * m_RetryTimeoutFactor, m_DefaultTimeout), m_MaxTimeout)
+
+
+def deriveTimeoutLimits(inTestCount: int, inTimeoutRate: float = None):
+    """
+    Derives the consecutive & accumulated timeouts after which Touchstone gives up a run, so that the tests expected to
+    time out as per the observed rate do not stop the run whereas a Data Source which stopped responding still does \n
+    :param inTestCount: Number of tests of the run
+    :param inTimeoutRate: Fraction of the tests expected to time out i.e. 1.0 for a re-run of the timed out tests, None
+    if never observed
+    :return: Returns the maximum consecutive and the maximum accumulated timeouts
+    """
+    expectedTimeouts = math.ceil(inTestCount * (inTimeoutRate or 0.0))
+    maxAccumulatedTimeouts = min(m_MaxAccumulatedTimeouts + expectedTimeouts, max(inTestCount, 1))
+    return min(max(m_MaxConsecutiveTimeouts, expectedTimeouts), maxAccumulatedTimeouts), maxAccumulatedTimeouts
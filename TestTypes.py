@@ -0,0 +1,31 @@
+"""
+Testsuites and Test-sets the Generator writes, shared by the modules selecting or scheduling them
+"""
+
+from enum import Enum
+
+
+class TestSuites(Enum):
+    Integration = 'Integration'
+    SP = 'SP'
+    DML = 'DML'
+    SQL = 'SQL'
+    Performance = 'Performance'
+
+
+class TestSets(Enum):
+    SQL_SELECT_ALL = ['SQL_SELECT_ALL']
+    SQL_PASSDOWN = ['SQL_PASSDOWN']
+    SQL_SP = ['SQL_SP']
+    SQL_AND_OR = ['SQL_AND_OR']
+    SQL_FUNCTION_1TABLE = ['SQL_FUNCTION_1TABLE']
+    SQL_GROUP_BY = ['SQL_GROUP_BY']
+    SQL_IN_BETWEEN = ['SQL_IN_BETWEEN']
+    SQL_LIKE = ['SQL_LIKE']
+    SQL_ORDER_BY = ['SQL_ORDER_BY', 'SQL_ORDER']
+    SQL_SELECT_TOP = ['SQL_SELECT_TOP']
+    SQL_COLUMNS_1TABLE = ['COLUMNS_1TABLE']
+    PERF_FULL_SCAN = ['PERF_FULL_SCAN']
+    PERF_SELECT_TOP_SWEEP = ['PERF_SELECT_TOP_SWEEP']
+    PERF_FILTER_PAIRS = ['PERF_FILTER_PAIRS']
+    PERF_PROJECTION = ['PERF_PROJECTION']
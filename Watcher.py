@@ -0,0 +1,209 @@
+"""
+Watch mode which keeps the Head MDEF, parsed structures and column samples warm and regenerates the affected Test-sets
+whenever the Modified MDEF changes
+"""
+
+import json
+import os
+import time
+
+from Generator import MDEF, TestWriter, TestSetGenerator, TestSuites, TestSets
+from GenUtility import PerforceUtility, toIDRanges
+from InputReader import InputReader, m_ModifiedMDEFLocation
+
+# Global Variables
+m_PollInterval = 0.2
+m_DebounceInterval = 0.5
+
+
+class MDEFWatcher:
+    """
+    Represents the Watcher of the Modified MDEF.
+    """
+
+    def __init__(self, inFilePath: str):
+        self.inputFile = InputReader(inFilePath)
+        if self.inputFile.getMDEFDifferenceFindMode() != m_ModifiedMDEFLocation or self.inputFile.isFirstRevision():
+            raise Exception(f"Error: Watch mode requires `{m_ModifiedMDEFLocation}` of a non first revision MDEF")
+        self.testSetGenerator = TestSetGenerator(inFilePath)
+        self.modifiedMdefLoc = self.inputFile.getModifiedMDEFLocation()
+        self.requiredTestSuites = self.inputFile.getRequiredTestSuites()
+        self.externalArgs = self.inputFile.getExternalArguments()
+        self.headMdef = None
+        self.headRevision = None
+        self.mdefDiff = None
+        self.tableColumnValues = dict()
+        self.sampledColumns = dict()
+
+    def run(self):
+        if not self.testSetGenerator.setupTestFolders(self.requiredTestSuites):
+            return False
+        if not self.refreshHead():
+            return False
+        self.regenerate()
+        print(f"Watching {self.modifiedMdefLoc} for changes. Press Ctrl+C to stop.")
+        lastSignature = self._getFileSignature()
+        try:
+            while True:
+                time.sleep(m_PollInterval)
+                currSignature = self._getFileSignature()
+                if currSignature == lastSignature:
+                    continue
+                # Waits till the editor finishes writing the MDEF
+                while True:
+                    time.sleep(m_DebounceInterval)
+                    stableSignature = self._getFileSignature()
+                    if stableSignature == currSignature:
+                        break
+                    currSignature = stableSignature
+                lastSignature = currSignature
+                self.regenerate()
+        except KeyboardInterrupt:
+            return True
+
+    def _getFileSignature(self):
+        try:
+            fileStat = os.stat(self.modifiedMdefLoc)
+            return fileStat.st_mtime_ns, fileStat.st_size
+        except FileNotFoundError:
+            return None
+
+    def refreshHead(self):
+        """
+        Asks Perforce for the Head revision of the MDEF and loads it whenever it changed since the last time, so that a
+        long watch never diffs against a stale Head \n
+        :return: Returns True if a Head MDEF is loaded else False
+        """
+        mdefLoc = self.inputFile.getMDEFLocation()
+        try:
+            headRevision = PerforceUtility.getLatestRevisionNumber(mdefLoc, inMaxAge=0)
+            if headRevision != self.headRevision:
+                self.headMdef = MDEF.load(PerforceUtility.getRevision(mdefLoc, headRevision))
+                if self.headRevision is not None:
+                    print(f"Head revision of the MDEF moved from #{self.headRevision} to #{headRevision}")
+                self.headRevision = headRevision
+        except Exception as e:
+            # Perforce might be unreachable for a while, The Head loaded last time is kept meanwhile
+            print('Error: Head revision of the MDEF could not be refreshed:', e)
+        return self.headMdef is not None
+
+    def regenerate(self):
+        """
+        Re-diffs the Modified MDEF against the Head MDEF, refreshed if a newer revision was submitted, and regenerates
+        only the affected Test-sets \n
+        :return: Returns True if regenerated successfully else False
+        """
+        startTime = time.perf_counter()
+        if not self.refreshHead():
+            return False
+        try:
+            with open(self.modifiedMdefLoc, 'r') as file:
+                mdefContent = json.load(file)
+            # Only the Tables & Stored Procedures missing in the Head revision are parsed, not the whole MDEF
+            mdefDiffContent = MDEF.findContentDifference(mdefContent, self.headMdef)
+            mdefDiff = MDEF(inFileContent=mdefDiffContent, withColumns=True) if mdefDiffContent is not None else None
+        except Exception as e:
+            # MDEF might be in the middle of an edit, Waits for the next change
+            print('Error: Modified MDEF could not be parsed:', e)
+            return False
+        if mdefDiff is None:
+            print('Warning: No difference found between the Modified MDEF and the Head revision')
+            self.mdefDiff = None
+            return False
+        affectedTestSets = self.findAffectedTestSets(self.mdefDiff, mdefDiff)
+        self.mdefDiff = mdefDiff
+        if len(affectedTestSets) == 0:
+            print(f"No Test-sets affected ({time.perf_counter() - startTime:.3f}s)")
+            return True
+
+        if not self.sampleTables(mdefDiff):
+            return False
+        tableColumnValues = dict()
+        for table in mdefDiff.Tables:
+            if table.Name in self.tableColumnValues:
+                columnNames = set(table.ColumnNames)
+                tableColumnValues[table.Name] = {
+                    columnName: columnValues
+                    for columnName, columnValues in self.tableColumnValues[table.Name].items()
+                    if columnName in columnNames
+                }
+
+        hadFailure = False
+        affectedTestSuites = dict()
+        for testSuite, testSets in self.requiredTestSuites.items():
+            for testSet, startingId in testSets.items():
+                if testSet not in affectedTestSets:
+                    continue
+                if testSet in TestSets.SQL_SELECT_ALL.value:
+                    hadFailure |= not TestWriter.writeSelectAllTestSets(testSuite, testSet, mdefDiff, startingId)
+                else:
+                    affectedTestSuites.setdefault(testSuite, dict())[testSet] = startingId
+        if len(affectedTestSuites) > 0 and len(tableColumnValues) > 0:
+            hadFailure |= not TestWriter.writeTestSets(affectedTestSuites, mdefDiff, self.externalArgs, False,
+                                                       tableColumnValues)
+        print(f"Regenerated {', '.join(sorted(affectedTestSets))} in {time.perf_counter() - startTime:.3f}s")
+        return not hadFailure
+
+    def findAffectedTestSets(self, inPreviousDiff: MDEF, inCurrentDiff: MDEF):
+        """
+        Finds the Test-sets affected by the change of each Table between the previous and the current MDEF difference
+        i.e. a Table added or removed affects every Test-set of the Tables, a change of its columns every such Test-set
+        except `SQL_SELECT_ALL` and a change of its Passdownable columns only the Test-sets filtering on those \n
+        :param inPreviousDiff: MDEF difference the Test-sets were generated last time from
+        :param inCurrentDiff: Current MDEF difference
+        :return: Returns the set of affected Test-set names
+        """
+        requiredTestSets = set()
+        for testSets in self.requiredTestSuites.values():
+            requiredTestSets.update(testSets.keys())
+        # Stored Procedures tests are generated from the External Arguments, hence never affected by the MDEF
+        tableTestSets = requiredTestSets - set(TestSets.SQL_SP.value)
+        if inPreviousDiff is None:
+            return tableTestSets
+
+        previousTables = {table.Name: table for table in inPreviousDiff.Tables}
+        currentTables = {table.Name: table for table in inCurrentDiff.Tables}
+        affectedTestSets = set()
+        for tableName in previousTables.keys() | currentTables.keys():
+            previousTable, currentTable = previousTables.get(tableName), currentTables.get(tableName)
+            if previousTable is None or currentTable is None:
+                print(f"Table {tableName} {'added' if previousTable is None else 'removed'}")
+                return tableTestSets
+            if previousTable != currentTable:
+                print(f"Columns of {tableName} changed")
+                affectedTestSets.update(tableTestSets - set(TestSets.SQL_SELECT_ALL.value))
+            elif inPreviousDiff.TableNames.get(tableName) != inCurrentDiff.TableNames.get(tableName):
+                print(f"Passdownable columns of {tableName} changed")
+                affectedTestSets.update(tableTestSets & set(TestSets.SQL_PASSDOWN.value +
+                                                            TestSets.PERF_FILTER_PAIRS.value))
+        return affectedTestSets
+
+    def sampleTables(self, inMdefDiff: MDEF):
+        """
+        Runs `SQL_SELECT_ALL` only for the Tables or Columns which have no warm column samples yet. The whole Test-set
+        is written so that every Table keeps its Test ID and Result-set, the Tables already sampled are excluded from
+        the discovery run \n
+        :param inMdefDiff: MDEF difference
+        :return: Returns True if all the Tables have column samples else False
+        """
+        warmTables = {table.Name for table in inMdefDiff.Tables if table.Name in self.sampledColumns and
+                      all(columnName in self.sampledColumns[table.Name] for columnName in table.ColumnNames or ())}
+        if len(warmTables) == len(inMdefDiff.Tables):
+            return True
+
+        print(f"Sampling {len(inMdefDiff.Tables) - len(warmTables)} Tables")
+        startingId = self.requiredTestSuites[TestSuites.Integration.name][TestSets.SQL_SELECT_ALL.name]
+        warmIDs = [testID for testID, table in enumerate(inMdefDiff.Tables, startingId) if table.Name in warmTables]
+        exclusions = [(startID, endID, 'Sample kept warm by the Watcher') for startID, endID in toIDRanges(warmIDs)]
+        tableColumnValues, tableRowCounts, columnSketches = dict(), dict(), dict()
+        if not TestWriter.writeSelectAllTestSets(TestSuites.Integration.name, TestSets.SQL_SELECT_ALL.name, inMdefDiff,
+                                                 startingId) or \
+                not self.testSetGenerator.discoverSamples(inMdefDiff, startingId, exclusions, warmTables,
+                                                          tableColumnValues, tableRowCounts, columnSketches):
+            return False
+        self.tableColumnValues.update(tableColumnValues)
+        # Tables without any rows are remembered as well so that those are not sampled on every change
+        for table in inMdefDiff.Tables:
+            if table.Name not in warmTables:
+                self.sampledColumns[table.Name] = set(table.ColumnNames or ())
+        return True
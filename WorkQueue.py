@@ -0,0 +1,380 @@
+"""
+Distributed Work Queue to spread the Touchstone execution across machines via a shared directory
+"""
+
+import json
+import os
+import re
+import socket
+import threading
+import time
+from shutil import copy, copytree, rmtree, ignore_patterns
+
+import Generator
+from Generator import TestSetGenerator, ResultSetGenerator, ResultSetCatalog, TestWriter, m_EnvsFolder, m_ResultSets
+from InputReader import InputReader
+from Scheduler import RunHistory, getRetryTimeout
+
+# Global Variables
+m_PendingFolder = 'Pending'
+m_ClaimedFolder = 'Claimed'
+m_DoneFolder = 'Done'
+m_FailedFolder = 'Failed'
+m_ResultsFolder = 'Results'
+m_WorkspaceFolder = 'Workspace'
+m_ClosedMarker = 'CLOSED'
+m_UnitFileExtension = '.json'
+m_HeartbeatInterval = 10
+m_HeartbeatTimeout = 60
+m_PollInterval = 2
+m_MaxAttempts = 3
+# Seconds the Coordinator waits without any Work Unit completing or any Worker sending the heartbeat
+m_IdleTimeout = 30 * 60
+m_TimeoutRegex = re.compile(r'<timeout>\d+</timeout>')
+
+
+def _writeUnit(inUnitPath: str, inUnit: dict):
+    """Writes the Work Unit atomically so that no Worker ever reads a partial Work Unit"""
+    tempFilePath = f"{inUnitPath}.{os.getpid()}.tmp"
+    with open(tempFilePath, 'w') as file:
+        json.dump(inUnit, file, indent=4)
+    os.replace(tempFilePath, inUnitPath)
+
+
+def _moveUnit(inUnitPath: str, inDestPath: str, inUpdate):
+    """
+    Moves the claimed Work Unit atomically along with the changes, Taken out of the `Claimed` folder first so that the
+    Coordinator and the Worker never both move it \n
+    :param inUnitPath: Location of the claimed Work Unit
+    :param inDestPath: Location to move the Work Unit to
+    :param inUpdate: Function changing the read Work Unit in place
+    :return: Returns the moved Work Unit, None if it got moved meanwhile
+    """
+    movingPath = f"{inUnitPath}.{socket.gethostname()}_{os.getpid()}.moving"
+    try:
+        os.rename(inUnitPath, movingPath)
+    except (FileNotFoundError, FileExistsError, PermissionError):
+        return None
+    unit = _readUnit(movingPath)
+    if unit is None:
+        os.remove(movingPath)
+        return None
+    inUpdate(unit)
+    _writeUnit(movingPath, unit)
+    os.replace(movingPath, inDestPath)
+    return unit
+
+
+def _readUnit(inUnitPath: str):
+    """Reads the Work Unit, Returns None if the Work Unit got moved meanwhile"""
+    try:
+        with open(inUnitPath, 'r') as file:
+            return json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+class WorkQueueCoordinator:
+    """
+    Represents the Coordinator which generates the Test-sets, publishes the Work Units i.e. a Test-set of a Testsuite or
+    an ID-range Shard of the same and assembles the Result-sets returned by the Workers.
+    """
+
+    def __init__(self, inInputFile: str, inQueueDir: str, inShardSize: int = None,
+                 inHeartbeatTimeout: int = m_HeartbeatTimeout, inMaxAttempts: int = m_MaxAttempts,
+                 inIdleTimeout: int = m_IdleTimeout):
+        self.inputFileName = inInputFile
+        self.inputFile = InputReader(inInputFile)
+        self.queueDir = os.path.abspath(inQueueDir)
+        self.shardSize = inShardSize if inShardSize is not None and inShardSize > 0 else None
+        self.heartbeatTimeout = inHeartbeatTimeout
+        self.maxAttempts = inMaxAttempts
+        self.idleTimeout = inIdleTimeout
+        self.outputFolder = Generator.m_OutputFolder
+
+    def run(self):
+        if TestSetGenerator(self.inputFileName).run():
+            units = self.publish()
+            if len(units) > 0:
+                return self.collect(units)
+            print('Warning: No tests found to publish')
+        return False
+
+    def publish(self):
+        """
+        Publishes the generated Testsuites and one Work Unit per Test-set or per ID-range Shard of it \n
+        :return: Returns Work Unit ID and Work Unit Mapping
+        """
+        if os.path.exists(self.queueDir):
+            rmtree(self.queueDir)
+        for folder in [m_PendingFolder, m_ClaimedFolder, m_DoneFolder, m_FailedFolder, m_ResultsFolder]:
+            os.makedirs(os.path.join(self.queueDir, folder))
+
+        workspacePath = os.path.join(self.queueDir, m_WorkspaceFolder)
+        copytree(os.path.join(self.outputFolder, m_EnvsFolder), os.path.join(workspacePath, m_EnvsFolder))
+        units = dict()
+        runHistory = RunHistory(self.outputFolder)
+        for testSuite, testSets in self.inputFile.getRequiredTestSuites().items():
+            copytree(os.path.join(self.outputFolder, testSuite), os.path.join(workspacePath, testSuite),
+                     ignore=ignore_patterns(m_ResultSets))
+            os.makedirs(os.path.join(workspacePath, testSuite, m_ResultSets), exist_ok=True)
+            for testSet in testSets:
+                testIDs = sorted(ResultSetGenerator.getTestIDs(testSuite, testSet))
+                if len(testIDs) == 0:
+                    continue
+                shardSize = self.shardSize if self.shardSize is not None else len(testIDs)
+                for index in range(0, len(testIDs), shardSize):
+                    shardIDs = testIDs[index:index + shardSize]
+                    unit = {
+                        'UnitID': f"{testSuite}-{testSet}-{shardIDs[0]}-{shardIDs[-1]}",
+                        'TestSuite': testSuite,
+                        'TestSet': testSet,
+                        'StartID': shardIDs[0],
+                        'EndID': shardIDs[-1],
+                        'FirstID': testIDs[0],
+                        'LastID': testIDs[-1],
+                        'Attempts': 0,
+                        'MaxAttempts': self.maxAttempts,
+                        # Timeout of each Shard follows the observed latency of its tests
+                        'Timeout': runHistory.deriveTimeout(testSuite, testSet, shardIDs,
+                                                            self.inputFile.getTimeoutHeadroom())
+                    }
+                    unit['TestEnv'] = ResultSetGenerator.writeUnitTestEnv(
+                        self.inputFile.getConnectionString(), testSuite, testSet, unit['Timeout'],
+                        f"_{shardIDs[0]}-{shardIDs[-1]}", len(shardIDs), runHistory.getTimeoutRate(testSuite, testSet))
+                    copy(os.path.join(self.outputFolder, m_EnvsFolder, unit['TestEnv']),
+                         os.path.join(workspacePath, m_EnvsFolder, unit['TestEnv']))
+                    _writeUnit(os.path.join(self.queueDir, m_PendingFolder, unit['UnitID'] + m_UnitFileExtension),
+                               unit)
+                    units[unit['UnitID']] = unit
+        print(f"Published {len(units)} Work Units to {self.queueDir}")
+        return units
+
+    def requeueDeadUnits(self):
+        """
+        Moves the Work Units back to the queue whose Workers stopped sending the heartbeat \n
+        :return: Returns the number of Work Units whose Workers are alive
+        """
+        claimedPath = os.path.join(self.queueDir, m_ClaimedFolder)
+        aliveUnits = 0
+        for fileName in os.listdir(claimedPath):
+            if not fileName.endswith(m_UnitFileExtension):
+                continue
+            unitPath = os.path.join(claimedPath, fileName)
+            try:
+                if time.time() - os.path.getmtime(unitPath) <= self.heartbeatTimeout:
+                    aliveUnits += 1
+                    continue
+            except FileNotFoundError:
+                continue
+            unit = _readUnit(unitPath)
+            if unit is None:
+                continue
+            destFolder = m_PendingFolder if unit['Attempts'] + 1 < self.maxAttempts else m_FailedFolder
+
+            def requeue(ioUnit):
+                ioUnit['Attempts'] += 1
+                ioUnit.pop('Worker', None)
+            # Worker might have completed or failed the unit meanwhile
+            if _moveUnit(unitPath, os.path.join(self.queueDir, destFolder, fileName), requeue) is not None:
+                print(f"Warning: Worker {unit.get('Worker')} of {unit['UnitID']} seems dead, "
+                      f"moving the unit to {destFolder}")
+        return aliveUnits
+
+    def collect(self, inUnits: dict):
+        """
+        Waits for all the Work Units and assembles the returned Result-sets within `Output/<TestSuite>/ResultSets` \n
+        :param inUnits: Work Unit ID and Work Unit Mapping
+        :return: Returns True if all the Work Units succeeded else False
+        """
+        completedUnits, failedUnits = set(), set()
+        lastActivityTime = time.time()
+        while len(completedUnits) + len(failedUnits) < len(inUnits):
+            finishedUnits = len(completedUnits) + len(failedUnits)
+            if self.requeueDeadUnits() > 0:
+                lastActivityTime = time.time()
+            for fileName in os.listdir(os.path.join(self.queueDir, m_DoneFolder)):
+                unitID = os.path.splitext(fileName)[0]
+                unitResultsPath = os.path.join(self.queueDir, m_ResultsFolder, unitID)
+                if unitID in completedUnits or not os.path.exists(unitResultsPath):
+                    continue
+                # A slow Worker might have completed the unit after it got re-queued
+                pendingPath = os.path.join(self.queueDir, m_PendingFolder, fileName)
+                if os.path.exists(pendingPath):
+                    os.remove(pendingPath)
+                resultSetsPath = os.path.join(self.outputFolder, inUnits[unitID]['TestSuite'], m_ResultSets)
+                for resultSetFile in os.listdir(unitResultsPath):
+                    copy(os.path.join(unitResultsPath, resultSetFile), resultSetsPath)
+                ResultSetCatalog.update(inUnits[unitID]['TestSuite'])
+                completedUnits.add(unitID)
+                print(f"Collected {unitID} ({len(completedUnits)}/{len(inUnits)})")
+            for fileName in os.listdir(os.path.join(self.queueDir, m_FailedFolder)):
+                unitID = os.path.splitext(fileName)[0]
+                if unitID not in failedUnits and unitID not in completedUnits:
+                    print(f"Error: {unitID} failed on every attempt")
+                    failedUnits.add(unitID)
+            if len(completedUnits) + len(failedUnits) > finishedUnits:
+                lastActivityTime = time.time()
+            elif time.time() - lastActivityTime > self.idleTimeout:
+                remainingUnits = set(inUnits) - completedUnits - failedUnits
+                print(f"Error: No Work Unit completed and no Worker alive for {self.idleTimeout}s, giving up on "
+                      f"{len(remainingUnits)} Work Units i.e. {', '.join(sorted(remainingUnits))}")
+                failedUnits.update(remainingUnits)
+                break
+            if len(completedUnits) + len(failedUnits) < len(inUnits):
+                time.sleep(m_PollInterval)
+
+        # Lets the Workers know that no more Work Units would be published
+        open(os.path.join(self.queueDir, m_ClosedMarker), 'w').close()
+        for testSuite in {unit['TestSuite'] for unit in inUnits.values()}:
+            if self.inputFile.getCompression(testSuite) is not None:
+                ResultSetGenerator.compressResultSets(testSuite, self.inputFile.getCompression(testSuite))
+        return len(failedUnits) == 0
+
+
+class WorkQueueWorker:
+    """
+    Represents the Worker which pulls the Work Units from the queue, runs Touchstone for them within its own
+    `Output/Worker_<ID>` tree and returns the Result-sets.
+    """
+
+    def __init__(self, inQueueDir: str, inWorkerID: str = None, inPollInterval: int = m_PollInterval):
+        self.queueDir = os.path.abspath(inQueueDir)
+        self.workerID = inWorkerID if inWorkerID is not None else f"{socket.gethostname()}_{os.getpid()}"
+        self.pollInterval = inPollInterval
+        self.outputFolder = os.path.join(Generator.m_OutputFolder, f"Worker_{self.workerID}")
+
+    def run(self):
+        Generator.m_OutputFolder = self.outputFolder
+        if not TestSetGenerator.setupOutputFolder():
+            print('Error: Touchstone could not be setup for the Worker')
+            return False
+        processedUnits = 0
+        while True:
+            unitPath = self.claimUnit()
+            if unitPath is not None:
+                self.processUnit(unitPath)
+                processedUnits += 1
+            elif os.path.exists(os.path.join(self.queueDir, m_ClosedMarker)):
+                print(f"Worker {self.workerID} processed {processedUnits} Work Units")
+                return True
+            else:
+                time.sleep(self.pollInterval)
+
+    def claimUnit(self):
+        """
+        Claims the next pending Work Unit by moving it atomically within the `Claimed` folder \n
+        :return: Returns the location of the claimed Work Unit, None if nothing is pending
+        """
+        pendingPath = os.path.join(self.queueDir, m_PendingFolder)
+        if not os.path.exists(pendingPath):
+            return None
+        for fileName in sorted(os.listdir(pendingPath)):
+            if not fileName.endswith(m_UnitFileExtension):
+                continue
+            claimedPath = os.path.join(self.queueDir, m_ClaimedFolder, fileName)
+            try:
+                os.rename(os.path.join(pendingPath, fileName), claimedPath)
+            except (FileNotFoundError, FileExistsError, PermissionError):
+                # Another Worker claimed it first
+                continue
+            unit = _readUnit(claimedPath)
+            if unit is not None:
+                unit['Worker'] = self.workerID
+                _writeUnit(claimedPath, unit)
+                return claimedPath
+        return None
+
+    def _sendHeartbeat(self, inUnitPath: str, inStopEvent: threading.Event):
+        while not inStopEvent.wait(m_HeartbeatInterval):
+            try:
+                os.utime(inUnitPath)
+            except FileNotFoundError:
+                return
+
+    def prepareWorkspace(self, inUnit: dict):
+        """Copies the published Envs & Testsuite of the Work Unit within the Worker's own Output tree"""
+        workspacePath = os.path.join(self.queueDir, m_WorkspaceFolder)
+        for folder in [m_EnvsFolder, inUnit['TestSuite']]:
+            localPath = os.path.join(self.outputFolder, folder)
+            if os.path.exists(localPath):
+                rmtree(localPath)
+            copytree(os.path.join(workspacePath, folder), localPath)
+        if inUnit['Attempts'] > 0 and 'TestEnv' in inUnit:
+            # Unit failed before i.e. its queries might have timed out, so it is re-run with a higher timeout
+            testEnvPath = os.path.join(self.outputFolder, m_EnvsFolder, inUnit['TestEnv'])
+            timeout = inUnit['Timeout']
+            for _ in range(inUnit['Attempts']):
+                timeout = getRetryTimeout(timeout)
+            with open(testEnvPath, 'r') as file:
+                testEnv = file.read()
+            with open(testEnvPath, 'w') as file:
+                file.write(m_TimeoutRegex.sub(f"<timeout>{timeout}</timeout>", testEnv))
+
+    def processUnit(self, inUnitPath: str):
+        """
+        Runs Touchstone for the claimed Work Unit and returns its Result-sets to the queue \n
+        :param inUnitPath: Location of the claimed Work Unit
+        :return: Returns True if succeeded else False
+        """
+        unit = _readUnit(inUnitPath)
+        if unit is None:
+            return False
+        stopHeartbeat = threading.Event()
+        heartbeat = threading.Thread(target=self._sendHeartbeat, args=(inUnitPath, stopHeartbeat), daemon=True)
+        heartbeat.start()
+        try:
+            testSuite, testSet = unit['TestSuite'], unit['TestSet']
+            self.prepareWorkspace(unit)
+            testSuiteFileName = Generator.m_TestSuite
+            if unit['StartID'] > unit['FirstID'] or unit['EndID'] < unit['LastID']:
+                # Excludes every test outside of the Shard
+                exclusions = list()
+                if unit['StartID'] > unit['FirstID']:
+                    exclusions.append((unit['FirstID'], unit['StartID'] - 1, 'Outside of the Work Unit'))
+                if unit['EndID'] < unit['LastID']:
+                    exclusions.append((unit['EndID'] + 1, unit['LastID'], 'Outside of the Work Unit'))
+                testSuiteFileName = f"TestSuite_{unit['UnitID']}{Generator.m_TestFilesExtension}"
+                TestWriter.writeTestSuites({testSuite: [testSet]}, {testSet: exclusions}, testSuiteFileName)
+            succeeded = ResultSetGenerator.executeTestSuite(testSuite, testSet, testSuiteFileName,
+                                                            unit.get('TestEnv', Generator.m_TestEnv))
+        except Exception as e:
+            print(f"Error: {unit['UnitID']} failed on {self.workerID}:", e)
+            succeeded = False
+        finally:
+            stopHeartbeat.set()
+            heartbeat.join()
+
+        if succeeded:
+            self.returnResultSets(unit)
+            try:
+                os.replace(inUnitPath, os.path.join(self.queueDir, m_DoneFolder, os.path.basename(inUnitPath)))
+            except FileNotFoundError:
+                # Coordinator re-queued the unit meanwhile, marks it done regardless as the results are delivered
+                _writeUnit(os.path.join(self.queueDir, m_DoneFolder, os.path.basename(inUnitPath)), unit)
+        else:
+            destFolder = m_PendingFolder if unit['Attempts'] + 1 < unit.get('MaxAttempts', m_MaxAttempts) \
+                else m_FailedFolder
+
+            def fail(ioUnit):
+                ioUnit['Attempts'] += 1
+                ioUnit.pop('Worker', None)
+            # Gives up if the Coordinator re-queued the unit meanwhile, so that it is not queued twice
+            _moveUnit(inUnitPath, os.path.join(self.queueDir, destFolder, os.path.basename(inUnitPath)), fail)
+        return succeeded
+
+    def returnResultSets(self, inUnit: dict):
+        """Copies the Result-sets of the Work Unit within the queue's `Results/<UnitID>` folder"""
+        resultSetsPath = os.path.join(self.outputFolder, inUnit['TestSuite'], m_ResultSets)
+        tempResultsPath = os.path.join(self.queueDir, m_ResultsFolder, f"{inUnit['UnitID']}.{self.workerID}.tmp")
+        os.makedirs(tempResultsPath, exist_ok=True)
+        for testID in range(inUnit['StartID'], inUnit['EndID'] + 1):
+            resultSetPath = os.path.join(resultSetsPath, ResultSetGenerator.getResultSetFileName(inUnit['TestSet'],
+                                                                                                  testID))
+            if os.path.exists(resultSetPath):
+                copy(resultSetPath, tempResultsPath)
+        try:
+            os.rename(tempResultsPath, os.path.join(self.queueDir, m_ResultsFolder, inUnit['UnitID']))
+        except OSError:
+            # Result-sets of the unit were already returned by another Worker
+            rmtree(tempResultsPath)
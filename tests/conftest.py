@@ -0,0 +1,11 @@
+"""
+Shared set up of the tests i.e. the modules of the repository importable and `TOUCHSTONE_DIR` defined, as Generator
+reads it while being imported
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('TOUCHSTONE_DIR', tempfile.gettempdir())
@@ -0,0 +1,62 @@
+import gzip
+import itertools
+import os
+
+from BaselineStore import BaselineStore, hashCanonical, m_New, m_Changed, m_Unchanged
+
+m_ResultSet = '<ResultSet GeneratedOn="{}">\n  <Row><Value>{}</Value></Row>\n</ResultSet>\n'
+# Distinct modification times so that the cached hash of a rewritten Result-set is never reused
+m_ModificationTimes = itertools.count(1_700_000_000)
+
+
+def writeResultSet(inFilePath, inValue, inGeneratedOn='2026-01-01'):
+    with open(inFilePath, 'w', encoding='utf-8') as file:
+        file.write(m_ResultSet.format(inGeneratedOn, inValue))
+    mTime = next(m_ModificationTimes)
+    os.utime(inFilePath, (mTime, mTime))
+    return inFilePath
+
+
+def testHashCanonicalIgnoresVolatileFieldsIndentationAndCompression(tmp_path):
+    plainPath = writeResultSet(str(tmp_path / 'Plain.xml'), 1)
+    otherRunPath = str(tmp_path / 'OtherRun.xml')
+    with open(otherRunPath, 'w', encoding='utf-8') as file:
+        file.write(m_ResultSet.format('2026-02-02', 1).replace('  ', '').replace('\n', '\r\n'))
+    gzipPath = str(tmp_path / 'Plain.xml.gz')
+    with open(plainPath, 'rb') as file, gzip.open(gzipPath, 'wb') as gzipFile:
+        gzipFile.write(file.read())
+    assert hashCanonical(plainPath) == hashCanonical(otherRunPath) == hashCanonical(gzipPath)
+    assert hashCanonical(plainPath) != hashCanonical(writeResultSet(str(tmp_path / 'Other.xml'), 2))
+
+
+def testSyncReportsAndCopiesOnlyChangedBaselines(tmp_path):
+    runPath, workspacePath = tmp_path / 'Run', tmp_path / 'Workspace'
+    runPath.mkdir()
+    store = BaselineStore(str(tmp_path / 'Output'))
+    os.makedirs(str(tmp_path / 'Output'))
+    resultSets = [('SQL_SELECT_ALL', testID, writeResultSet(str(runPath / f"{testID}.xml"), testID))
+                  for testID in (1, 2)]
+
+    changes = store.sync('Integration', resultSets, str(workspacePath))
+    assert changes[m_New] == ['1.xml', '2.xml']
+    assert changes['Synced'] == ['1.xml', '2.xml']
+    assert sorted(os.listdir(str(workspacePath))) == ['1.xml', '2.xml']
+
+    # Only the Timestamp of test 1 differs whereas the result of test 2 changed
+    writeResultSet(resultSets[0][2], 1, '2026-03-03')
+    writeResultSet(resultSets[1][2], 20)
+    changes = store.sync('Integration', resultSets, str(workspacePath))
+    assert (changes[m_New], changes[m_Changed], changes[m_Unchanged]) == ([], ['2.xml'], ['1.xml'])
+    assert changes['Synced'] == ['2.xml']
+    assert hashCanonical(str(workspacePath / '2.xml')) == hashCanonical(resultSets[1][2])
+
+    # Workspace copy kept compressed is the same baseline, left as it is
+    os.remove(str(workspacePath / '1.xml'))
+    with open(resultSets[0][2], 'rb') as file, gzip.open(str(workspacePath / '1.xml.gz'), 'wb') as gzipFile:
+        gzipFile.write(file.read())
+    changes = store.sync('Integration', resultSets, str(workspacePath))
+    assert changes[m_Unchanged] == ['1.xml', '2.xml']
+    assert changes['Synced'] == []
+    assert sorted(os.listdir(str(workspacePath))) == ['1.xml.gz', '2.xml']
+    # Each distinct canonical result is stored once
+    assert sum(len(files) for _, _, files in os.walk(store.storePath)) == 3
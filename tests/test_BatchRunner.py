@@ -0,0 +1,29 @@
+import pytest
+
+import BatchRunner
+import Generator
+from Runner import parseBatchArguments
+
+
+class _FailingGenerator:
+    def __init__(self, inInputFile):
+        pass
+
+    def run(self):
+        raise RuntimeError('Driver failed')
+
+
+def testRunDriverRestoresOutputFolderAfterAFailedDriver(monkeypatch, tmp_path):
+    monkeypatch.setattr(Generator, 'm_OutputFolder', str(tmp_path))
+    monkeypatch.setattr(BatchRunner, 'TestSetGenerator', _FailingGenerator)
+    for _ in range(2):
+        summary = BatchRunner._runDriver('input.json', 'DriverA', False)
+        assert not summary['Succeeded']
+        assert summary['Error'] == 'RuntimeError: Driver failed'
+        assert Generator.m_OutputFolder == str(tmp_path)
+
+
+def testParseBatchArguments():
+    assert parseBatchArguments(['-batch', 'a', '-workers', '3', 'b']) == (['a', 'b'], 3)
+    with pytest.raises(ValueError, match='-workers expects a number, got x'):
+        parseBatchArguments(['-batch', 'a', '-workers', 'x'])
@@ -0,0 +1,46 @@
+import os
+
+import pytest
+
+import FastResultSetReader
+from Generator import ResultSetGenerator
+
+m_FixturesPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'ResultSets')
+m_FastPathFixtures = ['NullsAndEmpty.xml', 'Entities.xml', 'NonASCII.xml', 'ZeroRows.xml', 'ZeroRowsOpen.xml',
+                      'EmptyRow.xml']
+m_ParserFixtures = ['Comment.xml']
+
+
+@pytest.mark.parametrize('inFileName', m_FastPathFixtures)
+@pytest.mark.parametrize('inMaxRows', [0, 2, 30])
+def testFastPathMatchesParser(inFileName, inMaxRows):
+    filePath = os.path.join(m_FixturesPath, inFileName)
+    actual = FastResultSetReader.readResultSet(filePath, inMaxRows)
+    assert actual is not None
+    assert actual[:4] == ResultSetGenerator._readResultSet(filePath, inMaxRows, inFastPath=False)[:4]
+
+
+@pytest.mark.parametrize('inFileName', m_FastPathFixtures)
+def testFastPathStreamsRowsLikeParser(inFileName):
+    filePath = os.path.join(m_FixturesPath, inFileName)
+    expectedRows, actualRows = list(), list()
+    ResultSetGenerator._readResultSet(filePath, 0, inFastPath=False, inOnRow=expectedRows.append)
+    assert FastResultSetReader.readResultSet(filePath, 0, actualRows.append) is not None
+    assert actualRows == expectedRows
+
+
+@pytest.mark.parametrize('inFileName', m_ParserFixtures)
+def testUnsupportedSyntaxFallsBackToParser(inFileName):
+    filePath = os.path.join(m_FixturesPath, inFileName)
+    assert FastResultSetReader.readResultSet(filePath, 30) is None
+    assert ResultSetGenerator._readResultSet(filePath, 30)[:4] == \
+        ResultSetGenerator._readResultSet(filePath, 30, inFastPath=False)[:4]
+
+
+def testExpectedValues():
+    rowDescriptionsCount, rowCount, columns, rows, bytesRead = FastResultSetReader.readResultSet(
+        os.path.join(m_FixturesPath, 'NullsAndEmpty.xml'), 30)
+    assert (rowDescriptionsCount, rowCount) == (1, 4)
+    assert columns == [('Id', 'SQL_INTEGER'), ('Name', 'SQL_WVARCHAR')]
+    assert rows == [[(False, '1'), ('true', None)], [(False, '2'), (False, None)], [(False, '3'), (False, None)],
+                    [('true', None), (False, '  padded  ')]]
@@ -0,0 +1,20 @@
+import GenUtility
+from GenUtility import PerforceUtility
+
+
+def testLatestRevisionIsReusedWithinItsTTL(monkeypatch, tmp_path):
+    mdefPath = tmp_path / 'MDEF.json'
+    mdefPath.write_text('{}')
+    now, submitted = [1000.0], [b'//depot/MDEF.json#3 - edit change 1 (text)']
+    monkeypatch.setattr(GenUtility.time, 'time', lambda: now[0])
+    monkeypatch.setattr(GenUtility.subprocess, 'check_output', lambda inCommand: submitted[0])
+    monkeypatch.setattr(PerforceUtility, 'm_LatestRevisions', dict())
+
+    assert PerforceUtility.getLatestRevisionNumber(str(mdefPath)) == 3
+    submitted[0] = b'//depot/MDEF.json#4 - edit change 2 (text)'
+    now[0] += GenUtility.m_LatestRevisionTTL - 1
+    assert PerforceUtility.getLatestRevisionNumber(str(mdefPath)) == 3
+    assert PerforceUtility.getLatestRevisionNumber(str(mdefPath), inMaxAge=0) == 4
+    submitted[0] = b'//depot/MDEF.json#5 - edit change 3 (text)'
+    now[0] += GenUtility.m_LatestRevisionTTL
+    assert PerforceUtility.getLatestRevisionNumber(str(mdefPath)) == 5
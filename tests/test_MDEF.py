@@ -0,0 +1,43 @@
+from Generator import MDEF
+
+
+def column(inName: str, inSQLType: str = 'SQL_INTEGER', inPassdownable: bool = False):
+    return {MDEF.m_Name: inName, MDEF.m_Passdownable: inPassdownable, MDEF.m_MetaData: {MDEF.m_SQLType: inSQLType}}
+
+
+def table(inName: str, *inColumns):
+    return {MDEF.m_TableName: inName, MDEF.m_APIAccess: {'ReadAPI': {}}, MDEF.m_Columns: list(inColumns)}
+
+
+def storedProcedure(inName: str):
+    return {MDEF.m_Name: inName, MDEF.m_ResultTable: {MDEF.m_Columns: [column('Id')]}}
+
+
+def testNewTableWithoutStoredProcedures():
+    head = MDEF(inFileContent={MDEF.m_Tables: [table('A', column('Id'))]})
+    modified = MDEF(inFileContent={MDEF.m_Tables: [table('A', column('Id')), table('B', column('Id'))]})
+    assert modified.findDifference(head) == {MDEF.m_StoredProcedures: [],
+                                             MDEF.m_Tables: [table('B', column('Id'))]}
+    mdefDiff = MDEF(inFileContent=modified.findDifference(head), withColumns=True)
+    assert [diffTable.Name for diffTable in mdefDiff.Tables] == ['B']
+    assert mdefDiff.MDEFStoredProcedures == []
+
+
+def testNewStoredProcedureOnly():
+    head = MDEF(inFileContent={MDEF.m_Tables: [table('A')], MDEF.m_StoredProcedures: [storedProcedure('P')]})
+    modified = MDEF(inFileContent={MDEF.m_Tables: [table('A')],
+                                   MDEF.m_StoredProcedures: [storedProcedure('P'), storedProcedure('Q')]})
+    assert modified.findDifference(head) == {MDEF.m_StoredProcedures: [storedProcedure('Q')], MDEF.m_Tables: []}
+    assert MDEF(inFileContent=modified.findDifference(head), withColumns=True).Tables == []
+
+
+def testNoDifference():
+    head = MDEF(inFileContent={MDEF.m_Tables: [table('A')], MDEF.m_StoredProcedures: [storedProcedure('P')]})
+    assert MDEF(inFileContent=dict(head.MDEFContent)).findDifference(head) is None
+    assert head.findDifference(None) is None
+
+
+def testEverythingIsNewAgainstEmptyMDEF():
+    head = MDEF(inFileContent={MDEF.m_Tables: []})
+    assert MDEF.findContentDifference({MDEF.m_Tables: [table('A')]}, head) == \
+        {MDEF.m_StoredProcedures: [], MDEF.m_Tables: [table('A')]}
@@ -0,0 +1,43 @@
+import pytest
+
+from MDEFRecords import _Record, Table, VirtualTable, StoredProcedure
+
+
+def testRecordRequiresGetField():
+    with pytest.raises(TypeError):
+        _Record()
+
+
+def testRecordsKeepSlots():
+    assert not hasattr(Table('Account', [('Id', 'SQL_INTEGER')]), '__dict__')
+    assert not hasattr(VirtualTable('Account_Items', [('Id', 'SQL_INTEGER')]), '__dict__')
+
+
+def testTableFields():
+    table = Table('Account', [('Id', 'SQL_INTEGER'), ('Name', 'SQL_WVARCHAR')], (('ReadAPI', ('Id',)),))
+    assert table.toDict() == {
+        'Name': 'Account',
+        'Columns': {'Id': 'SQL_INTEGER', 'Name': 'SQL_WVARCHAR'},
+        'APIAccess': [{'ReadAPI': ['Id']}]
+    }
+    assert 'Virtual' not in table
+    assert table.get('Virtual') is None
+    with pytest.raises(KeyError):
+        table['Virtual']
+    with pytest.raises(KeyError):
+        table._getField('Virtual')
+
+
+def testVirtualTableFields():
+    virtualTable = VirtualTable('Account_Items', [('Id', 'SQL_INTEGER')])
+    assert virtualTable.toDict() == {'Name': 'Account_Items', 'Columns': {'Id': 'SQL_INTEGER'}, 'Virtual': True}
+    with pytest.raises(KeyError):
+        virtualTable['APIAccess']
+
+
+def testStoredProcedureFields():
+    storedProcedure = StoredProcedure('Procedure', [('Id', 'SQL_INTEGER')])
+    assert storedProcedure.toDict() == {'Name': 'Procedure', 'Columns': [{'Id': 'SQL_INTEGER'}]}
+    assert StoredProcedure('Procedure')['Columns'] is None
+    with pytest.raises(KeyError):
+        storedProcedure._getField('Virtual')
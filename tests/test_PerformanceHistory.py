@@ -0,0 +1,41 @@
+import json
+
+import PerformanceHistory
+from PerformanceHistory import PerformanceHistory as History
+
+
+def testFirstRunHasNoRegressions(tmp_path):
+    history = History(str(tmp_path))
+    assert history.report([('Performance', 'PERF_FULL_SCAN', 'SELECT * FROM A', 10.0)]) == list()
+    with open(str(tmp_path / PerformanceHistory.m_PerformanceReport)) as file:
+        report = json.load(file)
+    assert (report['BaselineRunID'], report['Regressions']) == (None, list())
+
+
+def testRegressionsBeyondTheThresholdAndTheFloor(tmp_path):
+    history = History(str(tmp_path))
+    history.recordRun([('Performance', 'PERF_FULL_SCAN', 'SELECT * FROM A', 10.0),
+                       ('Performance', 'PERF_FULL_SCAN', 'SELECT * FROM B', 1.0),
+                       ('Performance', 'PERF_FULL_SCAN', 'SELECT * FROM C', 10.0),
+                       ('Performance', 'PERF_PROJECTION', 'SELECT Id FROM D', 4.0)])
+    # A within the threshold, B beyond it by less than the floor, C & D beyond both, E never run before
+    runID = history.recordRun([('Performance', 'PERF_FULL_SCAN', 'SELECT * FROM A', 12.5),
+                               ('Performance', 'PERF_FULL_SCAN', 'SELECT * FROM B', 1.4),
+                               ('Performance', 'PERF_FULL_SCAN', 'select *  from c', 12.6),
+                               ('Performance', 'PERF_PROJECTION', 'SELECT Id FROM D', 8.0),
+                               ('Performance', 'PERF_PROJECTION', 'SELECT Id FROM E', 100.0)])
+    assert history.findRegressions(runID) == [('Performance', 'PERF_PROJECTION', 'SELECT Id FROM D', 4.0, 8.0),
+                                              ('Performance', 'PERF_FULL_SCAN', 'select *  from c', 10.0, 12.6)]
+    assert history.findRegressions(runID, 0.2) == [
+        ('Performance', 'PERF_PROJECTION', 'SELECT Id FROM D', 4.0, 8.0),
+        ('Performance', 'PERF_FULL_SCAN', 'select *  from c', 10.0, 12.6),
+        ('Performance', 'PERF_FULL_SCAN', 'SELECT * FROM A', 10.0, 12.5)]
+    assert history.findRegressions(runID, 0.9) == [('Performance', 'PERF_PROJECTION', 'SELECT Id FROM D', 4.0, 8.0)]
+
+
+def testRegressionsAreAgainstThePreviousRunOnly(tmp_path):
+    history = History(str(tmp_path))
+    history.recordRun([('Performance', 'PERF_FULL_SCAN', 'SELECT * FROM A', 1.0)])
+    history.recordRun([('Performance', 'PERF_FULL_SCAN', 'SELECT * FROM A', 10.0)])
+    runID = history.recordRun([('Performance', 'PERF_FULL_SCAN', 'SELECT * FROM A', 10.0)])
+    assert history.findRegressions(runID) == list()
@@ -0,0 +1,27 @@
+import pytest
+
+from GenUtility import toIDRanges
+from QueryDeduplicator import QueryDeduplicator
+
+
+@pytest.mark.parametrize('inIDs, inRanges', [
+    ([], []),
+    ([4], [(4, 4)]),
+    ([5, 1, 2, 3, 7, 8], [(1, 3), (5, 5), (7, 8)]),
+    ([2, 2, 3], [(2, 3)]),
+])
+def testToIDRanges(inIDs, inRanges):
+    assert toIDRanges(inIDs) == inRanges
+
+
+def testDuplicatesAreExcludedAsRanges():
+    tests = {('SQL', 'SQL_LIKE', testID): f"SELECT a FROM t{testID}" for testID in range(1, 6)}
+    tests.update({('SQL', 'SQL_AND_OR', 1): 'select a  from t1', ('SQL', 'SQL_AND_OR', 2): 'SELECT a FROM t2',
+                  ('SQL', 'SQL_AND_OR', 3): 'SELECT b FROM t1', ('SQL', 'SQL_AND_OR', 4): 'SELECT a FROM t4',
+                  ('SP', 'SQL_SP', 1): 'SELECT a FROM t5'})
+    deduplicator = QueryDeduplicator(tests)
+    assert deduplicator.getSavedExecutions() == 4
+    # Primary test of a query is the first one in (Testsuite, Test-set, Test ID) order
+    assert deduplicator.getExclusions('SQL') == {
+        'SQL_LIKE': [(1, 2, 'Duplicate query, Result-set is shared'), (4, 5, 'Duplicate query, Result-set is shared')]}
+    assert deduplicator.getExclusions('SP') == dict()
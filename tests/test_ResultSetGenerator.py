@@ -0,0 +1,127 @@
+import os
+import re
+
+import pytest
+
+import FastResultSetReader
+import Generator
+from test_MDEF import column, table
+
+
+class _InputFile:
+    def getConnectionString(self):
+        return 'Driver=Test'
+
+
+@pytest.fixture
+def retry(monkeypatch, tmp_path):
+    """
+    `retryTimedOutTests` of a `SQL/SQL_LIKE` Work Unit of the tests 1 to 4 whose Result-sets are missing as per
+    `missing` before and after the re-run, without running Touchstone
+    """
+    missing = {'first': [], 'retry': []}
+    monkeypatch.setattr(Generator, 'm_OutputFolder', str(tmp_path))
+    monkeypatch.setattr(Generator.ResultSetCatalog, 'getMissingTestIDs',
+                        lambda inTestSuite, inTestSet, inTestIDs, inSince=None:
+                        missing['retry' if inSince == 998.0 else 'first'])
+    monkeypatch.setattr(Generator.ResultSetGenerator, 'getTestIDs', lambda inTestSuite, inTestSet: [1, 2, 3, 4])
+    monkeypatch.setattr(Generator.TestWriter, 'writeTestSuites', lambda *inArgs: True)
+    monkeypatch.setattr(Generator.ResultSetGenerator, 'writeUnitTestEnv', lambda *inArgs: Generator.m_TestEnv)
+    monkeypatch.setattr(Generator.ResultSetGenerator, 'executeTestSuite', lambda *inArgs: True)
+    monkeypatch.setattr(Generator.time, 'time', lambda: 1000.0)
+    generator = Generator.ResultSetGenerator.__new__(Generator.ResultSetGenerator)
+    generator.inputFile = _InputFile()
+
+    def run(inFirstMissingIDs: list, inRetryMissingIDs: list, inFirstResult: bool = True):
+        missing.update({'first': inFirstMissingIDs, 'retry': inRetryMissingIDs})
+        results = {('SQL', 'SQL_LIKE'): inFirstResult}
+        stillMissing = generator.retryTimedOutTests({('SQL', 'SQL_LIKE'): [1, 2, 3, 4]}, {('SQL', 'SQL_LIKE'): 60},
+                                                    0.0, results)
+        return results[('SQL', 'SQL_LIKE')], stillMissing
+    return run
+
+
+def testCompleteRunIsKept(retry):
+    assert retry([], []) == (True, dict())
+
+
+def testRecoveredTestsSucceed(retry):
+    assert retry([2, 3], [], inFirstResult=False) == (True, dict())
+
+
+@pytest.mark.parametrize('inRetryMissingIDs', [[2, 3], [3]])
+def testOnlyTestsStillMissingFail(retry, inRetryMissingIDs):
+    # The completed tests are kept as the baseline of the Work Unit
+    assert retry([2, 3], inRetryMissingIDs) == (True, {('SQL', 'SQL_LIKE'): inRetryMissingIDs})
+
+
+def testUnitWithoutAnyResultSetFails(retry):
+    assert retry([1, 2, 3, 4], [1, 2, 3, 4]) == (False, {('SQL', 'SQL_LIKE'): [1, 2, 3, 4]})
+
+
+def testUnitTestEnvLimitsTheTimeoutsAsPerTheUnit(monkeypatch, tmp_path):
+    monkeypatch.setattr(Generator, 'm_OutputFolder', str(tmp_path))
+    (tmp_path / Generator.m_EnvsFolder).mkdir()
+
+    def readLimits(inTestEnvFileName):
+        with open(str(tmp_path / Generator.m_EnvsFolder / inTestEnvFileName)) as file:
+            content = file.read()
+        return [int(re.search(f"<{tag}>(\\d+)</{tag}>", content).group(1))
+                for tag in ['timeout', 'maxConsecutiveTimeout', 'maxAccumulatedTimeout']]
+
+    assert readLimits(Generator.ResultSetGenerator.writeUnitTestEnv('Driver=Test', 'SQL', 'SQL_LIKE', 30)) == \
+        [30, 15, 50]
+    assert readLimits(Generator.ResultSetGenerator.writeUnitTestEnv('Driver=Test', 'SQL', 'SQL_LIKE', 30, '',
+                                                                    1000, 0.1)) == [30, 100, 150]
+    assert readLimits(Generator.ResultSetGenerator.writeUnitTestEnv('Driver=Test', 'SQL', 'SQL_LIKE', 120, '_Retry',
+                                                                    3, 1.0)) == [120, 3, 3]
+
+
+@pytest.fixture
+def selectAll(monkeypatch):
+    """
+    `parseResultSets` of a Table `A` whose `SQL_SELECT_ALL` Result-set is `NullsAndEmpty.xml`, along with the count of
+    reads of the Result-set by the fast path
+    """
+    filePath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'ResultSets', 'NullsAndEmpty.xml')
+    monkeypatch.setattr(Generator.ResultSetCatalog, 'update', lambda inTestSuite: None)
+    monkeypatch.setattr(Generator.ResultSetCatalog, 'getEntry', lambda inTestSuite, inTestSet, inTestID:
+                        {'Path': filePath, 'Size': os.path.getsize(filePath)})
+    reads = list()
+    readResultSet = FastResultSetReader.readResultSet
+
+    def countedReadResultSet(*inArgs):
+        reads.append(inArgs[0])
+        return readResultSet(*inArgs)
+    monkeypatch.setattr(FastResultSetReader, 'readResultSet', countedReadResultSet)
+
+    def parse():
+        tableRowCounts, columnSketches = dict(), dict()
+        mdefDiff = Generator.MDEF(inFileContent={Generator.MDEF.m_Tables: [
+            table('A', column('Id'), column('Name', 'SQL_WVARCHAR'))]}, withColumns=True)
+        tableColumnValues = Generator.ResultSetGenerator.parseResultSets(mdefDiff, 1, tableRowCounts, columnSketches)
+        return tableColumnValues, tableRowCounts, columnSketches
+    return parse, reads
+
+
+def testSelectAllIsReadOnce(selectAll):
+    parse, reads = selectAll
+    tableColumnValues, tableRowCounts, columnSketches = parse()
+    assert len(reads) == 1
+    assert sorted(tableColumnValues['A']['Id']) == [1, 2, 3]
+    assert tableRowCounts == {'A': 4}
+    assert (columnSketches['A']['Id'].count, columnSketches['A']['Id'].nullCount) == (4, 1)
+
+
+def testRowsOfTheFastPathAreDiscardedOnFallback(selectAll, monkeypatch):
+    parse, reads = selectAll
+
+    def fallbackAfterTheFirstRow(inFilePath, inMaxRows, inOnRow=None, inOnColumns=None):
+        reads.append(inFilePath)
+        inOnColumns([('Id', 'SQL_INTEGER'), ('Name', 'SQL_WVARCHAR')])
+        inOnRow([(False, '9'), (False, 'Partial')])
+        return None
+    monkeypatch.setattr(FastResultSetReader, 'readResultSet', fallbackAfterTheFirstRow)
+    tableColumnValues, tableRowCounts, columnSketches = parse()
+    assert sorted(tableColumnValues['A']['Id']) == [1, 2, 3]
+    assert (columnSketches['A']['Id'].count, columnSketches['A']['Id'].nullCount) == (4, 1)
@@ -0,0 +1,50 @@
+from RunSelection import RunSelection
+
+m_RequiredTestSuites = {
+    'Integration': {'SQL_SELECT_ALL': 1, 'SQL_PASSDOWN': 100, 'SQL_SP': 200},
+    'Performance': {'PERF_FILTER_PAIRS': 1000}
+}
+
+
+def testFilterTestSuitesUnrestrictedKeepsEverything():
+    assert RunSelection().filterTestSuites(m_RequiredTestSuites) == m_RequiredTestSuites
+
+
+def testFilterTestSuitesKeepsSelectAllForDependentTestSets():
+    selection = RunSelection(inTestSets='sql_passdown')
+    assert selection.filterTestSuites(m_RequiredTestSuites) == {
+        'Integration': {'SQL_PASSDOWN': 100, 'SQL_SELECT_ALL': 1}
+    }
+    assert selection.filterTestSuites(m_RequiredTestSuites, withPrerequisites=False) == {
+        'Integration': {'SQL_PASSDOWN': 100}
+    }
+
+
+def testFilterTestSuitesIndependentTestSetsNeedNoSelectAll():
+    assert RunSelection(inTestSets='SQL_SP').filterTestSuites(m_RequiredTestSuites) == {'Integration': {'SQL_SP': 200}}
+
+
+def testFilterTestSuitesByTestSuiteAndGlob():
+    assert RunSelection(inTestSuites='Performance').filterTestSuites(m_RequiredTestSuites) == {
+        'Performance': {'PERF_FILTER_PAIRS': 1000},
+        'Integration': {'SQL_SELECT_ALL': 1}
+    }
+    assert RunSelection(inTestSuites='Integration', inTestSets='SQL_S*').filterTestSuites(m_RequiredTestSuites) == {
+        'Integration': {'SQL_SELECT_ALL': 1, 'SQL_SP': 200}
+    }
+    assert RunSelection(inTestSets='Unknown').filterTestSuites(m_RequiredTestSuites) == dict()
+
+
+def testFilterTestSuitesOfTablesLeavesStoredProceduresOut():
+    assert RunSelection(inTables='Orders').filterTestSuites(m_RequiredTestSuites) == {
+        'Integration': {'SQL_SELECT_ALL': 1, 'SQL_PASSDOWN': 100},
+        'Performance': {'PERF_FILTER_PAIRS': 1000}
+    }
+
+
+def testIsQuerySelected():
+    selection = RunSelection(inTables='Ord*')
+    assert selection.isQuerySelected("SELECT Name FROM orders WHERE Name LIKE 'A%'")
+    assert selection.isQuerySelected('SELECT * FROM [Orders]')
+    assert not selection.isQuerySelected('SELECT * FROM Items WHERE Id = 1')
+    assert not selection.isQuerySelected('{call Orders_Proc(1)}')
@@ -0,0 +1,59 @@
+import SampleCache
+from Generator import MDEF
+from SampleCache import SampleCache as Cache
+from test_MDEF import column, table
+
+
+def tables(*inTables):
+    return MDEF(inFileContent={MDEF.m_Tables: list(inTables)}, withColumns=True).Tables
+
+
+def sample(inCache: Cache, inTables: list):
+    inCache.put(inTables, {tableRecord.Name: {'Id': [1]} for tableRecord in inTables},
+                {tableRecord.Name: 1 for tableRecord in inTables}, dict())
+
+
+def testSampleExpiresAfterTheTTL(monkeypatch, tmp_path):
+    now = [1000.0]
+    monkeypatch.setattr(SampleCache.time, 'time', lambda: now[0])
+    cache = Cache(str(tmp_path), 'Driver=Test', inTTL=60)
+    sample(cache, tables(table('A', column('Id'))))
+
+    now[0] += 60
+    assert cache.get(tables(table('A', column('Id')))) == {'A': ({'Id': [1]}, 1, None)}
+    now[0] += 1
+    assert cache.get(tables(table('A', column('Id')))) == dict()
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def testSchemaChangeInvalidatesTheSample(tmp_path):
+    cache = Cache(str(tmp_path), 'Driver=Test')
+    sample(cache, tables(table('A', column('Id')), table('B', column('Id'))))
+
+    assert list(cache.get(tables(table('A', column('Id')), table('B', column('Id'), column('Name'))))) == ['A']
+    assert list(cache.get(tables(table('A', column('Id', 'SQL_BIGINT')), table('B', column('Id'))))) == ['B']
+
+
+def testRefreshSamplesEveryTableAgain(tmp_path):
+    sample(Cache(str(tmp_path), 'Driver=Test'), tables(table('A', column('Id'))))
+
+    cache = Cache(str(tmp_path), 'Driver=Test', inRefresh=True)
+    assert cache.get(tables(table('A', column('Id')))) == dict()
+    assert (cache.hits, cache.misses) == (0, 1)
+    # Samples just taken still replace the cached ones
+    cache.put(tables(table('A', column('Id'))), {'A': {'Id': [2]}}, {'A': 2}, dict())
+    assert Cache(str(tmp_path), 'Driver=Test').get(tables(table('A', column('Id')))) == {'A': ({'Id': [2]}, 2, None)}
+
+
+def testSamplesAreKeptPerConnectionString(tmp_path):
+    sample(Cache(str(tmp_path), 'Driver=Test;Server=One'), tables(table('A', column('Id'))))
+
+    assert Cache(str(tmp_path), 'Driver=Test;Server=Two').get(tables(table('A', column('Id')))) == dict()
+    assert list(Cache(str(tmp_path), 'Driver=Test;Server=One').get(tables(table('A', column('Id'))))) == ['A']
+
+
+def testZeroTTLDisablesTheCache(tmp_path):
+    cache = Cache(str(tmp_path), 'Driver=Test', inTTL=0)
+    sample(cache, tables(table('A', column('Id'))))
+    assert cache.get(tables(table('A', column('Id')))) == dict()
+    assert not (tmp_path / SampleCache.m_SampleCache).exists()
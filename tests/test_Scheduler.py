@@ -0,0 +1,52 @@
+from Scheduler import RunHistory, TestScheduler, deriveTimeoutLimits
+
+
+def testPlanOrdersLongestFirstAndBalancesWorkers():
+    predictedSeconds = {('Integration', 'A'): 4.0, ('Integration', 'B'): 10.0, ('Integration', 'C'): 3.0,
+                        ('Integration', 'D'): 5.0}
+    orderedUnits, totalSeconds = TestScheduler.plan(predictedSeconds, 2)
+    assert orderedUnits == [('Integration', 'B'), ('Integration', 'D'), ('Integration', 'A'), ('Integration', 'C')]
+    # B on one Worker, D + A + C on the other
+    assert totalSeconds == 12.0
+    assert TestScheduler.plan(predictedSeconds, 0)[1] == 22.0
+    assert TestScheduler.plan(dict(), 4) == ([], 0.0)
+
+
+def testCoalesceBatchesSmallUnitsOfDistinctTestSets():
+    predictedSeconds = {('Integration', 'A'): 4.0, ('Integration', 'B'): 4.0, ('Performance', 'A'): 4.0,
+                        ('Integration', 'Large'): 60.0}
+    batches = TestScheduler.coalesce(predictedSeconds, 1, 3.0)
+    # Units of a batch never share a Test-set, the large unit is never coalesced
+    assert len(batches) == 1
+    assert sorted(batches[0]) == [('Integration', 'A'), ('Integration', 'B')]
+    assert all(len({unit[1] for unit in batch}) == len(batch) for batch in batches)
+
+
+def testCoalesceNeverExceedsTheParallelRun():
+    predictedSeconds = {('Integration', testSet): 4.0 for testSet in 'ABCD'}
+    # Every unit on a Worker of its own runs in 4s, a batch of two would take 3 + 1 + 1 = 5s
+    assert TestScheduler.coalesce(predictedSeconds, 4, 3.0) == []
+    # With a single Worker the whole run fits one Touchstone run
+    assert [sorted(batch) for batch in TestScheduler.coalesce(predictedSeconds, 1, 3.0)] == \
+        [sorted(predictedSeconds)]
+    assert TestScheduler.coalesce({('Integration', 'A'): 4.0}, 1, 3.0) == []
+
+
+def testDeriveTimeoutLimits():
+    # Defaults while no timeout was observed, never more than the tests of the run
+    assert deriveTimeoutLimits(1000) == (15, 50)
+    assert deriveTimeoutLimits(10, 0.0) == (10, 10)
+    # Timeouts expected as per the observed rate are allowed on top of the defaults
+    assert deriveTimeoutLimits(1000, 0.1) == (100, 150)
+    # Re-run of the timed out tests only, none of them stops the run
+    assert deriveTimeoutLimits(120, 1.0) == (120, 120)
+    assert deriveTimeoutLimits(0, 1.0) == (1, 1)
+
+
+def testTimeoutRateOfTheRecentRuns(tmp_path):
+    runHistory = RunHistory(str(tmp_path))
+    assert runHistory.getTimeoutRate('SQL', 'SQL_LIKE') is None
+    runHistory.recordTimeouts('SQL', 'SQL_LIKE', 100, 10)
+    runHistory.recordTimeouts('SQL', 'SQL_LIKE', 100, 30)
+    runHistory.recordTimeouts('SQL', 'SQL_AND_OR', 100, 100)
+    assert runHistory.getTimeoutRate('SQL', 'SQL_LIKE') == 0.2
@@ -0,0 +1,91 @@
+import os
+
+import pytest
+
+import Generator
+from RunSelection import RunSelection
+
+m_RequiredTestSuites = {'Integration': {'SQL_SELECT_ALL': 1}, 'SQL': {'SQL_LIKE': 100}}
+
+
+class _InputFile:
+    def getRequiredTestSuites(self):
+        return {testSuite: dict(testSets) for testSuite, testSets in m_RequiredTestSuites.items()}
+
+    def getExternalArguments(self):
+        return dict()
+
+    def getConnectionString(self):
+        return 'Driver=Test'
+
+    def getSampleCacheTTL(self):
+        return 0
+
+    def getTestDefinitionsLocation(self):
+        return None
+
+
+@pytest.fixture
+def output(monkeypatch, tmp_path):
+    """Output folder of a previous run of the Tables `Orders` & `Items` having every Result-set"""
+    monkeypatch.setattr(Generator, 'm_OutputFolder', str(tmp_path))
+    monkeypatch.setattr(Generator.TestSetGenerator, 'setupOutputFolder', staticmethod(lambda: True))
+    for testSuite, testSets in m_RequiredTestSuites.items():
+        os.makedirs(str(tmp_path / testSuite / Generator.m_TestSets))
+        os.makedirs(str(tmp_path / testSuite / Generator.m_ResultSets))
+        for testSet, startingID in testSets.items():
+            queries = ['SELECT * FROM Orders', 'SELECT * FROM Items'] if testSet == 'SQL_SELECT_ALL' else \
+                ["SELECT Name FROM Orders WHERE Name LIKE 'A%'", "SELECT Name FROM Items WHERE Name LIKE 'B%'",
+                 "SELECT Id FROM Orders WHERE Id LIKE '1%'"]
+            assert Generator.TestWriter._prepareTestSet(testSuite, testSet, queries, startingID)
+            for testID in range(startingID, startingID + len(queries)):
+                with open(str(tmp_path / testSuite / Generator.m_ResultSets /
+                              Generator.ResultSetGenerator.getResultSetFileName(testSet, testID)), 'w') as file:
+                    file.write('<ResultSet/>')
+    return tmp_path
+
+
+def runSelection(inSelection: RunSelection, monkeypatch):
+    """Runs the Generator over the selection, The tests of `Orders` being generated again with new queries"""
+    generated = dict()
+
+    def generateTestSets(inRequiredTestSuites, inExternalArgs):
+        generated.update(inRequiredTestSuites)
+        return Generator.TestWriter._prepareTestSet('Integration', 'SQL_SELECT_ALL', ['SELECT * FROM Orders'],
+                                                    inRequiredTestSuites['Integration']['SQL_SELECT_ALL']) and \
+            Generator.TestWriter._prepareTestSet('SQL', 'SQL_LIKE', ["SELECT Name FROM Orders WHERE Name LIKE 'C%'"],
+                                                 inRequiredTestSuites['SQL']['SQL_LIKE'])
+    generator = Generator.TestSetGenerator.__new__(Generator.TestSetGenerator)
+    generator.__dict__.update(inputFile=_InputFile(), selection=inSelection, refreshSamples=False, sampleCache=None,
+                              keptTestIDs=dict())
+    monkeypatch.setattr(generator, 'generateTestSets', generateTestSets)
+    assert generator.run()
+    return generated
+
+
+def resultSetFiles(inOutput, inTestSuite):
+    return sorted(os.listdir(str(inOutput / inTestSuite / Generator.m_ResultSets)))
+
+
+def testSelectedTablesReplaceOnlyTheirTests(output, monkeypatch):
+    generated = runSelection(RunSelection(inTables='Ord*'), monkeypatch)
+    # Tests of the selected Tables follow the kept ones
+    assert generated == {'Integration': {'SQL_SELECT_ALL': 3}, 'SQL': {'SQL_LIKE': 102}}
+    assert Generator.ResultSetGenerator.getTests('Integration', 'SQL_SELECT_ALL') == \
+        {2: 'SELECT * FROM Items', 3: 'SELECT * FROM Orders'}
+    assert Generator.ResultSetGenerator.getTests('SQL', 'SQL_LIKE') == \
+        {101: "SELECT Name FROM Items WHERE Name LIKE 'B%'", 102: "SELECT Name FROM Orders WHERE Name LIKE 'C%'"}
+    # Result-sets of the Tables not selected stay as they are
+    assert resultSetFiles(output, 'Integration') == ['SQL_SELECT_ALL-SQL_QUERY-2.xml']
+    assert resultSetFiles(output, 'SQL') == ['SQL_LIKE-SQL_QUERY-101.xml']
+    with open(str(output / 'SQL' / Generator.m_TestSets / 'SQL_LIKE.xml'), encoding='utf-8') as file:
+        content = file.read()
+    assert content.startswith('<TestSet Name="SQL_LIKE"') and content.endswith('\t</Test>\n</TestSet>')
+
+
+def testSelectedTestSetsAreRewrittenWhole(output, monkeypatch):
+    generated = runSelection(RunSelection(inTestSets='SQL_LIKE'), monkeypatch)
+    assert generated == {'Integration': {'SQL_SELECT_ALL': 1}, 'SQL': {'SQL_LIKE': 100}}
+    assert Generator.ResultSetGenerator.getTests('SQL', 'SQL_LIKE') == \
+        {100: "SELECT Name FROM Orders WHERE Name LIKE 'C%'"}
+    assert resultSetFiles(output, 'SQL') == []
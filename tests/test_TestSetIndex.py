@@ -0,0 +1,83 @@
+import os
+
+import pytest
+
+import Generator
+from Generator import m_TestSets
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Output & workspace folders of a Testsuite `SQL` with a Test-set `SQL_LIKE` of two tests in the workspace"""
+    monkeypatch.setattr(Generator, 'm_OutputFolder', str(tmp_path / 'Output'))
+    monkeypatch.setattr(Generator.TestWriter, 'm_CostModel', None)
+    monkeypatch.setattr(Generator.TestWriter, 'm_NextTestIDs', None)
+    os.makedirs(tmp_path / 'Output' / 'SQL' / m_TestSets)
+    os.makedirs(tmp_path / 'Workspace' / 'SQL' / m_TestSets)
+    with open(tmp_path / 'Workspace' / 'SQL' / m_TestSets / 'SQL_LIKE.xml', 'w', encoding='utf-8', newline='') as file:
+        file.write('<TestSet Name="SQL_LIKE">\r\n' +
+                   Generator.TestWriter._formatTest('SELECT a FROM t', 1).replace('\n', '\r\n') +
+                   Generator.TestWriter._formatTest('SELECT b FROM t', 2).replace('\n', '\r\n') +
+                   '</TestSet>\r\n')
+    index = Generator.TestSetIndex(str(tmp_path / 'Workspace'))
+    monkeypatch.setattr(Generator.TestWriter, 'm_TestSetIndex', index)
+    return index
+
+
+def readTests(inIndex: Generator.TestSetIndex, inTestSet: str):
+    with open(inIndex.getTestSetPath('SQL', inTestSet), 'r', encoding='utf-8') as file:
+        return [(int(testID), query) for testID, query in Generator.m_TestRegex.findall(file.read())]
+
+
+def testStartingIDFollowsWorkspace(workspace):
+    assert workspace.assignStartingIDs({'SQL': {'SQL_LIKE': 1, 'SQL_AND_OR': 1}}) == \
+        {'SQL': {'SQL_LIKE': 3, 'SQL_AND_OR': 1}}
+
+
+def testFindNewQueriesSkipsPresentAndRepeated(workspace):
+    queries = ['SELECT  a FROM t', 'SELECT c FROM t', 'SELECT c FROM t']
+    assert workspace.findNewQueries('SQL', 'SQL_LIKE', queries) == ['SELECT c FROM t']
+    assert workspace.skippedTests == 2
+
+
+def testAppendKeepsNewlinesAndClosingTag(workspace):
+    assert Generator.TestWriter._prepareTestSet('SQL', 'SQL_LIKE', ['SELECT c FROM t', 'SELECT a FROM t'], 3)
+    with open(workspace.getTestSetPath('SQL', 'SQL_LIKE'), 'rb') as file:
+        content = file.read()
+    assert content.endswith(b'</TestSet>\r\n')
+    assert b'\n' not in content.replace(b'\r\n', b'')
+    assert readTests(workspace, 'SQL_LIKE') == [(1, 'SELECT a FROM t'), (2, 'SELECT b FROM t'),
+                                                (3, 'SELECT c FROM t')]
+
+
+def testAppendCreatesMissingTestSet(workspace):
+    assert Generator.TestWriter._prepareTestSet('SQL', 'SQL_AND_OR', ['SELECT é FROM t'], 1)
+    assert readTests(workspace, 'SQL_AND_OR') == [(1, 'SELECT é FROM t')]
+
+
+def testSelectAllIsNotAppendedTwice(workspace):
+    queries = ['SELECT * FROM t', 'SELECT * FROM u']
+    for run in range(3):
+        assert Generator.TestWriter._prepareTestSet('SQL', 'SQL_SELECT_ALL', queries, 1)
+        # Output Test-set is positional i.e. a test per Table whatever the workspace
+        with open(os.path.join(Generator.m_OutputFolder, 'SQL', m_TestSets, 'SQL_SELECT_ALL.xml'), 'r',
+                  encoding='utf-8') as file:
+            assert len(Generator.m_TestRegex.findall(file.read())) == 2
+    assert readTests(workspace, 'SQL_SELECT_ALL') == [(1, 'SELECT * FROM t'), (2, 'SELECT * FROM u')]
+    queries.append('SELECT * FROM v')
+    assert Generator.TestWriter._prepareTestSet('SQL', 'SQL_SELECT_ALL', queries, 1)
+    assert readTests(workspace, 'SQL_SELECT_ALL') == [(1, 'SELECT * FROM t'), (2, 'SELECT * FROM u'),
+                                                      (3, 'SELECT * FROM v')]
+
+
+def testChunksAreWrittenInUTF8(workspace, monkeypatch):
+    monkeypatch.setattr(Generator.TestWriter, 'm_NextTestIDs', dict())
+    assert Generator.TestWriter._prepareTestSet('SQL', 'SQL_IN_BETWEEN', ["SELECT a FROM t WHERE a = 'é'"], 1)
+    assert Generator.TestWriter._prepareTestSet('SQL', 'SQL_IN_BETWEEN', ["SELECT a FROM t WHERE a = 'ü'"], 2)
+    testSetPath = os.path.join(Generator.m_OutputFolder, 'SQL', m_TestSets, 'SQL_IN_BETWEEN.xml')
+    with open(testSetPath, 'rb') as file:
+        assert file.read().decode('utf-8').endswith('</TestSet>')
+    assert Generator.ResultSetGenerator.getTests('SQL', 'SQL_IN_BETWEEN') == \
+        {1: "SELECT a FROM t WHERE a = 'é'", 2: "SELECT a FROM t WHERE a = 'ü'"}
+    assert readTests(workspace, 'SQL_IN_BETWEEN') == [(1, "SELECT a FROM t WHERE a = 'é'"),
+                                                      (2, "SELECT a FROM t WHERE a = 'ü'")]
@@ -0,0 +1,100 @@
+import pytest
+
+import Generator
+from Generator import MDEF
+from GenUtility import PerforceUtility
+from Watcher import MDEFWatcher
+from test_MDEF import column, table
+
+m_TableTestSets = {'SQL_SELECT_ALL', 'SQL_PASSDOWN', 'SQL_LIKE', 'PERF_FILTER_PAIRS'}
+
+
+@pytest.fixture
+def watcher():
+    watcher = MDEFWatcher.__new__(MDEFWatcher)
+    watcher.requiredTestSuites = {'Integration': {'SQL_SELECT_ALL': 1},
+                                  'SQL': {'SQL_PASSDOWN': 1, 'SQL_LIKE': 1, 'PERF_FILTER_PAIRS': 1},
+                                  'SP': {'SQL_SP': 1}}
+    return watcher
+
+
+def diff(*inTables):
+    return MDEF(inFileContent={MDEF.m_Tables: list(inTables)}, withColumns=True)
+
+
+def testFirstDiffAffectsEveryTableTestSet(watcher):
+    assert watcher.findAffectedTestSets(None, diff(table('A', column('Id')))) == m_TableTestSets
+
+
+def testUnchangedTables(watcher):
+    assert watcher.findAffectedTestSets(diff(table('A', column('Id'))), diff(table('A', column('Id')))) == set()
+
+
+def testAddedTable(watcher):
+    assert watcher.findAffectedTestSets(diff(table('A', column('Id'))),
+                                        diff(table('A', column('Id')), table('B', column('Id')))) == m_TableTestSets
+
+
+def testChangedColumns(watcher):
+    assert watcher.findAffectedTestSets(diff(table('A', column('Id')), table('B', column('Id'))),
+                                        diff(table('A', column('Id')), table('B', column('Id', 'SQL_BIGINT')))) == \
+        m_TableTestSets - {'SQL_SELECT_ALL'}
+
+
+def testChangedPassdownableColumns(watcher):
+    assert watcher.findAffectedTestSets(diff(table('A', column('Id')), table('B', column('Id'))),
+                                        diff(table('A', column('Id')), table('B', column('Id', inPassdownable=True)))) \
+        == {'SQL_PASSDOWN', 'PERF_FILTER_PAIRS'}
+
+
+class _Discovery:
+    """Records the discovery runs of the Watcher and samples each Table not excluded"""
+
+    def __init__(self):
+        self.runs = list()
+
+    def discoverSamples(self, inMdefDiff, inStartingID, inExclusions, inCachedTables, ioTableColumnValues,
+                        ioTableRowCounts, ioColumnSketches):
+        self.runs.append((inStartingID, inExclusions, set(inCachedTables)))
+        for testID, diffTable in enumerate(inMdefDiff.Tables, inStartingID):
+            if diffTable.Name not in inCachedTables:
+                ioTableColumnValues[diffTable.Name] = {columnName: [testID] for columnName in diffTable.ColumnNames}
+                ioTableRowCounts[diffTable.Name] = 1
+        return True
+
+
+def testSamplingKeepsTheWholeSelectAllTestSet(watcher, monkeypatch, tmp_path):
+    monkeypatch.setattr(Generator, 'm_OutputFolder', str(tmp_path))
+    (tmp_path / 'Integration' / 'TestSets').mkdir(parents=True)
+    watcher.requiredTestSuites['Integration']['SQL_SELECT_ALL'] = 10
+    watcher.testSetGenerator = _Discovery()
+    watcher.sampledColumns, watcher.tableColumnValues = dict(), dict()
+
+    assert watcher.sampleTables(diff(table('A', column('Id')), table('B', column('Id')), table('C', column('Id'))))
+    assert watcher.testSetGenerator.runs[-1] == (10, [], set())
+    # Column added to B only, A & C keep their samples & Result-sets and are excluded from the discovery run
+    assert watcher.sampleTables(diff(table('A', column('Id')), table('B', column('Id'), column('Name')),
+                                     table('C', column('Id'))))
+    assert watcher.testSetGenerator.runs[-1] == \
+        (10, [(10, 10, 'Sample kept warm by the Watcher'), (12, 12, 'Sample kept warm by the Watcher')], {'A', 'C'})
+    assert Generator.ResultSetGenerator.getTests('Integration', 'SQL_SELECT_ALL') == \
+        {10: 'SELECT * FROM A', 11: 'SELECT * FROM B', 12: 'SELECT * FROM C'}
+    assert watcher.tableColumnValues == {'A': {'Id': [10]}, 'B': {'Id': [11], 'Name': [11]}, 'C': {'Id': [12]}}
+    # Nothing left to sample
+    assert watcher.sampleTables(diff(table('A', column('Id')), table('B', column('Id'), column('Name')),
+                                     table('C', column('Id'))))
+    assert len(watcher.testSetGenerator.runs) == 2
+
+
+def testHeadIsReloadedOnlyOnceItMoved(watcher, monkeypatch):
+    headRevisions, loadedRevisions = [3, 3, 4], list()
+    monkeypatch.setattr(PerforceUtility, 'getLatestRevisionNumber',
+                        lambda inFilePath, inMaxAge=None: headRevisions.pop(0))
+    monkeypatch.setattr(PerforceUtility, 'getRevision', lambda inFilePath, inFileRevision=None: inFileRevision)
+    monkeypatch.setattr(MDEF, 'load', lambda inFilePath: loadedRevisions.append(inFilePath) or diff())
+    watcher.inputFile = type('_InputFile', (), {'getMDEFLocation': lambda self: 'MDEF.json'})()
+    watcher.headMdef, watcher.headRevision = None, None
+
+    assert watcher.refreshHead() and watcher.refreshHead() and watcher.refreshHead()
+    assert loadedRevisions == [3, 4]
+    assert watcher.headRevision == 4
@@ -0,0 +1,112 @@
+import json
+import os
+import time
+
+import pytest
+
+import WorkQueue
+from WorkQueue import WorkQueueCoordinator, WorkQueueWorker, m_PendingFolder, m_ClaimedFolder, m_DoneFolder, \
+    m_FailedFolder, m_ResultsFolder
+
+
+class _InputFile:
+    def getCompression(self, inTestSuite: str):
+        return None
+
+
+def writeUnit(inQueueDir: str, inFolder: str, inUnitID: str, **inFields):
+    unit = {'UnitID': inUnitID, 'TestSuite': 'SQL', 'TestSet': 'SQL_LIKE', 'StartID': 1, 'EndID': 2, 'FirstID': 1,
+            'LastID': 2, 'Attempts': 0, 'MaxAttempts': 3}
+    unit.update(inFields)
+    unitPath = os.path.join(inQueueDir, inFolder, inUnitID + '.json')
+    with open(unitPath, 'w') as file:
+        json.dump(unit, file)
+    return unitPath
+
+
+def readUnits(inQueueDir: str, inFolder: str):
+    units = dict()
+    for fileName in os.listdir(os.path.join(inQueueDir, inFolder)):
+        with open(os.path.join(inQueueDir, inFolder, fileName), 'r') as file:
+            units[fileName] = json.load(file)
+    return units
+
+
+@pytest.fixture
+def queueDir(tmp_path, monkeypatch):
+    monkeypatch.setattr(WorkQueue, 'm_PollInterval', 0)
+    for folder in [m_PendingFolder, m_ClaimedFolder, m_DoneFolder, m_FailedFolder, m_ResultsFolder]:
+        os.makedirs(tmp_path / folder)
+    return str(tmp_path)
+
+
+def makeCoordinator(inQueueDir: str, inMaxAttempts: int = 3, inIdleTimeout: int = 60):
+    coordinator = WorkQueueCoordinator.__new__(WorkQueueCoordinator)
+    coordinator.inputFile = _InputFile()
+    coordinator.queueDir = inQueueDir
+    coordinator.heartbeatTimeout = 60
+    coordinator.maxAttempts = inMaxAttempts
+    coordinator.idleTimeout = inIdleTimeout
+    coordinator.outputFolder = inQueueDir
+    return coordinator
+
+
+def age(inUnitPath: str, inSeconds: float):
+    os.utime(inUnitPath, (time.time() - inSeconds, time.time() - inSeconds))
+
+
+def testUnitIsClaimedOnce(queueDir):
+    writeUnit(queueDir, m_PendingFolder, 'SQL-SQL_LIKE-1-2')
+    # Partially written Work Unit of the Coordinator
+    open(os.path.join(queueDir, m_PendingFolder, 'SQL-SQL_AND_OR-1-2.json.42.tmp'), 'w').close()
+    claimedPath = WorkQueueWorker(queueDir, 'A').claimUnit()
+    assert claimedPath == os.path.join(queueDir, m_ClaimedFolder, 'SQL-SQL_LIKE-1-2.json')
+    assert readUnits(queueDir, m_ClaimedFolder)['SQL-SQL_LIKE-1-2.json']['Worker'] == 'A'
+    assert WorkQueueWorker(queueDir, 'B').claimUnit() is None
+
+
+def testDeadUnitsAreRequeuedThenFailed(queueDir):
+    coordinator = makeCoordinator(queueDir, inMaxAttempts=2)
+    age(writeUnit(queueDir, m_ClaimedFolder, 'Dead', Worker='A'), 120)
+    writeUnit(queueDir, m_ClaimedFolder, 'Alive', Worker='B')
+    assert coordinator.requeueDeadUnits() == 1
+    pendingUnits = readUnits(queueDir, m_PendingFolder)
+    assert list(pendingUnits) == ['Dead.json']
+    assert pendingUnits['Dead.json']['Attempts'] == 1 and 'Worker' not in pendingUnits['Dead.json']
+    os.replace(os.path.join(queueDir, m_PendingFolder, 'Dead.json'),
+               os.path.join(queueDir, m_ClaimedFolder, 'Dead.json'))
+    age(os.path.join(queueDir, m_ClaimedFolder, 'Dead.json'), 120)
+    coordinator.requeueDeadUnits()
+    assert list(readUnits(queueDir, m_FailedFolder)) == ['Dead.json']
+    assert sorted(os.listdir(os.path.join(queueDir, m_ClaimedFolder))) == ['Alive.json']
+
+
+@pytest.mark.parametrize('inMaxAttempts, inDestFolder', [(1, m_FailedFolder), (2, m_PendingFolder)])
+def testFailedUnitFollowsItsMaxAttempts(queueDir, monkeypatch, inMaxAttempts, inDestFolder):
+    monkeypatch.setattr(WorkQueueWorker, 'prepareWorkspace', lambda self, inUnit: 1 / 0)
+    unitPath = writeUnit(queueDir, m_ClaimedFolder, 'SQL-SQL_LIKE-1-2', MaxAttempts=inMaxAttempts, Worker='A')
+    assert not WorkQueueWorker(queueDir, 'A').processUnit(unitPath)
+    assert readUnits(queueDir, inDestFolder)['SQL-SQL_LIKE-1-2.json']['Attempts'] == 1
+    assert os.listdir(os.path.join(queueDir, m_ClaimedFolder)) == []
+
+
+def testFailedUnitRequeuedMeanwhileIsNotQueuedTwice(queueDir, monkeypatch):
+    unitPath = writeUnit(queueDir, m_ClaimedFolder, 'SQL-SQL_LIKE-1-2', Worker='A')
+
+    def requeueThenFail(self, inUnit):
+        age(unitPath, 120)
+        makeCoordinator(queueDir).requeueDeadUnits()
+        raise OSError('Connection lost')
+    monkeypatch.setattr(WorkQueueWorker, 'prepareWorkspace', requeueThenFail)
+    assert not WorkQueueWorker(queueDir, 'A').processUnit(unitPath)
+    assert {fileName: unit['Attempts'] for fileName, unit in readUnits(queueDir, m_PendingFolder).items()} == \
+        {'SQL-SQL_LIKE-1-2.json': 1}
+    assert os.listdir(os.path.join(queueDir, m_ClaimedFolder)) == []
+
+
+def testCollectGivesUpWithoutWorkers(queueDir):
+    writeUnit(queueDir, m_PendingFolder, 'SQL-SQL_LIKE-1-2')
+    coordinator = makeCoordinator(queueDir, inIdleTimeout=0)
+    startTime = time.time()
+    assert not coordinator.collect({'SQL-SQL_LIKE-1-2': {'TestSuite': 'SQL'}})
+    assert time.time() - startTime < 5